@@ -0,0 +1,132 @@
+# Importar las bibliotecas necesarias
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import transform_kernel as kernel  # Núcleo de transformaciones con matrices homogéneas
+import precision  # Precisión de los vértices (float64 o float32)
+
+# Cuadros por segundo de la animación
+DEFAULT_FPS = 60
+
+
+def interpolate_matrices(angle=0.0, scale=(1.0, 1.0), translation=(0.0, 0.0), frames=DEFAULT_FPS):
+    """
+    Interpola por separado el ángulo, la escala y la traslación y compone una matriz por cuadro.
+
+    Parámetros:
+    - angle: Ángulo final de rotación en radianes.
+    - scale: Escala final (Sx, Sy); valores negativos producen una reflexión progresiva.
+    - translation: Traslación final (Tx, Ty).
+    - frames: Número de cuadros (el primero es la identidad y el último la transformación completa).
+
+    Retorna:
+    - Pila (frames, 3, 3) de matrices homogéneas.
+    """
+    t = np.linspace(0.0, 1.0, frames)
+    sx, sy = scale
+    tx, ty = translation
+    return kernel.compose(
+        kernel.rotation_matrix(angle * t),
+        kernel.scale_matrix(1 + (sx - 1) * t, 1 + (sy - 1) * t),
+        kernel.translation_matrix(tx * t, ty * t),
+    )
+
+
+def precompute_frames(vertices, matrices, close=True):
+    """
+    Calcula todos los cuadros de la animación en una sola operación vectorizada.
+
+    Parámetros:
+    - vertices: Arreglo (N, 2) de vértices originales.
+    - matrices: Pila (F, 3, 3) de matrices, una por cuadro.
+    - close: Si es True, se repite el primer vértice para cerrar la figura en cada cuadro.
+
+    Retorna:
+    - Arreglo (F, N, 2) (o (F, N + 1, 2) si close es True) con los vértices de cada cuadro,
+      con la precisión del proyecto.
+    """
+    dtype = precision.get_dtype()
+    vertices = np.asarray(vertices, dtype=dtype)
+    matrices = np.asarray(matrices).astype(dtype, copy=False)
+    if close:
+        vertices = kernel.closed(vertices)
+    frames = np.matmul(vertices, matrices[:, :2, :2])
+    frames += matrices[:, None, 2, :2]
+    return frames
+
+
+def frame_limits(frames, margin=1):
+    """
+    Calcula los límites de los ejes que contienen todos los cuadros.
+
+    Parámetros:
+    - frames: Arreglo (F, N, 2) de cuadros.
+    - margin: Margen adicional para la visualización.
+
+    Retorna:
+    - Tupla (min_x, max_x, min_y, max_y).
+    """
+    min_x, min_y = frames.min(axis=(0, 1))
+    max_x, max_y = frames.max(axis=(0, 1))
+    return min_x - margin, max_x + margin, min_y - margin, max_y + margin
+
+
+class Animation:
+    """
+    Reproduce cuadros precalculados sobre la figura persistente de un Renderer usando blitting.
+    """
+
+    def __init__(self, renderer, frames, fps=DEFAULT_FPS, label="Animación", color="black"):
+        """
+        Inicializa la animación.
+
+        Parámetros:
+        - renderer: Renderer cuya figura se usa como lienzo.
+        - frames: Arreglo (F, N, 2) de cuadros (ver precompute_frames).
+        - fps: Cuadros por segundo.
+        - label: Etiqueta de la figura animada.
+        - color: Color del contorno animado.
+        """
+        self.renderer = renderer
+        self.frames = frames
+        self.fps = fps
+        self.label = label
+        self.color = color
+        self.line = None  # Contorno animado
+        self.animation = None  # Objeto FuncAnimation de matplotlib
+
+    def start(self, repeat=True):
+        """
+        Iniciar la reproducción en la figura del Renderer.
+
+        Parámetros:
+        - repeat: Si es True, la animación se repite al terminar.
+        """
+        from matplotlib.animation import FuncAnimation  # Importación diferida: solo al animar
+
+        self.stop()
+        ax = self.renderer.ax
+        first = self.frames[0]
+        self.line = ax.plot(first[:, 0], first[:, 1], color=self.color, label=self.label, animated=True)[0]
+        self.animation = FuncAnimation(
+            self.renderer.fig, self._update, frames=len(self.frames),
+            interval=1000 / self.fps, blit=True, repeat=repeat,
+        )
+
+    def _update(self, index):
+        """
+        Colocar el cuadro index en el contorno animado (solo se redibuja ese artista).
+        """
+        frame = self.frames[index]
+        self.line.set_data(frame[:, 0], frame[:, 1])
+        return (self.line,)
+
+    def stop(self):
+        """
+        Detener la animación y quitar el contorno animado de la figura.
+        """
+        if self.animation is not None:
+            if self.animation.event_source is not None:
+                self.animation.event_source.stop()
+            self.animation = None
+        if self.line is not None:
+            self.line.remove()
+            self.line = None
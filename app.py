@@ -2,12 +2,25 @@
 import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
 import tkinter as tk  # Biblioteca para crear interfaces gráficas
 from tkinter import ttk, filedialog  # Widgets avanzados y diálogos para seleccionar archivos
-import matplotlib.pyplot as plt  # Biblioteca para generar gráficos y visualizaciones
 from datetime import datetime  # Biblioteca para manejar fechas y horas
-
-# Constantes para reflexiones
-HORIZONTAL_REFLECTION = 0  # Reflexión horizontal
-VERTICAL_REFLECTION = 1  # Reflexión vertical
+import shapes  # Generadores de figuras paramétricas
+import core  # Núcleo sin interfaz gráfica
+import vertex_parser  # Lectura de vértices "x,y;x,y"
+import precision  # Precisión de los vértices (float64 o float32)
+from history import TransformHistory  # Historial de transformaciones con deshacer y rehacer
+from result_cache import ResultCache  # Caché LRU de resultados
+from results import ResultSet  # Colección tipada de resultados
+import pipeline  # Cadenas ordenadas de transformaciones con pivote
+from transform_kernel import HORIZONTAL_REFLECTION, VERTICAL_REFLECTION  # Constantes para reflexiones
+from renderer import Renderer  # Dibujante persistente de figuras
+from vertex_editor import VertexEditor  # Selección y arrastre de vértices sobre la gráfica
+from export_pool import ExportPool  # Exportación de imágenes en procesos separados
+from stats_panel import StatsPanel  # Panel con los tiempos medidos
+import profiling  # Medición de tiempos por intervalos
+import animation  # Animación interpolada entre la figura original y la transformada
+
+# Milisegundos de espera tras la última tecla antes de redibujar la gráfica
+UPDATE_DELAY_MS = 250
 
 class TransformationApp:
     """
@@ -23,17 +36,28 @@ class TransformationApp:
         """
         self.root = root
         self.root.title("Transformaciones de Figuras")  # Título de la ventana
-        self.vertices = []  # Lista de vértices de la figura original
-        self.results = {}  # Diccionario para almacenar las transformaciones aplicadas
+        self.vertices = np.empty((0, 2), dtype=precision.get_dtype())  # Arreglo (N, 2) de vértices de la figura original
+        self.results = ResultSet()  # Resultados de las transformaciones aplicadas
+        self.result_cache = ResultCache()  # Resultados ya calculados, por contenido de los vértices y matrices
+        self.history = TransformHistory(cache=self.result_cache)  # Pasos aplicados (solo matrices) para deshacer y rehacer
+        self.parsed = None  # (opción y entradas, vértices) de la última figura leída de las entradas
+        self.renderer = Renderer(fill=False, marker="o")  # Figura reutilizada al graficar y guardar
+        self.export_pool = ExportPool(context="spawn")  # Procesos que guardan las imágenes (se crean al primer guardado)
+        self.animation = None  # Animación en curso
+        self.update_job = None  # Redibujo pendiente (para agrupar varias teclas en uno solo)
+        self.edited = None  # (opción y entradas, vértices) de la figura modificada con el ratón
+        self.stats_panel = None  # Panel de estadísticas abierto
 
         # Crear opciones para las figuras geométricas
         ttk.Label(root, text="Opciones de Figura:").grid(row=0, column=0, pady=5, sticky="w")
         self.option_var = tk.StringVar(value="Cuadrado")  # Variable para controlar la figura seleccionada
-        options = ["Cuadrado", "Triángulo", "Agregar Vértices", "Cargar desde Archivo"]
+        options = ["Cuadrado", "Triángulo", "Círculo", "Polígono Regular", "Estrella", "Agregar Vértices", "Cargar desde Archivo"]
+        options_frame = ttk.Frame(root)  # Contenedor de las opciones (ocupa las filas 1 a 4)
+        options_frame.grid(row=1, column=0, rowspan=4, sticky="w")
         for i, option in enumerate(options):
             ttk.Radiobutton(
-                root, text=option, variable=self.option_var, value=option, command=self.update_ui
-            ).grid(row=i+1, column=0, sticky="w")
+                options_frame, text=option, variable=self.option_var, value=option, command=self.update_ui
+            ).grid(row=i, column=0, sticky="w")
 
         # Contenedor dinámico para las entradas específicas de la figura seleccionada
         self.dynamic_frame = ttk.Frame(root)
@@ -52,6 +76,29 @@ class TransformationApp:
         ttk.Button(root, text="Guardar Gráfica", command=self.save_image).grid(row=14, column=0, pady=5)
         ttk.Label(root, text="* Guarda la gráfica en un archivo PNG.").grid(row=15, column=0, sticky="w")
 
+        ttk.Button(root, text="Animar Transformaciones", command=self.animate_transformations).grid(row=16, column=0, pady=5)
+        ttk.Label(root, text="* Anima el paso de la figura original a la transformada.").grid(row=17, column=0, sticky="w")
+
+        history_frame = ttk.Frame(root)  # Botones del historial
+        history_frame.grid(row=18, column=0, pady=5)
+        ttk.Button(history_frame, text="Deshacer", command=self.undo).grid(row=0, column=0, padx=5)
+        ttk.Button(history_frame, text="Rehacer", command=self.redo).grid(row=0, column=1, padx=5)
+        ttk.Label(root, text="* Recorre los pasos aplicados sin volver a calcularlos.").grid(row=19, column=0, sticky="w")
+
+        # Modo de composición: una cadena ordenada reemplaza a las transformaciones independientes
+        self.pipeline_entry = self.create_input("Cadena (en orden):", 20)
+        self.show_stages = tk.BooleanVar(value=False)  # Mostrar también las etapas intermedias
+        ttk.Checkbutton(root, text="Mostrar etapas intermedias", variable=self.show_stages, command=self.schedule_update).grid(row=21, column=1, sticky="w")
+        ttk.Label(root, text="* Ej.: rotar 45 @ 1,1; escalar 2,2 @ 1,1; reflejar h; trasladar 3,4").grid(row=21, column=0, sticky="w")
+        ttk.Label(root, text="* En la gráfica: arrastre un vértice original para moverlo, clic derecho para borrarlo.").grid(row=22, column=0, columnspan=2, sticky="w")
+
+        ttk.Button(root, text="Estadísticas", command=self.show_stats).grid(row=23, column=0, pady=5)
+        ttk.Label(root, text="* Muestra cuánto tardan la lectura, las transformaciones, la gráfica y el guardado.").grid(row=24, column=0, columnspan=2, sticky="w")
+
+        # Gráfica incrustada en la ventana principal
+        self.renderer.embed(root, figsize=(6, 6)).grid(row=0, column=2, rowspan=25, padx=10, pady=10)
+        self.editor = VertexEditor(self.renderer, self.on_vertices_edited)  # Edición de la figura original con el ratón
+
         # Inicializar la interfaz dinámica
         self.update_ui()
 
@@ -61,15 +108,23 @@ class TransformationApp:
         """
         for widget in self.dynamic_frame.winfo_children():
             widget.destroy()
+        self.inputs = {}
 
         if self.option_var.get() == "Cuadrado":
             self.add_inputs([("x", "0"), ("y", "0"), ("Tamaño", "5")])
         elif self.option_var.get() == "Triángulo":
             self.add_inputs([("x1, y1", "0,0"), ("x2, y2", "5,0"), ("x3, y3", "2.5,5")])
+        elif self.option_var.get() == "Círculo":
+            self.add_inputs([("x", "0"), ("y", "0"), ("Radio", "5"), ("Resolución", "100")])
+        elif self.option_var.get() == "Polígono Regular":
+            self.add_inputs([("x", "0"), ("y", "0"), ("Radio", "5"), ("Lados", "6")])
+        elif self.option_var.get() == "Estrella":
+            self.add_inputs([("x", "0"), ("y", "0"), ("Radio", "5"), ("Puntas", "5")])
         elif self.option_var.get() == "Agregar Vértices":
             self.add_inputs([("Vértices (x, y separados por ;)", "")])
         elif self.option_var.get() == "Cargar desde Archivo":
             ttk.Button(self.dynamic_frame, text="Seleccionar Archivo", command=self.load_file).grid(row=0, column=0)
+        self.schedule_update()
 
     def add_inputs(self, fields):
         """
@@ -84,6 +139,7 @@ class TransformationApp:
             entry = ttk.Entry(self.dynamic_frame)
             entry.insert(0, default)
             entry.grid(row=i, column=1)
+            entry.bind("<KeyRelease>", self.schedule_update)
             self.inputs[label] = entry
 
     def add_transformation_inputs(self):
@@ -110,6 +166,7 @@ class TransformationApp:
         ttk.Label(self.root, text=label).grid(row=row, column=0, sticky="w")
         entry = ttk.Entry(self.root)
         entry.grid(row=row, column=1)
+        entry.bind("<KeyRelease>", self.schedule_update)
         return entry
 
     def load_file(self):
@@ -124,55 +181,231 @@ class TransformationApp:
         """
         Obtener los vértices de la figura según la opción seleccionada.
         """
+        if self.edited is not None and self.edited[0] == self.shape_inputs():
+            self.vertices = self.edited[1]  # Figura modificada con el ratón (las entradas no cambiaron desde entonces)
+            return
+        if self.parsed is not None and self.parsed[0] == self.shape_inputs():
+            self.vertices = self.parsed[1]  # Mismas entradas: no se vuelven a leer (y el arreglo conserva su resumen en la caché)
+            return
         if self.option_var.get() == "Cuadrado":
-            x, y, size = map(float, [self.inputs["x"].get(), self.inputs["y"].get(), self.inputs["Tamaño"].get()])
-            self.vertices = [[x, y], [x + size, y], [x + size, y + size], [x, y + size]]
+            x, y, size = (self.read_number(field) for field in ("x", "y", "Tamaño"))
+            self.vertices = shapes.create_shape("square", (x, y), size)
+        elif self.option_var.get() == "Círculo":
+            x, y, radius = (self.read_number(field) for field in ("x", "y", "Radio"))
+            self.vertices = shapes.create_shape("circle", (x, y), radius, resolution=self.read_number("Resolución", int))
+        elif self.option_var.get() == "Polígono Regular":
+            x, y, radius = (self.read_number(field) for field in ("x", "y", "Radio"))
+            self.vertices = shapes.create_shape("polygon", (x, y), radius, sides=self.read_number("Lados", int))
+        elif self.option_var.get() == "Estrella":
+            x, y, radius = (self.read_number(field) for field in ("x", "y", "Radio"))
+            self.vertices = shapes.create_shape("star", (x, y), radius, points=self.read_number("Puntas", int))
         elif self.option_var.get() == "Triángulo":
-            self.vertices = [list(map(float, pair.split(","))) for pair in (self.inputs[key].get() for key in self.inputs)]
+            self.vertices = vertex_parser.parse_vertices(";".join(entry.get() for entry in self.inputs.values()))
         elif self.option_var.get() == "Agregar Vértices":
-            self.vertices = [list(map(float, pair.split(","))) for pair in self.inputs["Vértices (x, y separados por ;)"].get().split(";")]
+            self.vertices = vertex_parser.parse_vertices(self.inputs["Vértices (x, y separados por ;)"].get())
+        self.parsed = (self.shape_inputs(), self.vertices)
 
-    def apply_transformations(self):
+    def read_number(self, field, kind=float):
         """
-        Aplicar transformaciones seleccionadas a la figura cargada.
+        Leer un número de una entrada de la figura (ValueError con el nombre del campo si no es válido).
+        """
+        return core.parse_number(field, self.inputs[field].get(), kind)
+
+    def shape_inputs(self):
+        """
+        Opción seleccionada y texto de sus entradas (identifica la figura ingresada).
+        """
+        return self.option_var.get(), tuple(entry.get() for entry in self.inputs.values())
+
+    def on_vertices_edited(self, layer, vertices):
+        """
+        Registrar la figura modificada con el ratón y volver a aplicar las transformaciones.
+
+        Parámetros:
+        - layer: Capa editada (solo "original").
+        - vertices: Arreglo (N, 2) con los vértices modificados.
+        """
+        self.edited = (self.shape_inputs(), vertices)
+        self.apply_transformations(verbose=False)
+        if self.results:
+            self.draw_results()
+            self.renderer.show()
+
+    def get_transformation_parameters(self):
+        """
+        Leer los parámetros de transformación ingresados.
+
+        Retorna:
+        - Tupla (ángulo en radianes, escala o None, reflexión o None, traslación o None).
+
+        Lanza:
+        - ValueError: Si alguna entrada no vacía no es válida.
         """
-        self.get_vertices()
-        if not self.vertices:
+        angle = core.parse_angle(self.rotation_entry.get()) or 0.0
+        scale = core.parse_pair("escala", self.scale_entry.get())
+        reflection = core.parse_reflection(self.reflection_entry.get())
+        translation = core.parse_pair("traslación", self.translation_entry.get())
+        return angle, scale, reflection, translation
+
+    def animate_transformations(self):
+        """
+        Animar la transformación compuesta, interpolando por separado ángulo, escala y traslación.
+        """
+        try:
+            with profiling.span("get_vertices"):
+                self.get_vertices()
+        except ValueError as error:  # Incluye VertexParseError y los campos numéricos inválidos
+            print(f"Error en los vértices: {error}")
+            return
+        if not len(self.vertices):
             print("No hay vértices cargados.")
             return
 
-        angle = float(self.rotation_entry.get() or 0) * np.pi / 180
-        scale = list(map(float, self.scale_entry.get().split(","))) if self.scale_entry.get() else None
-        reflection = HORIZONTAL_REFLECTION if self.reflection_entry.get().lower() == "h" else VERTICAL_REFLECTION if self.reflection_entry.get().lower() == "v" else None
-        translation = list(map(float, self.translation_entry.get().split(","))) if self.translation_entry.get() else None
-
-        self.results = {"original": self.vertices}
-        vertices = np.array(self.vertices)
-
-        if angle:
-            rotation_matrix = [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
-            self.results["rotation"] = np.dot(vertices, rotation_matrix).tolist()
-        if scale:
-            scale_matrix = [[scale[0], 0], [0, scale[1]]]
-            self.results["scale"] = np.dot(vertices, scale_matrix).tolist()
-        if reflection is not None:
-            reflection_matrix = [[1, 0], [0, -1]] if reflection == HORIZONTAL_REFLECTION else [[-1, 0], [0, 1]]
-            self.results["reflection"] = np.dot(vertices, reflection_matrix).tolist()
-        if translation:
-            self.results["translation"] = (vertices + translation).tolist()
-
-        # Mostrar los resultados en la terminal
-        for key, value in self.results.items():
-            print(f"{key.capitalize()}: {value}")
+        try:
+            angle, scale, reflection, translation = self.get_transformation_parameters()
+        except ValueError as error:
+            print(f"Error en las transformaciones: {error}")
+            return
+        sx, sy = scale or (1.0, 1.0)
+        # La reflexión se anima como una escala que pasa de 1 a -1 en el eje correspondiente
+        if reflection == HORIZONTAL_REFLECTION:
+            sy = -sy
+        elif reflection == VERTICAL_REFLECTION:
+            sx = -sx
+
+        matrices = animation.interpolate_matrices(angle, (sx, sy), translation or (0.0, 0.0), frames=animation.DEFAULT_FPS)
+        frames = animation.precompute_frames(self.vertices, matrices)
+
+        if self.animation is not None:
+            self.animation.stop()
+        self.renderer.draw([("original", self.vertices, None)], animation.frame_limits(frames))
+        self.animation = animation.Animation(self.renderer, frames)
+        self.animation.start()
+        self.renderer.show()
+
+    def schedule_update(self, event=None):
+        """
+        Programar la actualización de la gráfica; cada tecla reinicia la espera, así una ráfaga
+        de cambios produce un solo redibujo.
+        """
+        if self.update_job is not None:
+            self.root.after_cancel(self.update_job)
+        self.update_job = self.root.after(UPDATE_DELAY_MS, self.live_update)
+
+    def live_update(self):
+        """
+        Recalcular las transformaciones con los valores actuales y redibujar la gráfica incrustada.
+        """
+        self.update_job = None
+        try:
+            self.apply_transformations(verbose=False, record=False)
+        except (ValueError, IndexError, KeyError):
+            return  # Entrada incompleta mientras el usuario escribe
+
+        if self.results:
+            if self.animation is not None:
+                self.animation.stop()
+                self.animation = None
+            self.draw_results()
+            self.renderer.show()
+
+    def apply_transformations(self, verbose=True, record=True):
+        """
+        Aplicar transformaciones seleccionadas a la figura cargada.
+
+        Parámetros:
+        - verbose: Si es True, se muestran los resultados en la terminal.
+        - record: Si es True, se registra el paso en el historial (la vista previa no lo hace).
+        """
+        try:
+            with profiling.span("get_vertices"):
+                self.get_vertices()
+        except ValueError as error:  # Incluye VertexParseError y los campos numéricos inválidos
+            if verbose:
+                print(f"Error en los vértices: {error}")
+            return
+        if not len(self.vertices):
+            if verbose:
+                print("No hay vértices cargados.")
+            return
+
+        chain = self.pipeline_entry.get().strip()
+        if chain:
+            # Modo de composición: toda la cadena en una sola pasada (etapas intermedias solo si se piden)
+            try:
+                stages = pipeline.parse_pipeline(chain)
+            except ValueError as error:
+                if verbose:
+                    print(f"Error en la cadena: {error}")
+                return
+            matrices = stages.result_matrices(intermediate=self.show_stages.get())
+            metadata = {"pipeline": chain}
+        else:
+            try:
+                angle, scale, reflection, translation = self.get_transformation_parameters()
+            except ValueError as error:
+                if verbose:
+                    print(f"Error en las transformaciones: {error}")
+                return
+            matrices = core.transformation_matrices(angle or None, scale, reflection, translation)
+            metadata = {"angle": angle, "scale": scale, "reflection": reflection, "translation": translation}
+
+        if record:
+            self.history.push(self.vertices, matrices, **metadata)
+            self.results = self.history.results()
+        else:
+            self.results = self.result_cache.results(self.vertices, matrices)
+
+        # Mostrar los resultados en la terminal (resumidos si son muchos vértices)
+        if verbose:
+            with profiling.span("print"):
+                print(self.results)
+
+    def undo(self):
+        """
+        Deshacer el último paso aplicado y mostrar el anterior.
+        """
+        if self.history.undo():
+            self.show_history_step()
+        else:
+            print("No hay pasos para deshacer.")
+
+    def redo(self):
+        """
+        Rehacer el siguiente paso deshecho y mostrarlo.
+        """
+        if self.history.redo():
+            self.show_history_step()
+        else:
+            print("No hay pasos para rehacer.")
+
+    def show_history_step(self):
+        """
+        Mostrar el paso actual del historial (sus vértices se calculan solo ahora).
+        """
+        self.results = self.history.results()
+        if self.animation is not None:
+            self.animation.stop()
+            self.animation = None
+        self.draw_results()
+        self.renderer.show()
+        print(f"Paso {self.history.position} de {len(self.history)}: {self.history.metadata()}")
 
     def calculate_limits(self):
         """
         Calcular los límites óptimos para centrar y ajustar la gráfica según las figuras creadas.
         """
-        all_points = np.concatenate([np.array(v) for v in self.results.values()])
-        min_x, min_y = np.min(all_points, axis=0)
-        max_x, max_y = np.max(all_points, axis=0)
-        return min(min_x, min_y) - 1, max(max_x, max_y) + 1
+        return self.results.square_limits()
+
+    def draw_results(self):
+        """
+        Actualizar la figura persistente con los resultados actuales.
+        """
+        with profiling.span("calculate_limits"):
+            min_limit, max_limit = self.calculate_limits()
+        self.renderer.draw_results(self.results, (min_limit, max_limit, min_limit, max_limit))
+        # El índice de selección se reconstruye solo si la figura original cambió (y hasta el siguiente clic)
+        self.editor.set_layer("original", self.results["original"])
 
     def plot_results(self):
         """
@@ -182,18 +415,8 @@ class TransformationApp:
             print("No hay resultados para graficar.")
             return
 
-        fig, ax = plt.subplots(figsize=(8, 8))
-        for name, points in self.results.items():
-            points = np.array(points)
-            points = np.vstack([points, points[0]])  # Cerrar figura
-            ax.plot(points[:, 0], points[:, 1], label=name, marker="o")
-
-        min_limit, max_limit = self.calculate_limits()
-        ax.set_xlim(min_limit, max_limit)
-        ax.set_ylim(min_limit, max_limit)
-        ax.set_aspect("equal")
-        ax.legend()
-        plt.show()
+        self.draw_results()
+        self.renderer.show()
 
     def save_image(self):
         """
@@ -204,19 +427,32 @@ class TransformationApp:
             return
 
         file_name = f"graph_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        fig, ax = plt.subplots(figsize=(8, 8))
-        for name, points in self.results.items():
-            points = np.array(points)
-            points = np.vstack([points, points[0]])  # Cerrar figura
-            ax.plot(points[:, 0], points[:, 1], label=name, marker="o")
-
-        min_limit, max_limit = self.calculate_limits()
-        ax.set_xlim(min_limit, max_limit)
-        ax.set_ylim(min_limit, max_limit)
-        ax.set_aspect("equal")
-        ax.legend()
-        fig.savefig(file_name)
-        print(f"Gráfica guardada como: {file_name}")
+        self.draw_results()
+        # La imagen se dibuja en otro proceso; si nada cambió, se conserva el archivo anterior
+        self.renderer.save_async(self.export_pool, self.root, file_name, self.on_graphic_saved)
+
+    def show_stats(self):
+        """
+        Abrir el panel de estadísticas (o traerlo al frente si ya está abierto).
+        """
+        if self.stats_panel is not None and self.stats_panel.is_open():
+            self.stats_panel.window.lift()
+            return
+        cache = self.result_cache
+        self.stats_panel = StatsPanel(self.root, extra=lambda: f"Caché: {cache.hits} aciertos, {cache.misses} fallos, {len(cache)} resultados")
+
+    def on_graphic_saved(self, file_name, error):
+        """
+        Informar el resultado de un guardado en segundo plano.
+
+        Parámetros:
+        - file_name: Ruta del archivo guardado (None si hubo error).
+        - error: Excepción producida al guardar, o None.
+        """
+        if error is not None:
+            print(f"Error al guardar la gráfica: {error}")
+        else:
+            print(f"Gráfica guardada como: {file_name}")
 
 # Punto de entrada de la aplicación
 if __name__ == "__main__":
@@ -2,8 +2,21 @@
 import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
 import tkinter as tk  # Biblioteca para crear interfaces gráficas
 from tkinter import ttk, filedialog  # Widgets avanzados y diálogos para seleccionar archivos
-import matplotlib.pyplot as plt  # Biblioteca para generar gráficos y visualizaciones
 from datetime import datetime  # Biblioteca para manejar fechas y horas
+import shapes  # Generadores de figuras paramétricas
+import core  # Núcleo sin interfaz gráfica
+import vertex_parser  # Lectura de vértices "x,y;x,y"
+import precision  # Precisión de los vértices (float64 o float32)
+from history import TransformHistory  # Historial de transformaciones con deshacer y rehacer
+from result_cache import ResultCache  # Caché LRU de resultados
+from results import ResultSet  # Colección tipada de resultados
+from renderer import Renderer  # Dibujante persistente de figuras
+from export_pool import ExportPool  # Exportación de imágenes en procesos separados
+from stats_panel import StatsPanel  # Panel con los tiempos medidos
+import profiling  # Medición de tiempos por intervalos
+
+# Milisegundos de espera tras la última tecla antes de redibujar la gráfica
+UPDATE_DELAY_MS = 250
 
 class TransformationApp:
     """
@@ -20,8 +33,15 @@ class TransformationApp:
         self.root = root
         self.root.title("Transformaciones de Figuras")  # Título de la ventana
 
-        self.vertices = []  # Lista de vértices iniciales
-        self.transformed_vertices = {}  # Diccionario para almacenar transformaciones aplicadas
+        self.vertices = np.empty((0, 2), dtype=precision.get_dtype())  # Arreglo (N, 2) de vértices iniciales
+        self.transformed_vertices = ResultSet()  # Resultados de las transformaciones aplicadas
+        self.result_cache = ResultCache()  # Resultados ya calculados, por contenido de los vértices y matrices
+        self.history = TransformHistory(cache=self.result_cache)  # Pasos aplicados (solo matrices) para deshacer y rehacer
+        self.parsed = None  # (opción y entradas, vértices) de la última figura leída de las entradas
+        self.renderer = Renderer()  # Figura reutilizada al graficar y guardar
+        self.export_pool = ExportPool(context="spawn")  # Procesos que guardan las imágenes (se crean al primer guardado)
+        self.update_job = None  # Redibujo pendiente (para agrupar varias teclas en uno solo)
+        self.stats_panel = None  # Panel de estadísticas abierto
 
         # Crear opciones principales de figuras
         ttk.Label(root, text="Opciones de Figura:").grid(row=0, column=0, pady=5, sticky="w")
@@ -49,6 +69,19 @@ class TransformationApp:
         self.transformation_frame.grid(row=9, column=0, pady=10)
         self.add_transformation_inputs()
 
+        # Botones del historial
+        history_frame = ttk.Frame(root)
+        history_frame.grid(row=10, column=0, pady=5)
+        ttk.Button(history_frame, text="Deshacer", command=self.undo).grid(row=0, column=0, padx=5)
+        ttk.Button(history_frame, text="Rehacer", command=self.redo).grid(row=0, column=1, padx=5)
+        ttk.Label(root, text="(Recorre los pasos aplicados sin volver a calcularlos)").grid(row=10, column=1, sticky="w")
+
+        ttk.Button(root, text="Estadísticas", command=self.show_stats).grid(row=11, column=0, pady=5)
+        ttk.Label(root, text="(Muestra cuánto tardan las transformaciones, la gráfica y el guardado)").grid(row=11, column=1, sticky="w")
+
+        # Gráfica incrustada en la ventana principal
+        self.renderer.embed(root, figsize=(6, 6)).grid(row=0, column=2, rowspan=12, padx=10, pady=10)
+
         # Inicializar la interfaz dinámica
         self.update_interface()
 
@@ -67,6 +100,7 @@ class TransformationApp:
             self.add_inputs([("x1, y1", "0,0"), ("x2, y2", "5,0"), ("x3, y3", "2.5,5")])
         elif self.option.get() == "vertex":
             self.add_inputs([("Vértices (x, y separados por ;)", "")])
+        self.schedule_update()
 
     def add_inputs(self, fields):
         """
@@ -81,6 +115,7 @@ class TransformationApp:
             entry = ttk.Entry(self.dynamic_frame)
             entry.insert(0, default)
             entry.grid(row=i, column=1)
+            entry.bind("<KeyRelease>", self.schedule_update)
             self.inputs[label] = entry
 
     def add_transformation_inputs(self):
@@ -93,62 +128,154 @@ class TransformationApp:
             ttk.Label(self.transformation_frame, text=label).grid(row=i, column=0, sticky="w")
             entry = ttk.Entry(self.transformation_frame)
             entry.grid(row=i, column=1)
+            entry.bind("<KeyRelease>", self.schedule_update)
             self.transformations[key] = entry
 
-    def apply_transformations(self):
+    def schedule_update(self, event=None):
+        """
+        Programar la actualización de la gráfica; cada tecla reinicia la espera, así una ráfaga
+        de cambios produce un solo redibujo.
+        """
+        if self.update_job is not None:
+            self.root.after_cancel(self.update_job)
+        self.update_job = self.root.after(UPDATE_DELAY_MS, self.live_update)
+
+    def live_update(self):
+        """
+        Recalcular las transformaciones con los valores actuales y redibujar la gráfica incrustada.
+        """
+        self.update_job = None
+        try:
+            self.apply_transformations(verbose=False, record=False)
+        except (ValueError, IndexError, KeyError):
+            return  # Entrada incompleta mientras el usuario escribe
+
+        if self.transformed_vertices:
+            self.draw_data()
+            self.renderer.show()
+
+    def apply_transformations(self, verbose=True, record=True):
         """
         Aplicar las transformaciones seleccionadas a la figura cargada.
+
+        Parámetros:
+        - verbose: Si es True, se muestran los resultados en la terminal.
+        - record: Si es True, se registra el paso en el historial (la vista previa no lo hace).
         """
-        self.get_vertices()
-        if not self.vertices:
-            print("No hay vértices cargados.")
+        try:
+            with profiling.span("get_vertices"):
+                self.get_vertices()
+        except ValueError as error:  # Incluye VertexParseError y los campos numéricos inválidos
+            if verbose:
+                print(f"Error en los vértices: {error}")
+            return
+        if not len(self.vertices):
+            if verbose:
+                print("No hay vértices cargados.")
             return
 
-        angle = self.get_float(self.transformations["rotation"].get(), radians=True)
-        scale = self.get_float_list(self.transformations["scale"].get())
-        translation = self.get_float_list(self.transformations["translation"].get())
+        try:
+            angle, scale, translation = self.get_transformation_parameters()
+        except ValueError as error:
+            if verbose:
+                print(f"Error en las transformaciones: {error}")
+            return
+        matrices = core.transformation_matrices(angle, scale=scale, translation=translation)
+        if record:
+            self.history.push(self.vertices, matrices, angle=angle, scale=scale, translation=translation)
+            self.transformed_vertices = self.history.results()
+        else:
+            self.transformed_vertices = self.result_cache.results(self.vertices, matrices)
 
-        self.transformed_vertices = {"original": self.vertices}
-        vertices = np.array(self.vertices)
+        # Mostrar transformaciones en la terminal
+        if verbose:
+            with profiling.span("print"):
+                print("Transformaciones aplicadas:")
+                print(self.transformed_vertices)
 
-        if angle is not None:
-            rotation_matrix = [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
-            self.transformed_vertices["rotation"] = np.dot(vertices, rotation_matrix).tolist()
+    def get_transformation_parameters(self):
+        """
+        Leer los parámetros de transformación ingresados.
 
-        if scale and len(scale) == 2:
-            scale_matrix = [[scale[0], 0], [0, scale[1]]]
-            self.transformed_vertices["scale"] = np.dot(vertices, scale_matrix).tolist()
+        Retorna:
+        - Tupla (ángulo en radianes o None, escala o None, traslación o None).
 
-        if translation and len(translation) == 2:
-            translated = vertices + translation
-            self.transformed_vertices["translation"] = translated.tolist()
+        Lanza:
+        - ValueError: Si alguna entrada no vacía no es válida.
+        """
+        angle = core.parse_angle(self.transformations["rotation"].get())
+        scale = core.parse_pair("escala", self.transformations["scale"].get())
+        translation = core.parse_pair("traslación", self.transformations["translation"].get())
+        return angle, scale, translation
 
-        # Mostrar transformaciones en la terminal
-        print("Transformaciones aplicadas:")
-        for key, value in self.transformed_vertices.items():
-            print(f"{key.capitalize()}: {value}")
+    def undo(self):
+        """
+        Deshacer el último paso aplicado y mostrar el anterior.
+        """
+        if self.history.undo():
+            self.show_history_step()
+        else:
+            print("No hay pasos para deshacer.")
+
+    def redo(self):
+        """
+        Rehacer el siguiente paso deshecho y mostrarlo.
+        """
+        if self.history.redo():
+            self.show_history_step()
+        else:
+            print("No hay pasos para rehacer.")
+
+    def show_history_step(self):
+        """
+        Mostrar el paso actual del historial (sus vértices se calculan solo ahora).
+        """
+        self.transformed_vertices = self.history.results()
+        self.draw_data()
+        self.renderer.show()
+        print(f"Paso {self.history.position} de {len(self.history)}: {self.history.metadata()}")
 
     def get_vertices(self):
         """
         Obtener los vértices de la figura según la opción seleccionada.
         """
+        if self.parsed is not None and self.parsed[0] == self.shape_inputs():
+            self.vertices = self.parsed[1]  # Mismas entradas: no se vuelven a leer (y el arreglo conserva su resumen en la caché)
+            return
         if self.option.get() == "square":
-            x, y, size = map(float, [self.inputs["x"].get(), self.inputs["y"].get(), self.inputs["Tamaño"].get()])
-            self.vertices = [[x, y], [x + size, y], [x + size, y + size], [x, y + size]]
+            x, y, size = (self.read_number(field) for field in ("x", "y", "Tamaño"))
+            self.vertices = shapes.create_shape("square", (x, y), size)
         elif self.option.get() == "triangle":
-            self.vertices = [list(map(float, pair.split(","))) for pair in self.inputs.values()]
+            self.vertices = vertex_parser.parse_vertices(";".join(entry.get() for entry in self.inputs.values()))
         elif self.option.get() == "vertex":
-            self.vertices = [list(map(float, pair.split(","))) for pair in self.inputs["Vértices (x, y separados por ;)"].get().split(";")]
+            self.vertices = vertex_parser.parse_vertices(self.inputs["Vértices (x, y separados por ;)"].get())
+        self.parsed = (self.shape_inputs(), self.vertices)
+
+    def read_number(self, field, kind=float):
+        """
+        Leer un número de una entrada de la figura (ValueError con el nombre del campo si no es válido).
+        """
+        return core.parse_number(field, self.inputs[field].get(), kind)
+
+    def shape_inputs(self):
+        """
+        Opción seleccionada y texto de sus entradas (identifica la figura ingresada).
+        """
+        return self.option.get(), tuple(entry.get() for entry in self.inputs.values())
 
     def calculate_limits(self):
         """
         Calcular los límites óptimos para centrar y ajustar la gráfica según las figuras creadas.
         """
-        all_points = np.concatenate([np.array(v) for v in self.transformed_vertices.values()])
-        min_x, min_y = np.min(all_points, axis=0)
-        max_x, max_y = np.max(all_points, axis=0)
-        margin = 1  # Margen adicional para la visualización
-        return min(min_x, min_y) - margin, max(max_x, max_y) + margin
+        return self.transformed_vertices.square_limits()
+
+    def draw_data(self):
+        """
+        Actualizar la figura persistente con las transformaciones actuales.
+        """
+        with profiling.span("calculate_limits"):
+            min_limit, max_limit = self.calculate_limits()
+        self.renderer.draw_results(self.transformed_vertices, (min_limit, max_limit, min_limit, max_limit), label=str.capitalize)
 
     def plot_data(self):
         """
@@ -158,19 +285,8 @@ class TransformationApp:
             print("No hay datos para graficar.")
             return
 
-        fig, ax = plt.subplots(figsize=(8, 8))
-        for key, vertices in self.transformed_vertices.items():
-            vertices = np.array(vertices)
-            vertices = np.vstack([vertices, vertices[0]])  # Cerrar la figura
-            ax.fill(vertices[:, 0], vertices[:, 1], alpha=0.5, label=key.capitalize())
-            ax.plot(vertices[:, 0], vertices[:, 1], linestyle="--", color="black")
-
-        min_limit, max_limit = self.calculate_limits()
-        ax.set_xlim(min_limit, max_limit)
-        ax.set_ylim(min_limit, max_limit)
-        ax.set_aspect("equal")
-        ax.legend()
-        plt.show()
+        self.draw_data()
+        self.renderer.show()
 
     def save_graphic(self):
         """
@@ -181,52 +297,32 @@ class TransformationApp:
             return
 
         file_name = f"graph_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        fig, ax = plt.subplots(figsize=(8, 8))
-        for key, vertices in self.transformed_vertices.items():
-            vertices = np.array(vertices)
-            vertices = np.vstack([vertices, vertices[0]])
-            ax.fill(vertices[:, 0], vertices[:, 1], alpha=0.5, label=key.capitalize())
-            ax.plot(vertices[:, 0], vertices[:, 1], linestyle="--", color="black")
-
-        min_limit, max_limit = self.calculate_limits()
-        ax.set_xlim(min_limit, max_limit)
-        ax.set_ylim(min_limit, max_limit)
-        ax.set_aspect("equal")
-        ax.legend()
-        fig.savefig(file_name)
-        print(f"Gráfica guardada como: {file_name}")
+        self.draw_data()
+        # La imagen se dibuja en otro proceso; si nada cambió, se conserva el archivo anterior
+        self.renderer.save_async(self.export_pool, self.root, file_name, self.on_graphic_saved)
 
-    def get_float(self, value, radians=False):
+    def show_stats(self):
         """
-        Convierte un valor de cadena a flotante.
-
-        Parámetros:
-        - value: Cadena a convertir.
-        - radians: Convertir a radianes si es True.
-
-        Retorna:
-        - Flotante o None si la conversión falla.
+        Abrir el panel de estadísticas (o traerlo al frente si ya está abierto).
         """
-        try:
-            value = float(value)
-            return np.radians(value) if radians else value
-        except ValueError:
-            return None
+        if self.stats_panel is not None and self.stats_panel.is_open():
+            self.stats_panel.window.lift()
+            return
+        cache = self.result_cache
+        self.stats_panel = StatsPanel(self.root, extra=lambda: f"Caché: {cache.hits} aciertos, {cache.misses} fallos, {len(cache)} resultados")
 
-    def get_float_list(self, value):
+    def on_graphic_saved(self, file_name, error):
         """
-        Convierte una cadena separada por comas a una lista de flotantes.
+        Informar el resultado de un guardado en segundo plano.
 
         Parámetros:
-        - value: Cadena de texto a convertir.
-
-        Retorna:
-        - Lista de números flotantes o lista vacía si falla.
+        - file_name: Ruta del archivo guardado (None si hubo error).
+        - error: Excepción producida al guardar, o None.
         """
-        try:
-            return [float(x) for x in value.split(",")]
-        except ValueError:
-            return []
+        if error is not None:
+            print(f"Error al guardar la gráfica: {error}")
+        else:
+            print(f"Gráfica guardada como: {file_name}")
 
 # Punto de entrada de la aplicación
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+# Importar las bibliotecas necesarias
+import argparse  # Para leer los argumentos de la línea de comandos
+import glob  # Para expandir patrones de archivos
+import os  # Para manejar rutas y número de procesadores
+import time  # Para medir el rendimiento
+from concurrent.futures import ProcessPoolExecutor  # Para repartir los trabajos entre procesos
+import job_io  # Lectura y escritura de archivos de trabajo
+import export_pool  # Dibujo de figuras con el motor Agg
+import vertex_file  # Formato binario de vértices mapeable en memoria
+import vertex_parser  # Lectura de vértices en texto o CSV
+import precision  # Precisión de los vértices (float64 o float32)
+import parallel  # Transformación por bloques en varios hilos para arreglos grandes
+import profiling  # Medición de tiempos por intervalos
+from results import ResultSet  # Colección tipada de resultados
+
+# Procesa directorios o patrones de archivos JSON de trabajo sin interfaz gráfica.
+# Ejemplo: python batch_runner.py trabajos/ --output resultados --png --workers 8
+
+# Patrones de los archivos de trabajo buscados en los directorios (JSON, binarios, texto y CSV)
+JOB_PATTERNS = ["*.json", f"*{vertex_file.EXTENSION}", *(f"*{extension}" for extension in vertex_parser.TEXT_EXTENSIONS)]
+
+
+def find_jobs(paths):
+    """
+    Expande directorios y patrones glob a una lista ordenada de archivos de trabajo (JSON,
+    .vtx, .txt o .csv; los de texto solo tienen vértices y se guardan sin transformaciones).
+
+    Parámetros:
+    - paths: Lista de directorios, archivos o patrones glob.
+
+    Retorna:
+    - Lista de rutas de archivos de trabajo.
+    """
+    jobs = []
+    for path in paths:
+        if os.path.isdir(path):
+            for pattern in JOB_PATTERNS:
+                jobs.extend(glob.glob(os.path.join(path, pattern)))
+        else:
+            jobs.extend(glob.glob(path))
+    return sorted(set(jobs))
+
+
+def job_root(jobs):
+    """
+    Directorio común de los archivos de trabajo (los nombres de salida son relativos a él).
+    """
+    return os.path.commonpath([os.path.dirname(os.path.abspath(job)) for job in jobs]) if jobs else os.getcwd()
+
+
+def output_base(job_path, output_dir, root=None):
+    """
+    Prefijo de los archivos de salida de un trabajo: su ruta relativa al directorio común de
+    las entradas, con la extensión incluida ("dir1/a.json" -> "<salida>/dir1/a.json"), así
+    a.json y a.vtx, o dir1/a.json y dir2/a.json, no escriben en los mismos archivos.
+
+    Parámetros:
+    - job_path: Ruta del archivo de trabajo.
+    - output_dir: Directorio donde se escriben los resultados.
+    - root: Directorio común de las entradas (por defecto, el del propio trabajo).
+    """
+    job_path = os.path.abspath(job_path)
+    root = root or os.path.dirname(job_path)
+    return os.path.join(output_dir, os.path.relpath(job_path, root))
+
+
+def render_png(result_dict, file_name):
+    """
+    Dibuja los resultados con el motor Agg (sin servidor gráfico) y los guarda como PNG.
+
+    Parámetros:
+    - result_dict: ResultSet con los resultados de las transformaciones.
+    - file_name: Ruta del archivo PNG.
+    """
+    shapes = result_dict.shapes(label=str.capitalize)
+    export_pool.render_spec({"file_name": file_name, "shapes": shapes, "limits": result_dict.limits()})
+
+
+def process_job(job_path, output_dir, output_format="json", png=False, root=None):
+    """
+    Procesa un archivo de trabajo: carga, transforma y guarda los resultados. Nunca se
+    escribe sobre el archivo de entrada (el trabajo termina con un error).
+
+    Parámetros:
+    - job_path: Ruta del archivo JSON de trabajo.
+    - output_dir: Directorio donde se escriben los resultados.
+    - output_format: "json", "npz", "npy" o "vtx" (por bloques, un archivo por resultado) para los vértices transformados.
+    - png: Si es True, también se guarda la gráfica como PNG.
+    - root: Directorio común de las entradas (ver output_base).
+
+    Retorna:
+    - Tupla (ruta, número de vértices, mensaje de error o None).
+    """
+    try:
+        with profiling.span("process_job", job=job_path):
+            base_name = output_base(job_path, output_dir, root)
+            os.makedirs(os.path.dirname(base_name), exist_ok=True)
+            job_io.check_outputs(job_path, [f"{base_name}.{output_format}", f"{base_name}.png"])
+            if output_format in ("npy", "vtx"):
+                # Transformación por bloques con memoria acotada; la gráfica lee los resultados mapeados
+                paths = job_io.write_transformed(job_path, base_name, extension=f".{output_format}")
+                result_dict = ResultSet()
+                for key, path in paths.items():
+                    result_dict.add(key, job_io.open_result(path), job_io.COLORS[key])
+            else:
+                result_dict, _ = job_io.load_from_file(job_path)
+                job_io.save_results(result_dict, f"{base_name}.{output_format}")
+            if png:
+                render_png(result_dict, f"{base_name}.png")
+        return job_path, sum(len(vertices) for vertices in result_dict.values()), None
+    except Exception as e:
+        return job_path, 0, str(e)
+    finally:
+        # Los procesos del grupo (fork) terminan sin ejecutar atexit: la traza se escribe tras cada trabajo
+        profiling.flush()
+
+
+def _init_worker(dtype):
+    """
+    Prepara cada proceso: fija la precisión (con "spawn" no se hereda la del proceso principal),
+    usa un solo hilo, porque los procesos ya ocupan todos los procesadores, y empieza su propia
+    traza (con "fork" se heredan los eventos y la ruta del proceso principal).
+    """
+    precision.set_precision(dtype)
+    parallel.configure(workers=1)
+    profiling.reset_process()
+
+
+def _process_job_args(args):
+    """
+    Adaptador para usar process_job con Executor.map.
+    """
+    return process_job(*args)
+
+
+def run(jobs, output_dir, output_format="json", png=False, workers=None, chunksize=None, dtype=None):
+    """
+    Reparte los trabajos entre un grupo de procesos y devuelve un resumen de rendimiento.
+
+    Parámetros:
+    - jobs: Lista de rutas de archivos de trabajo.
+    - output_dir: Directorio donde se escriben los resultados.
+    - output_format: "json", "npz", "npy" o "vtx" para los vértices transformados.
+    - png: Si es True, también se guardan las gráficas como PNG.
+    - workers: Número de procesos (por defecto, uno por procesador).
+    - chunksize: Trabajos enviados a cada proceso por lote (por defecto, automático).
+    - dtype: Precisión de los vértices en los procesos ("float64" o "float32"; por defecto, la actual).
+
+    Retorna:
+    - Diccionario con el resumen (trabajos, errores, vértices, tiempo y tasas).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    chunksize = chunksize or max(1, len(jobs) // (workers * 4))
+
+    start = time.perf_counter()
+    processed, vertices, errors = 0, 0, []
+    initargs = (str(dtype or precision.get_dtype()),)
+    root = job_root(jobs)
+    with profiling.span("run", jobs=len(jobs), workers=workers), ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        tasks = ((job, output_dir, output_format, png, root) for job in jobs)
+        for job_path, count, error in executor.map(_process_job_args, tasks, chunksize=chunksize):
+            processed += 1
+            vertices += count
+            if error:
+                errors.append((job_path, error))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "jobs": processed,
+        "errors": errors,
+        "vertices": vertices,
+        "seconds": elapsed,
+        "jobs_per_second": processed / elapsed if elapsed else 0.0,
+        "vertices_per_second": vertices / elapsed if elapsed else 0.0,
+    }
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+
+    Parámetros:
+    - argv: Lista de argumentos (por defecto, los de sys.argv).
+    """
+    parser = argparse.ArgumentParser(description="Procesa archivos de trabajo (JSON, .vtx, .txt o .csv) sin interfaz gráfica.")
+    parser.add_argument("paths", nargs="+", help="Directorios, archivos o patrones glob de trabajos (JSON, .vtx, .txt o .csv)")
+    parser.add_argument("-o", "--output", default="resultados", help="Directorio de salida")
+    parser.add_argument("-f", "--format", choices=["json", "npz", "npy", "vtx"], default="json", help="Formato de los vértices transformados")
+    parser.add_argument("--png", action="store_true", help="Guardar también la gráfica de cada trabajo")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Número de procesos")
+    parser.add_argument("--chunksize", type=int, default=None, help="Trabajos por lote enviado a cada proceso")
+    parser.add_argument("--precision", choices=list(precision.PRECISIONS), default=None, help="Precisión de los vértices (por defecto, la de TRANSFORM_PRECISION o float64)")
+    args = parser.parse_args(argv)
+
+    jobs = find_jobs(args.paths)
+    if not jobs:
+        print("No se encontraron archivos de trabajo.")
+        return 1
+
+    summary = run(jobs, args.output, args.format, args.png, args.workers, args.chunksize, args.precision)
+    for job_path, error in summary["errors"]:
+        print(f"Error en {job_path}: {error}")
+    print(f"Trabajos procesados: {summary['jobs']} ({len(summary['errors'])} con errores)")
+    print(f"Vértices transformados: {summary['vertices']}")
+    print(f"Tiempo total: {summary['seconds']:.2f} s")
+    print(f"Rendimiento: {summary['jobs_per_second']:.1f} trabajos/s, {summary['vertices_per_second']:.0f} vértices/s")
+    return 1 if summary["errors"] else 0
+
+
+# Punto de entrada de la aplicación
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+# Importar las bibliotecas necesarias
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import transform_kernel as kernel  # Núcleo de transformaciones con matrices homogéneas
+import precision  # Precisión de los vértices (float64 o float32)
+import parallel  # Transformación por bloques en varios hilos para arreglos grandes
+
+# Formato empaquetado: todas las figuras comparten un único arreglo de coordenadas (M, 2)
+# y un arreglo de desplazamientos (S + 1,) donde la figura i ocupa coords[offsets[i]:offsets[i + 1]].
+
+
+def pack_shapes(shapes):
+    """
+    Empaqueta una colección de figuras de distinto tamaño en un solo búfer.
+
+    Parámetros:
+    - shapes: Iterable de arreglos (Ni, 2) de vértices.
+
+    Retorna:
+    - coords: Arreglo (M, 2) con todos los vértices concatenados.
+    - offsets: Arreglo (S + 1,) con el inicio de cada figura y el total al final.
+    """
+    shapes = [precision.as_vertices(shape) for shape in shapes]
+    offsets = np.zeros(len(shapes) + 1, dtype=np.int64)
+    np.cumsum([len(shape) for shape in shapes], out=offsets[1:])
+    coords = np.concatenate(shapes) if shapes else np.empty((0, 2), dtype=precision.get_dtype())
+    return coords, offsets
+
+
+def unpack_shapes(coords, offsets):
+    """
+    Separa un búfer empaquetado en una lista de figuras (vistas, sin copiar).
+
+    Parámetros:
+    - coords: Arreglo (M, 2) de vértices.
+    - offsets: Arreglo (S + 1,) de desplazamientos.
+
+    Retorna:
+    - Lista de arreglos (Ni, 2), uno por figura.
+    """
+    return np.split(coords, offsets[1:-1])
+
+
+def check_offsets(coords, offsets):
+    """
+    Verifica que los desplazamientos describan correctamente el búfer de coordenadas.
+
+    Parámetros:
+    - coords: Arreglo (M, 2) de vértices.
+    - offsets: Arreglo (S + 1,) de desplazamientos.
+    """
+    offsets = np.asarray(offsets)
+    if offsets.ndim != 1 or len(offsets) < 1 or offsets[0] != 0 or offsets[-1] != len(coords):
+        raise ValueError("Los desplazamientos deben iniciar en 0 y terminar en el número de vértices.")
+    if np.any(np.diff(offsets) < 0):
+        raise ValueError("Los desplazamientos deben ser no decrecientes.")
+
+
+def shape_index(offsets):
+    """
+    Calcula a qué figura pertenece cada vértice del búfer.
+
+    Parámetros:
+    - offsets: Arreglo (S + 1,) de desplazamientos.
+
+    Retorna:
+    - Arreglo (M,) con el índice de figura de cada vértice.
+    """
+    return np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+
+
+def apply_matrix_packed(coords, offsets, matrix):
+    """
+    Aplica una matriz compartida o una matriz por figura a todo el búfer.
+
+    Con una matriz por figura, cada tramo del búfer se transforma con su matriz directamente
+    sobre el resultado (sin armar una matriz por vértice).
+
+    Parámetros:
+    - coords: Arreglo (M, 2) de vértices empaquetados.
+    - offsets: Arreglo (S + 1,) de desplazamientos.
+    - matrix: Matriz 3x3 compartida o pila (S, 3, 3) con una matriz por figura.
+
+    Retorna:
+    - Arreglo (M, 2) transformado, con los mismos desplazamientos.
+    """
+    coords = np.asarray(coords, dtype=precision.get_dtype())
+    check_offsets(coords, offsets)
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim == 2:
+        return parallel.apply_matrix(coords, matrix)
+    matrix = matrix.astype(coords.dtype, copy=False)
+    if matrix.shape != (len(offsets) - 1, 3, 3):
+        raise ValueError("Se esperaba una matriz 3x3 o una pila (S, 3, 3) con una matriz por figura.")
+
+    result = kernel.empty_vertices(len(coords), coords.dtype)
+    for start, end, shape_matrix in zip(offsets[:-1], offsets[1:], matrix):
+        if end > start:
+            kernel.apply_matrix(coords[start:end], shape_matrix, out=result[start:end])
+    return result
+
+
+def transform_packed(coords, offsets, *operations):
+    """
+    Aplica una cadena de operaciones a todas las figuras empaquetadas.
+
+    Los parámetros de cada operación pueden ser escalares (compartidos por todas las figuras)
+    o arreglos de longitud S (uno por figura), por ejemplo ("rotation", angulos).
+
+    Parámetros:
+    - coords: Arreglo (M, 2) de vértices empaquetados.
+    - offsets: Arreglo (S + 1,) de desplazamientos.
+    - operations: Tuplas (nombre, parámetros...) en el orden en que se aplican.
+
+    Retorna:
+    - coords: Arreglo (M, 2) transformado.
+    - offsets: Los mismos desplazamientos de entrada.
+    """
+    matrix = kernel.build_matrix(operations)
+    if matrix.ndim == 3 and len(matrix) == 1:
+        matrix = matrix[0]
+    return apply_matrix_packed(coords, offsets, matrix), offsets
@@ -0,0 +1,354 @@
+# Importar las bibliotecas necesarias
+import argparse  # Para leer los argumentos de la línea de comandos
+import json  # Para guardar y comparar los resultados
+import os  # Para manejar archivos temporales
+import platform  # Para registrar la máquina donde se midió
+import subprocess  # Para medir la importación en un intérprete limpio
+import sys  # Para conocer el intérprete actual
+import tempfile  # Para crear los archivos de prueba
+import time  # Para medir tiempos
+import tracemalloc  # Para medir el pico de memoria
+import matplotlib  # Biblioteca de gráficos (se fuerza el motor Agg, sin interfaz)
+
+matplotlib.use("Agg")
+
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import transform_kernel as kernel  # Núcleo de transformaciones con matrices homogéneas
+import job_io  # Lectura y escritura de archivos de trabajo
+import precision  # Precisión de los vértices (float64 o float32)
+import parallel  # Transformación por bloques en varios hilos para arreglos grandes
+import profiling  # Medición de tiempos por intervalos
+from renderer import Renderer  # Dibujante persistente de figuras
+
+# Mide el rendimiento de las rutas críticas sin abrir ventanas:
+# python benchmark.py --output resultados.json --baseline base.json --threshold 0.2
+
+# Tamaños por defecto (número de vértices)
+DEFAULT_SIZES = [10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+# Módulos sin interfaz cuya importación se mide en un intérprete limpio
+IMPORT_MODULES = ["core", "batch_runner"]
+
+# Programa que importa un módulo y reporta el tiempo y si se cargó alguna biblioteca gráfica
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+gui = sorted(name for name in sys.modules if name.split(".")[0] in ("tkinter", "matplotlib"))
+print(json.dumps({{"seconds": seconds, "gui_modules": gui}}))
+"""
+
+# Intervalos vacíos usados para medir el costo de la instrumentación
+SPAN_CALLS = 10 ** 5
+
+# Operaciones medidas individualmente y la cadena compuesta
+OPERATIONS = {
+    "rotation": [("rotation", np.radians(30))],
+    "scale": [("scale", 2.0, 0.5)],
+    "reflection": [("reflection", kernel.HORIZONTAL_REFLECTION)],
+    "translation": [("translation", 3.0, -4.0)],
+    "chain": [("rotation", np.radians(30)), ("scale", 2.0, 0.5), ("reflection", kernel.HORIZONTAL_REFLECTION), ("translation", 3.0, -4.0)],
+}
+
+
+def measure(function, repeat):
+    """
+    Ejecuta una función varias veces y registra el mejor tiempo y el pico de memoria.
+
+    Parámetros:
+    - function: Función sin argumentos a medir.
+    - repeat: Número de repeticiones (se conserva el mejor tiempo).
+
+    Retorna:
+    - Diccionario con "seconds" y "peak_bytes".
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    # El pico de memoria se mide en una ejecución aparte para no afectar el tiempo
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def make_vertices(count, seed=0):
+    """
+    Genera un contorno de prueba con count vértices.
+    """
+    angles = np.linspace(0, 2 * np.pi, count, endpoint=False)
+    noise = np.random.default_rng(seed).uniform(0.95, 1.05, count)
+    return np.column_stack([10 * noise * np.cos(angles), 10 * noise * np.sin(angles)])
+
+
+def bench_transforms(sizes, repeat):
+    """
+    Mide el rendimiento de cada transformación y de la cadena compuesta.
+    """
+    results = {}
+    for count in sizes:
+        vertices = make_vertices(count)
+        for name, operations in OPERATIONS.items():
+            result = measure(lambda: kernel.transform(vertices, *operations), repeat)
+            result["vertices_per_second"] = count / result["seconds"] if result["seconds"] else 0.0
+            results[f"transform.{name}.n={count}"] = result
+
+        # La misma cadena escribiendo en un búfer reservado una vez y sobre los propios vértices
+        buffer = kernel.empty_vertices(count, vertices.dtype)
+        results[f"transform.chain_out.n={count}"] = measure(lambda: kernel.transform(vertices, *OPERATIONS["chain"], out=buffer), repeat)
+        results[f"transform.chain_in_place.n={count}"] = measure(lambda: kernel.transform(buffer, *OPERATIONS["chain"], out=buffer), repeat)
+    return results
+
+
+def bench_precision(sizes, repeat):
+    """
+    Compara float64 y float32 en la cadena compuesta: tiempo, memoria y error respecto a float64.
+    """
+    results = {}
+    for count in sizes:
+        with precision.using("float64"):
+            reference = kernel.transform(make_vertices(count), *OPERATIONS["chain"])
+        for name in precision.PRECISIONS:
+            with precision.using(name) as dtype:
+                vertices = make_vertices(count).astype(dtype)
+                result = measure(lambda: kernel.transform(vertices, *OPERATIONS["chain"]), repeat)
+                transformed = kernel.transform(vertices, *OPERATIONS["chain"])
+            error = float(np.max(np.abs(transformed - reference)))
+            result["vertex_bytes"] = transformed.nbytes
+            result["max_error"] = error
+            result["max_relative_error"] = error / float(np.max(np.abs(reference)))
+            results[f"precision.{name}.n={count}"] = result
+    return results
+
+
+def bench_parallel(sizes, repeat, workers, chunk_rows):
+    """
+    Mide la cadena compuesta con el motor por bloques para varios números de hilos y su
+    aceleración respecto a un solo hilo (solo tamaños que superan el umbral del motor).
+    """
+    results = {}
+    for count in sizes:
+        if count < parallel.PARALLEL_THRESHOLD:
+            continue
+        vertices = make_vertices(count)
+        buffer = kernel.empty_vertices(count, vertices.dtype)
+        single = None
+        for threads in workers:
+            engine = parallel.ChunkedEngine(threads, chunk_rows)
+            result = measure(lambda: engine.transform(vertices, *OPERATIONS["chain"], out=buffer), repeat)
+            engine.close()
+            single = single or result["seconds"]
+            result["speedup"] = single / result["seconds"] if result["seconds"] else 0.0
+            results[f"parallel.threads={threads}.n={count}"] = result
+    return results
+
+
+def bench_load(sizes, repeat, directory):
+    """
+    Mide el tiempo de carga de archivos JSON de trabajo según su tamaño.
+    """
+    results = {}
+    for count in sizes:
+        path = os.path.join(directory, f"job_{count}.json")
+        with open(path, "w") as file:
+            json.dump({"points": make_vertices(count).round(6).tolist(), "rotation": {"angle": 30}, "scale": {"value": [2, 1]}}, file)
+        result = measure(lambda: job_io.load_from_file(path), repeat)
+        result["file_bytes"] = os.path.getsize(path)
+        result["bytes_per_second"] = result["file_bytes"] / result["seconds"] if result["seconds"] else 0.0
+        results[f"load.json.n={count}"] = result
+        os.remove(path)
+    return results
+
+
+def bench_render(sizes, repeat, directory):
+    """
+    Mide la latencia de dibujo y de guardado PNG según el número de vértices.
+    """
+    results = {}
+    path = os.path.join(directory, "graph.png")
+    for count in sizes:
+        vertices = make_vertices(count)
+        transformed = kernel.transform(vertices, *OPERATIONS["chain"])
+        shapes = [("Original", vertices, "#1A0014"), ("Chain", transformed, "#FF5733")]
+        limits = (-30, 30, -30, 30)
+
+        def plot():
+            # Un dibujante nuevo por medición: se mide el dibujo completo, no la caché
+            renderer = Renderer(interactive=False)
+            renderer.draw(shapes, limits)
+            renderer.fig.canvas.draw()
+
+        renderer = Renderer(interactive=False)
+        renderer.draw(shapes, limits)
+        results[f"render.plot.n={count}"] = measure(plot, repeat)
+        results[f"render.save.n={count}"] = measure(lambda: renderer.save(path, reuse=False), repeat)
+    return results
+
+
+def bench_profiling(repeat):
+    """
+    Mide el costo de un intervalo de profiling.span con la medición desactivada y activada.
+    """
+    def spans():
+        for _ in range(SPAN_CALLS):
+            with profiling.span("benchmark"):
+                pass
+
+    results = {}
+    was_enabled = profiling.is_enabled()
+    for state, switch in (("disabled", profiling.disable), ("enabled", profiling.enable)):
+        switch()
+        result = measure(spans, repeat)
+        result["per_span_ns"] = result["seconds"] / SPAN_CALLS * 1e9
+        results[f"profiling.{state}"] = result
+    if not was_enabled:
+        profiling.disable()
+    return results
+
+
+def bench_import(modules, repeat):
+    """
+    Mide el tiempo de importación de los módulos sin interfaz, cada vez en un intérprete nuevo.
+    """
+    results = {}
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for module in modules:
+        runs = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)],
+                cwd=directory, capture_output=True, text=True, check=True,
+            ).stdout
+            runs.append(json.loads(output))
+        best = min(runs, key=lambda run: run["seconds"])
+        results[f"import.{module}"] = {"seconds": best["seconds"], "peak_bytes": 0, "gui_modules": best["gui_modules"]}
+    return results
+
+
+def check_imports(results, budget):
+    """
+    Verifica que los módulos sin interfaz no carguen bibliotecas gráficas y respeten el presupuesto.
+
+    Parámetros:
+    - results: Resultados de bench_import.
+    - budget: Tiempo máximo de importación en segundos.
+
+    Retorna:
+    - Lista de mensajes con los problemas encontrados.
+    """
+    problems = []
+    for name, result in results.items():
+        if not name.startswith("import."):
+            continue
+        if result["gui_modules"]:
+            problems.append(f"{name} carga bibliotecas gráficas: {', '.join(result['gui_modules'][:3])}")
+        if result["seconds"] > budget:
+            problems.append(f"{name} tarda {result['seconds'] * 1000:.1f} ms (presupuesto {budget * 1000:.0f} ms)")
+    return problems
+
+
+def compare(results, baseline, threshold, min_delta=0.0):
+    """
+    Compara los tiempos con una línea base.
+
+    Parámetros:
+    - results: Resultados actuales.
+    - baseline: Resultados de referencia.
+    - threshold: Aumento relativo de tiempo tolerado (0.2 = 20 %).
+    - min_delta: Aumento absoluto mínimo en segundos para contar como regresión (evita el ruido
+      de las mediciones de microsegundos).
+
+    Retorna:
+    - Lista de tuplas (nombre, tiempo base, tiempo actual) que superan el umbral.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        before, after = reference["seconds"], result["seconds"]
+        if after > before * (1 + threshold) and after - before > min_delta:
+            regressions.append((name, before, after))
+    return regressions
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+
+    Parámetros:
+    - argv: Lista de argumentos (por defecto, los de sys.argv).
+    """
+    parser = argparse.ArgumentParser(description="Mide transformaciones, carga y dibujo sin interfaz gráfica.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Números de vértices a medir")
+    parser.add_argument("--max-load-size", type=int, default=10 ** 6, help="Tamaño máximo para la prueba de carga JSON")
+    parser.add_argument("--max-render-size", type=int, default=10 ** 7, help="Tamaño máximo para las pruebas de dibujo")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por medición (se usa la mejor)")
+    parser.add_argument("--only", choices=["import", "profiling", "transform", "precision", "parallel", "load", "render"], nargs="+", default=["import", "profiling", "transform", "precision", "parallel", "load", "render"], help="Grupos a medir")
+    parser.add_argument("--threads", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}), help="Números de hilos del motor por bloques (el primero es la referencia)")
+    parser.add_argument("--chunk-rows", type=int, default=parallel.DEFAULT_CHUNK_ROWS, help="Vértices por bloque del motor por bloques")
+    parser.add_argument("--import-budget", type=float, default=0.5, help="Tiempo máximo de importación del núcleo en segundos")
+    parser.add_argument("-o", "--output", default="benchmark.json", help="Archivo JSON de resultados")
+    parser.add_argument("--baseline", help="Archivo JSON de referencia para detectar regresiones")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Aumento relativo de tiempo tolerado")
+    parser.add_argument("--min-delta", type=float, default=1e-3, help="Aumento absoluto mínimo en segundos para contar como regresión")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        if "import" in args.only:
+            results.update(bench_import(IMPORT_MODULES, args.repeat))
+        if "profiling" in args.only:
+            results.update(bench_profiling(args.repeat))
+        if "transform" in args.only:
+            results.update(bench_transforms(args.sizes, args.repeat))
+        if "precision" in args.only:
+            results.update(bench_precision(args.sizes, args.repeat))
+        if "parallel" in args.only:
+            results.update(bench_parallel(args.sizes, args.repeat, args.threads, args.chunk_rows))
+        if "load" in args.only:
+            results.update(bench_load([n for n in args.sizes if n <= args.max_load_size], args.repeat, directory))
+        if "render" in args.only:
+            results.update(bench_render([n for n in args.sizes if n <= args.max_render_size], args.repeat, directory))
+
+    report = {
+        "meta": {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(), "date": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    for name, result in results.items():
+        print(f"{name}: {result['seconds'] * 1000:.3f} ms, pico {result['peak_bytes'] / 2 ** 20:.1f} MiB")
+        if "per_span_ns" in result:
+            print(f"  {result['per_span_ns']:.0f} ns por intervalo")
+        if "speedup" in result:
+            print(f"  aceleración {result['speedup']:.2f}x")
+        if "max_error" in result:
+            print(f"  vértices {result['vertex_bytes'] / 2 ** 20:.1f} MiB, error máximo {result['max_error']:.3g} (relativo {result['max_relative_error']:.3g})")
+    print(f"Resultados guardados en: {args.output}")
+
+    problems = check_imports(results, args.import_budget)
+    for problem in problems:
+        print(problem)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        for name, before, after in regressions:
+            print(f"Regresión en {name}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms")
+        if regressions:
+            return 1
+        print("Sin regresiones respecto a la línea base.")
+    return 1 if problems else 0
+
+
+# Punto de entrada de la aplicación
+if __name__ == "__main__":
+    raise SystemExit(main())
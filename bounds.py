@@ -0,0 +1,150 @@
+# Importar las bibliotecas necesarias
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import transform_kernel as kernel  # Núcleo de transformaciones con matrices homogéneas
+
+# Las cajas se representan como tuplas (min_x, max_x, min_y, max_y), igual que los límites de los ejes.
+# Una transformación afín lleva la envolvente convexa de una figura a la envolvente convexa de la
+# figura transformada, así la caja exacta del resultado se obtiene transformando solo la envolvente.
+
+# Número máximo de vértices para calcular la envolvente convexa; con más vértices (aun después de
+# descartar los interiores) se usan las esquinas de la caja, que dan una caja que siempre contiene
+# a la figura (puede ser más holgada si la transformación gira la figura)
+HULL_LIMIT = 10000
+
+# Direcciones usadas para descartar de una vez los puntos interiores de las figuras grandes
+FILTER_DIRECTIONS = 16
+
+
+def box(points):
+    """
+    Calcula la caja alineada a los ejes de un conjunto de puntos (recorre todos los puntos).
+
+    Parámetros:
+    - points: Arreglo (N, 2) de puntos.
+
+    Retorna:
+    - Tupla (min_x, max_x, min_y, max_y), o None si no hay puntos.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if not len(points):
+        return None
+    min_x, min_y = points.min(axis=0)
+    max_x, max_y = points.max(axis=0)
+    return float(min_x), float(max_x), float(min_y), float(max_y)
+
+
+def corners(bounds):
+    """
+    Esquinas de una caja como arreglo (4, 2).
+    """
+    min_x, max_x, min_y, max_y = bounds
+    return np.array([[min_x, min_y], [max_x, min_y], [max_x, max_y], [min_x, max_y]])
+
+
+def convex_hull(points):
+    """
+    Envolvente convexa de un conjunto de puntos (cadena monótona de Andrew).
+
+    Parámetros:
+    - points: Arreglo (N, 2) de puntos.
+
+    Retorna:
+    - Arreglo (H, 2) con los vértices de la envolvente en orden antihorario.
+    """
+    points = np.unique(np.asarray(points, dtype=float).reshape(-1, 2), axis=0)  # Ordenados por x y luego por y
+    if len(points) < 3:
+        return points
+
+    def half(sequence):
+        chain = []
+        for x, y in sequence:
+            while len(chain) >= 2:
+                (ax, ay), (bx, by) = chain[-2], chain[-1]
+                if (bx - ax) * (y - ay) - (by - ay) * (x - ax) > 0:
+                    break
+                chain.pop()
+            chain.append((x, y))
+        return chain[:-1]
+
+    values = points.tolist()
+    return np.array(half(values) + half(reversed(values)))
+
+
+def discard_interior(points):
+    """
+    Descarta los puntos que están dentro del polígono formado por los puntos extremos en
+    varias direcciones (no pueden ser parte de la envolvente convexa).
+
+    Parámetros:
+    - points: Arreglo (N, 2) de puntos.
+
+    Retorna:
+    - Arreglo (M, 2) con M <= N puntos que contiene a toda la envolvente.
+    """
+    angles = np.linspace(0, 2 * np.pi, FILTER_DIRECTIONS, endpoint=False)
+    directions = np.column_stack([np.cos(angles), np.sin(angles)])
+    extremes = [np.argmax(points @ direction) for direction in directions]  # Una dirección a la vez: memoria O(N)
+    polygon = convex_hull(points[extremes])
+    if len(polygon) < 3:
+        return points
+
+    # Un punto es interior si está estrictamente a la izquierda de todas las aristas (orden antihorario)
+    inside = np.ones(len(points), dtype=bool)
+    for (ax, ay), (bx, by) in zip(polygon, np.roll(polygon, -1, axis=0)):
+        inside &= (bx - ax) * (points[:, 1] - ay) - (by - ay) * (points[:, 0] - ax) > 0
+    return points[~inside]
+
+
+def outline(points):
+    """
+    Puntos de referencia de una figura: su envolvente convexa o, si es muy grande, las esquinas
+    de su caja. Cualquier transformación afín de estos puntos contiene a la figura transformada.
+
+    Parámetros:
+    - points: Arreglo (N, 2) de puntos.
+
+    Retorna:
+    - Arreglo (H, 2) de puntos de referencia.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(points) > HULL_LIMIT:
+        candidates = discard_interior(points)
+        if len(candidates) > HULL_LIMIT:
+            return corners(box(points))
+        points = candidates
+    return convex_hull(points)
+
+
+def transform_outline(reference, matrix):
+    """
+    Transforma los puntos de referencia de una figura sin tocar sus vértices.
+
+    Siempre se calcula en float64 (como box y outline), aunque el proyecto use float32: la caja
+    no debe perder precisión por la de los vértices.
+
+    Parámetros:
+    - reference: Arreglo (H, 2) de puntos de referencia (ver outline).
+    - matrix: Matriz homogénea 3x3.
+
+    Retorna:
+    - Arreglo (H, 2) de puntos de referencia de la figura transformada (float64).
+    """
+    reference = np.asarray(reference, dtype=float).reshape(-1, 2)
+    return kernel.apply_matrix(reference, matrix, out=np.empty_like(reference))
+
+
+def union(boxes):
+    """
+    Caja que contiene a varias cajas (las None se ignoran).
+
+    Parámetros:
+    - boxes: Iterable de tuplas (min_x, max_x, min_y, max_y) o None.
+
+    Retorna:
+    - Tupla (min_x, max_x, min_y, max_y), o None si no hay cajas.
+    """
+    boxes = [bounds for bounds in boxes if bounds is not None]
+    if not boxes:
+        return None
+    min_x, max_x, min_y, max_y = zip(*boxes)
+    return min(min_x), max(max_x), min(min_y), max(max_y)
@@ -0,0 +1,235 @@
+# Importar las bibliotecas necesarias
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+from transform_kernel import (  # Matrices y transformaciones (se reexportan)
+    HORIZONTAL_REFLECTION, VERTICAL_REFLECTION, rotation_matrix, scale_matrix, reflection_matrix,
+    translation_matrix, about, compose, build_matrix, apply_matrix, transform,
+)
+from batch_transform import pack_shapes, unpack_shapes, transform_packed  # Transformación de muchas figuras
+from shapes import create_shape  # Generadores de figuras paramétricas
+from job_io import load_from_file, transform_config, save_results  # Lectura y escritura de archivos de trabajo
+from vertex_parser import VertexParseError, parse_vertices, read_vertices  # Lectura de vértices "x,y;x,y"
+from history import TransformHistory  # Historial de transformaciones con deshacer y rehacer
+from pipeline import Pipeline, parse_pipeline  # Cadenas ordenadas de transformaciones con pivote
+from results import ResultSet, from_matrices  # Colección tipada de resultados
+from result_cache import ResultCache  # Caché LRU de resultados
+from precision import get_dtype, set_precision  # Precisión de los vértices (float64 o float32)
+
+# Núcleo sin interfaz gráfica: geometría, lectura de valores y archivos usando solo NumPy.
+# Importar este módulo no carga tkinter ni matplotlib, así los procesos de trabajo y la
+# línea de comandos arrancan rápido (ver "python benchmark.py --only import").
+
+# Módulos que el núcleo nunca debe importar
+GUI_MODULES = ("tkinter", "matplotlib")
+
+
+def parse_float(value, radians=False):
+    """
+    Convierte un valor de cadena a flotante.
+
+    Parámetros:
+    - value: Cadena a convertir.
+    - radians: Si es True, convierte el valor de grados a radianes.
+
+    Retorna:
+    - Flotante o None si la conversión falla.
+    """
+    try:
+        value = float(value)
+        return np.radians(value) if radians else value
+    except ValueError:
+        return None
+
+
+def parse_number(name, text, kind=float):
+    """
+    Convierte el texto de un campo a número, informando qué campo es inválido.
+
+    Parámetros:
+    - name: Nombre del campo (para el mensaje de error).
+    - text: Cadena a convertir.
+    - kind: float o int.
+
+    Retorna:
+    - Número convertido.
+
+    Lanza:
+    - ValueError: Si el texto está vacío o no es un número válido.
+    """
+    text = text.strip()
+    try:
+        return kind(text)
+    except ValueError:
+        raise ValueError(f"{name} inválido: {text!r}") from None
+
+
+def parse_angle(text):
+    """
+    Convierte una rotación en grados ingresada por el usuario a radianes.
+
+    Parámetros:
+    - text: Cadena con el ángulo en grados.
+
+    Retorna:
+    - Ángulo en radianes, o None si la cadena está vacía.
+
+    Lanza:
+    - ValueError: Si la cadena no está vacía y no es un número.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    angle = parse_float(text, radians=True)
+    if angle is None:
+        raise ValueError(f"rotación inválida: {text!r} (use grados)")
+    return angle
+
+
+def parse_pair(name, text):
+    """
+    Convierte un par "a, b" ingresado por el usuario (escala o traslación).
+
+    Parámetros:
+    - name: Nombre del campo (para el mensaje de error).
+    - text: Cadena a convertir.
+
+    Retorna:
+    - Lista [a, b], o None si la cadena está vacía.
+
+    Lanza:
+    - ValueError: Si la cadena no está vacía y no tiene exactamente dos números.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    values = parse_float_list(text)
+    if len(values) != 2:
+        raise ValueError(f"{name} inválida: {text!r} (use dos números separados por coma)")
+    return values
+
+
+def parse_float_list(value):
+    """
+    Convierte una cadena separada por comas a una lista de flotantes.
+
+    Parámetros:
+    - value: Cadena de texto a convertir.
+
+    Retorna:
+    - Lista de números flotantes o lista vacía si falla.
+    """
+    try:
+        return [float(x) for x in value.split(",")]
+    except ValueError:
+        return []
+
+
+def parse_reflection(value):
+    """
+    Convierte la letra de reflexión ("h" o "v") a su constante.
+
+    Parámetros:
+    - value: Cadena de texto ingresada.
+
+    Retorna:
+    - HORIZONTAL_REFLECTION, VERTICAL_REFLECTION o None.
+    """
+    return {"h": HORIZONTAL_REFLECTION, "v": VERTICAL_REFLECTION}.get(value.strip().lower())
+
+
+def transformation_matrices(angle=None, scale=None, reflection=None, translation=None):
+    """
+    Construye la matriz de cada transformación indicada.
+
+    Parámetros:
+    - angle: Ángulo de rotación en radianes, o None.
+    - scale: Par (Sx, Sy), o None.
+    - reflection: HORIZONTAL_REFLECTION, VERTICAL_REFLECTION o None.
+    - translation: Par (Tx, Ty), o None.
+
+    Retorna:
+    - Diccionario {nombre: matriz 3x3} en el orden rotación, escala, reflexión, traslación.
+    """
+    matrices = {}
+    if angle is not None:
+        matrices["rotation"] = rotation_matrix(angle)
+    if scale is not None:
+        matrices["scale"] = scale_matrix(*scale)
+    if reflection is not None:
+        matrices["reflection"] = reflection_matrix(reflection)
+    if translation is not None:
+        matrices["translation"] = translation_matrix(*translation)
+    return matrices
+
+
+def apply_transformations(vertices, angle=None, scale=None, reflection=None, translation=None):
+    """
+    Aplica por separado cada transformación indicada a los mismos vértices.
+
+    Parámetros:
+    - vertices: Arreglo (N, 2) de vértices.
+    - angle: Ángulo de rotación en radianes, o None.
+    - scale: Par (Sx, Sy), o None.
+    - reflection: HORIZONTAL_REFLECTION, VERTICAL_REFLECTION o None.
+    - translation: Par (Tx, Ty), o None.
+
+    Retorna:
+    - ResultSet con "original" y los vértices transformados en el orden
+      rotación, escala, reflexión, traslación.
+    """
+    return from_matrices(vertices, transformation_matrices(angle, scale, reflection, translation))
+
+
+def bounds(arrays):
+    """
+    Calcula la caja que contiene varias figuras sin concatenarlas.
+
+    Parámetros:
+    - arrays: Iterable de arreglos (N, 2) de vértices (se ignoran los vacíos).
+
+    Retorna:
+    - Tupla (min_x, max_x, min_y, max_y), o None si no hay vértices.
+    """
+    lows, highs = [], []
+    for points in arrays:
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        if len(points):
+            lows.append(points.min(axis=0))
+            highs.append(points.max(axis=0))
+    if not lows:
+        return None
+    min_x, min_y = np.min(lows, axis=0)
+    max_x, max_y = np.max(highs, axis=0)
+    return min_x, max_x, min_y, max_y
+
+
+def calculate_limits(arrays, margin=1):
+    """
+    Calcula los límites de los ejes que contienen todas las figuras.
+
+    Parámetros:
+    - arrays: Iterable de arreglos (N, 2) de vértices.
+    - margin: Margen adicional para la visualización.
+
+    Retorna:
+    - Tupla (min_x, max_x, min_y, max_y), o None si no hay vértices.
+    """
+    box = bounds(arrays)
+    if box is None:
+        return None
+    min_x, max_x, min_y, max_y = box
+    return min_x - margin, max_x + margin, min_y - margin, max_y + margin
+
+
+def square_limits(arrays, margin=1):
+    """
+    Calcula un intervalo común para ambos ejes que contiene todas las figuras.
+
+    Parámetros:
+    - arrays: Iterable de arreglos (N, 2) de vértices.
+    - margin: Margen adicional para la visualización.
+
+    Retorna:
+    - Tupla (mínimo, máximo).
+    """
+    min_x, max_x, min_y, max_y = bounds(arrays)
+    return min(min_x, min_y) - margin, max(max_x, max_y) + margin
@@ -0,0 +1,111 @@
+# Importar las bibliotecas necesarias
+import multiprocessing  # Para elegir cómo se inician los procesos
+import os  # Para conocer el número de procesadores
+from concurrent.futures import ProcessPoolExecutor  # Para dibujar en varios procesos
+
+# Una especificación de figura es un diccionario que se puede enviar a otro proceso:
+# {"file_name": ruta, "shapes": [(etiqueta, vértices, color)], "limits": (min_x, max_x, min_y, max_y),
+#  "points": (etiqueta, vértices, color) o None, "style": argumentos de Renderer}
+
+# Dibujantes Agg reutilizados dentro de cada proceso, uno por estilo
+_renderers = {}
+
+
+def render_spec(spec):
+    """
+    Dibuja una especificación de figura con el motor Agg y la guarda como imagen.
+
+    Parámetros:
+    - spec: Diccionario con la especificación de la figura.
+
+    Retorna:
+    - Ruta del archivo guardado.
+    """
+    from renderer import Renderer  # Importación diferida: solo la necesitan los procesos que dibujan
+
+    style = spec.get("style", {})
+    key = tuple(sorted(style.items()))
+    if key not in _renderers:
+        _renderers[key] = Renderer(interactive=False, **style)
+    renderer = _renderers[key]
+    renderer.draw(spec["shapes"], spec.get("limits"), spec.get("points"))
+    return renderer.save(spec["file_name"], reuse=False)
+
+
+class ExportPool:
+    """
+    Grupo de procesos que dibujan y guardan imágenes sin bloquear la interfaz gráfica.
+    """
+
+    def __init__(self, workers=None, context=None):
+        """
+        Inicializa el grupo (los procesos se crean con la primera exportación).
+
+        Parámetros:
+        - workers: Número de procesos (por defecto, uno por procesador).
+        - context: Método de inicio de los procesos ("spawn", "fork", ...); None usa el del sistema.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.context = context
+        self._executor = None
+
+    def _get_executor(self):
+        """
+        Crea el ejecutor la primera vez que se necesita.
+        """
+        if self._executor is None:
+            context = multiprocessing.get_context(self.context) if self.context else None
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        return self._executor
+
+    def submit(self, spec):
+        """
+        Envía una figura para dibujarla y guardarla en otro proceso.
+
+        Parámetros:
+        - spec: Diccionario con la especificación de la figura.
+
+        Retorna:
+        - Future cuyo resultado es la ruta del archivo guardado.
+        """
+        return self._get_executor().submit(render_spec, spec)
+
+    def map(self, specs, chunksize=1):
+        """
+        Dibuja y guarda muchas figuras usando todos los procesos.
+
+        Parámetros:
+        - specs: Iterable de especificaciones de figura.
+        - chunksize: Figuras enviadas a cada proceso por lote.
+
+        Retorna:
+        - Iterador con las rutas guardadas, en el mismo orden.
+        """
+        return self._get_executor().map(render_spec, specs, chunksize=chunksize)
+
+    def shutdown(self, wait=True):
+        """
+        Detener los procesos del grupo.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+def watch(root, future, callback, interval=50):
+    """
+    Consulta periódicamente un Future desde el ciclo de Tk y llama a callback al terminar.
+
+    Parámetros:
+    - root: Ventana de Tkinter (se usa root.after, así callback corre en el hilo de la interfaz).
+    - future: Future devuelto por ExportPool.submit.
+    - callback: Función que recibe el Future terminado.
+    - interval: Milisegundos entre consultas.
+    """
+    def poll():
+        if future.done():
+            callback(future)
+        else:
+            root.after(interval, poll)
+
+    root.after(interval, poll)
@@ -0,0 +1,167 @@
+# Importar las bibliotecas necesarias
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+from results import ResultSet, from_matrices  # Colección tipada de resultados
+from result_cache import vertices_digest  # Resumen del contenido de los vértices
+import precision  # Precisión de los vértices (float64 o float32)
+
+
+class TransformHistory:
+    """
+    Historial de transformaciones con deshacer y rehacer.
+
+    Cada paso guarda solo las matrices 3x3 de sus resultados y sus metadatos (parámetros
+    ingresados); los vértices originales se comparten entre los pasos mientras la figura
+    no cambie. Los vértices transformados se calculan únicamente para el paso mostrado,
+    así la memoria crece con el número de pasos y no con pasos × vértices.
+
+    Los vértices se guardan por referencia: después de registrarlos no deben modificarse en
+    el lugar (las aplicaciones reemplazan el arreglo cuando la figura cambia).
+    """
+
+    def __init__(self, max_steps=None, cache=None):
+        """
+        Inicializa el historial vacío.
+
+        Parámetros:
+        - max_steps: Número máximo de pasos guardados (None = sin límite); al superarlo
+          se descartan los más antiguos.
+        - cache: ResultCache opcional donde se buscan (y guardan) los vértices de cada paso,
+          así volver a un paso ya calculado no repite el cálculo.
+        """
+        self.max_steps = max_steps
+        self.cache = cache
+        self.steps = []  # Lista de pasos: (vértices originales, claves, pila (K, 3, 3) de matrices, metadatos)
+        self.position = 0  # Número de pasos activos (el paso mostrado es position - 1)
+        self._cache = None  # (paso, resultados) del último paso materializado
+        self._digest = None  # (vértices, resumen) de los últimos vértices guardados
+
+    def __len__(self):
+        """
+        Número de pasos guardados (incluye los que se pueden rehacer).
+        """
+        return len(self.steps)
+
+    def push(self, vertices, matrices, **metadata):
+        """
+        Registrar un nuevo paso; los pasos deshechos se descartan.
+
+        Parámetros:
+        - vertices: Arreglo (N, 2) de vértices originales.
+        - matrices: Diccionario {nombre: matriz 3x3} con las transformaciones del paso.
+        - metadata: Datos adicionales del paso (por ejemplo, los parámetros ingresados).
+
+        Retorna:
+        - Índice del nuevo paso.
+        """
+        vertices = self._shared_vertices(np.asarray(vertices, dtype=precision.get_dtype()))
+
+        keys = tuple(matrices)
+        stack = np.array([matrices[key] for key in keys], dtype=float).reshape(len(keys), 3, 3)
+        del self.steps[self.position:]
+        self.steps.append((vertices, keys, stack, metadata))
+        if self.max_steps is not None and len(self.steps) > self.max_steps:
+            del self.steps[:len(self.steps) - self.max_steps]
+            self._cache = None
+        self.position = len(self.steps)
+        return self.position - 1
+
+    def _shared_vertices(self, vertices):
+        """
+        Vértices que guarda un paso nuevo: los del paso mostrado si la figura es la misma, así
+        repetir transformaciones sobre ella no guarda otra copia. Se compara primero por
+        identidad y luego por resumen (el de los vértices guardados se calcula una sola vez).
+        """
+        current = self.current()
+        if current is None or current[0] is vertices:
+            return vertices
+        digest = vertices_digest(vertices)
+        if self._digest is None or self._digest[0] is not current[0]:
+            self._digest = (current[0], vertices_digest(current[0]))
+        if digest == self._digest[1]:
+            return current[0]  # Misma figura en otro arreglo: se comparte el guardado
+        self._digest = (vertices, digest)
+        return vertices
+
+    def can_undo(self):
+        """
+        Indica si hay un paso anterior al mostrado.
+        """
+        return self.position > 1
+
+    def can_redo(self):
+        """
+        Indica si hay un paso deshecho que se puede rehacer.
+        """
+        return self.position < len(self.steps)
+
+    def undo(self):
+        """
+        Volver al paso anterior (no recalcula nada hasta que se piden los resultados).
+
+        Retorna:
+        - True si se retrocedió, False si no había pasos anteriores.
+        """
+        if not self.can_undo():
+            return False
+        self.position -= 1
+        return True
+
+    def redo(self):
+        """
+        Avanzar al siguiente paso deshecho.
+
+        Retorna:
+        - True si se avanzó, False si no había pasos por rehacer.
+        """
+        if not self.can_redo():
+            return False
+        self.position += 1
+        return True
+
+    def current(self):
+        """
+        Obtener el paso mostrado como tupla (vértices, claves, matrices, metadatos), o None.
+        """
+        return self.steps[self.position - 1] if self.position else None
+
+    def metadata(self, index=None):
+        """
+        Obtener los metadatos de un paso (por defecto, el mostrado).
+        """
+        index = self.position - 1 if index is None else index
+        return self.steps[index][3]
+
+    def results(self, index=None):
+        """
+        Calcular los vértices de un paso (por defecto, el mostrado).
+
+        Solo se conserva en memoria el último paso calculado, así volver a pedir el paso
+        mostrado no repite el cálculo.
+
+        Parámetros:
+        - index: Índice del paso.
+
+        Retorna:
+        - ResultSet con "original" y los vértices transformados (vacío si no hay pasos).
+        """
+        index = self.position - 1 if index is None else index
+        if index < 0:
+            return ResultSet()
+        step = self.steps[index]
+        if self._cache is not None and self._cache[0] is step:
+            return self._cache[1]
+
+        vertices, keys, stack, _ = step
+        matrices = dict(zip(keys, stack))
+        results = from_matrices(vertices, matrices) if self.cache is None else self.cache.results(vertices, matrices)
+        self._cache = (step, results)
+        return results
+
+    def clear(self):
+        """
+        Borrar todos los pasos.
+        """
+        self.steps.clear()
+        self.position = 0
+        self._cache = None
+        self._digest = None
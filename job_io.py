@@ -0,0 +1,252 @@
+# Importar las bibliotecas necesarias
+import json  # Para manejar archivos JSON
+import os  # Para comparar las rutas de entrada y salida
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import precision  # Precisión de los vértices (float64 o float32)
+import transform_kernel as kernel  # Núcleo de transformaciones con matrices homogéneas
+import point_stream  # Lectura incremental de los puntos de archivos JSON
+import vertex_file  # Formato binario de vértices mapeable en memoria
+import vertex_parser  # Lectura de vértices en texto "x,y;x,y" o CSV
+import profiling  # Medición de tiempos por intervalos
+from results import ResultSet  # Colección tipada de resultados
+
+# Colores usados para cada resultado (los mismos que en las aplicaciones gráficas)
+COLORS = {
+    "original": "#1A0014",
+    "rotation": "#FF5733",
+    "scale": "#33FF57",
+    "reflection": "#3357FF",
+    "translation": "#FFD700",
+    "pipeline": "#8A2BE2",
+}
+
+
+def config_matrices(config):
+    """
+    Construye la matriz homogénea de cada transformación descrita en una configuración de trabajo.
+
+    Parámetros:
+    - config: Diccionario con las claves opcionales "rotation", "scale" y "translation".
+
+    Retorna:
+    - Diccionario {nombre: matriz 3x3} en el orden rotación, escala, traslación.
+    """
+    matrices = {}
+    if "rotation" in config:
+        matrices["rotation"] = kernel.rotation_matrix(np.radians(config["rotation"].get("angle", 90)))
+    if "scale" in config:
+        matrices["scale"] = kernel.scale_matrix(*config["scale"].get("value", [1, 1]))
+    if "translation" in config:
+        matrices["translation"] = kernel.translation_matrix(*config["translation"].get("value", [0, 0]))
+    return matrices
+
+
+def transform_config(vertices, config):
+    """
+    Aplica a los vértices las transformaciones descritas en una configuración de trabajo.
+
+    Parámetros:
+    - vertices: Arreglo (N, 2) de vértices.
+    - config: Diccionario con las claves opcionales "rotation", "scale" y "translation".
+
+    Retorna:
+    - result_dict: ResultSet con los resultados de las transformaciones.
+    - max_value: Valor máximo absoluto para ajustar los ejes de las gráficas (se obtiene de las
+      cajas de los resultados, sin recorrer sus vértices).
+    """
+    result_dict = ResultSet()
+    result_dict.add("original", vertices, COLORS["original"])
+    for key, matrix in config_matrices(config).items():
+        result_dict.add_transformed(key, "original", matrix, COLORS[key])
+
+    min_x, max_x, min_y, max_y = result_dict.bounds()
+    return result_dict, max(abs(min_x), abs(max_x), abs(min_y), abs(max_y))
+
+
+def load_from_file(filename):
+    """
+    Procesa un archivo JSON para extraer puntos y aplicar transformaciones iniciales.
+
+    Los puntos se leen de forma incremental directamente a un arreglo con la precisión del
+    proyecto (ver precision.py). Los archivos
+    en formato binario (.vtx) se mapean en memoria y sus metadatos hacen de configuración;
+    los archivos de texto o CSV (.txt, .csv) solo contienen vértices.
+
+    Parámetros:
+    - filename: Ruta del archivo JSON, binario o de texto con vértices.
+
+    Retorna:
+    - result_dict: ResultSet con los resultados de las transformaciones iniciales.
+    - max_value: Valor máximo para ajustar los ejes de las gráficas.
+    """
+    with profiling.span("load_from_file", file=str(filename)):
+        if vertex_file.is_vertex_file(filename):
+            vertices, config = vertex_file.open_vertices(filename)
+        elif vertex_parser.is_text_file(filename):
+            vertices, config = _read_text(filename), {}
+        else:
+            vertices, config = point_stream.load_points(filename)
+    if not len(vertices):
+        raise ValueError("No se encontraron puntos en el archivo.")
+
+    return transform_config(vertices, config)
+
+
+def _read_text(filename, block_size=vertex_parser.DEFAULT_BLOCK_SIZE):
+    """
+    Lee los vértices de un archivo de texto o CSV, saltando el encabezado si lo tiene.
+    """
+    skip_lines = 1 if vertex_parser.has_header(filename) else 0
+    return vertex_parser.read_vertices(filename, block_size, skip_lines)
+
+
+def _open_chunks(filename, block_size):
+    """
+    Prepara la lectura por bloques de un archivo JSON o binario de vértices.
+
+    Para JSON se hace una primera lectura para conocer la configuración (que puede aparecer
+    después de "points"); los archivos binarios solo se mapean en memoria y los de texto
+    se leen completos (no tienen configuración).
+
+    Parámetros:
+    - filename: Ruta del archivo.
+    - block_size: Bytes leídos en cada bloque.
+
+    Retorna:
+    - config: Configuración del archivo.
+    - count: Número de puntos.
+    - chunks: Iterador de arreglos (k, 2) de puntos.
+    """
+    if vertex_file.is_vertex_file(filename):
+        vertices, config = vertex_file.open_vertices(filename)
+    elif vertex_parser.is_text_file(filename):
+        vertices, config = _read_text(filename, block_size), {}
+    else:
+        config, count = point_stream.PointStream(filename, block_size).scan()
+        return config, count, point_stream.PointStream(filename, block_size).chunks()
+
+    step = max(1, block_size // (2 * vertices.itemsize))
+    return config, len(vertices), (vertices[i:i + step] for i in range(0, len(vertices), step))
+
+
+def transform_chunks(filename, block_size=point_stream.DEFAULT_BLOCK_SIZE):
+    """
+    Transforma los puntos de un archivo bloque por bloque, con memoria acotada.
+
+    Parámetros:
+    - filename: Ruta del archivo JSON o binario de vértices.
+    - block_size: Bytes leídos en cada bloque.
+
+    Retorna:
+    - Generador de diccionarios {nombre: arreglo (k, 2)} con el bloque original y sus transformaciones.
+    """
+    config, _, chunks = _open_chunks(filename, block_size)
+    matrices = config_matrices(config)
+    for chunk in chunks:
+        results = {"original": chunk}
+        for key, matrix in matrices.items():
+            results[key] = kernel.apply_matrix(chunk, matrix)
+        yield results
+
+
+def check_outputs(filename, paths):
+    """
+    Verifica que ningún archivo de salida sea el archivo de entrada (por ejemplo, al escribir
+    los resultados en el mismo directorio de los trabajos).
+
+    Parámetros:
+    - filename: Ruta del archivo de entrada.
+    - paths: Rutas de los archivos de salida.
+
+    Lanza:
+    - ValueError: Si alguna salida apunta al archivo de entrada.
+    """
+    source = os.path.realpath(filename)
+    for path in paths:
+        if os.path.realpath(path) == source:
+            raise ValueError(f"La salida {path} sobrescribiría el archivo de entrada.")
+
+
+def _create_output(path, count, key):
+    """
+    Crea un archivo de salida mapeado en memoria (.npy o .vtx) para un resultado.
+    """
+    if path.endswith(vertex_file.EXTENSION):
+        return vertex_file.create_vertices(path, count, {"name": key, "color": COLORS[key]})
+    return np.lib.format.open_memmap(path, mode="w+", dtype=precision.get_dtype(), shape=(count, 2))
+
+
+def write_transformed(filename, base_name, block_size=point_stream.DEFAULT_BLOCK_SIZE, extension=".npy"):
+    """
+    Transforma un archivo de puntos por bloques y escribe cada resultado en su propio archivo.
+
+    Parámetros:
+    - filename: Ruta del archivo JSON o binario de vértices.
+    - base_name: Prefijo de los archivos de salida (se genera "<base_name>.<resultado><extension>").
+    - block_size: Bytes leídos en cada bloque.
+    - extension: ".npy" o ".vtx".
+
+    Retorna:
+    - Diccionario {nombre: ruta del archivo}.
+    """
+    config, count, chunks = _open_chunks(filename, block_size)
+    if not count:
+        raise ValueError("No se encontraron puntos en el archivo.")
+
+    matrices = config_matrices(config)
+    paths = {key: f"{base_name}.{key}{extension}" for key in ["original", *matrices]}
+    check_outputs(filename, paths.values())
+    outputs = {key: _create_output(path, count, key) for key, path in paths.items()}
+
+    start = 0
+    for chunk in chunks:
+        end = start + len(chunk)
+        outputs["original"][start:end] = chunk
+        for key, matrix in matrices.items():
+            kernel.apply_matrix(chunk, matrix, out=outputs[key][start:end])  # Directo al archivo, sin arreglo intermedio
+        start = end
+
+    for output in outputs.values():
+        output.flush()
+    return paths
+
+
+def open_result(path):
+    """
+    Abre un resultado escrito por write_transformed sin leerlo completo.
+
+    Parámetros:
+    - path: Ruta del archivo .npy o .vtx.
+
+    Retorna:
+    - Arreglo (N, 2) mapeado en memoria.
+    """
+    if vertex_file.is_vertex_file(path):
+        return vertex_file.open_vertices(path)[0]
+    return np.load(path, mmap_mode="r")
+
+
+def save_results(result_dict, filename):
+    """
+    Guarda los vértices de cada resultado en un archivo JSON o NPZ (según la extensión).
+
+    Con la extensión .vtx se escribe un archivo binario por resultado
+    ("<nombre>.<resultado>.vtx") con su color en los metadatos.
+
+    Parámetros:
+    - result_dict: ResultSet con los resultados de las transformaciones.
+    - filename: Ruta del archivo de salida (.json, .npz o .vtx).
+    """
+    filename = str(filename)
+    if filename.endswith(vertex_file.EXTENSION):
+        base_name = filename[:-len(vertex_file.EXTENSION)]
+        for key, vertices in result_dict.items():
+            vertex_file.save_vertices(f"{base_name}.{key}{vertex_file.EXTENSION}", vertices, {"name": key, "color": result_dict.color(key)})
+        return
+
+    if filename.endswith(".npz"):
+        np.savez(filename, **dict(result_dict.items()))
+        return
+
+    with open(filename, "w") as file:
+        json.dump({key: {"value": vertices.tolist(), "color": result_dict.color(key)} for key, vertices in result_dict.items()}, file)
@@ -0,0 +1,116 @@
+# Importar las bibliotecas necesarias
+from collections import OrderedDict  # Para descartar las vistas menos usadas
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+
+# Número de vértices a partir del cual vale la pena simplificar un contorno
+LOD_THRESHOLD = 5000
+
+# Vistas (niveles de acercamiento) guardadas por figura
+MAX_VIEWS = 8
+
+
+def decimate(vertices, xlim, ylim, width, height):
+    """
+    Simplifica un contorno a la resolución de la pantalla.
+
+    Los vértices consecutivos que caen en la misma columna de píxeles se reducen al primero, al
+    más bajo, al más alto y al último de cada tramo, así el contorno dibujado ocupa los mismos
+    píxeles pero tiene como máximo cuatro vértices por columna recorrida. Los vértices fuera de
+    la vista se agrupan por el lado por el que salen (izquierda, derecha, abajo o arriba): un
+    tramo que no vuelve a entrar no se ve, así queda solo su primer y su último vértice.
+
+    Parámetros:
+    - vertices: Arreglo (N, 2) de vértices (contorno ya cerrado).
+    - xlim: Tupla (min_x, max_x) visible.
+    - ylim: Tupla (min_y, max_y) visible.
+    - width: Ancho de los ejes en píxeles.
+    - height: Alto de los ejes en píxeles.
+
+    Retorna:
+    - Arreglo (M, 2) con M <= N vértices.
+    """
+    vertices = np.asarray(vertices)  # Sin convertir: los vértices float32 no se copian a float64
+    count = len(vertices)
+    if count < 3:
+        return vertices
+
+    scale_x = width / ((xlim[1] - xlim[0]) or 1.0)
+    scale_y = height / ((ylim[1] - ylim[0]) or 1.0)
+    # Columna -1 o width (y fila -1 o height): cualquier posición fuera de la vista por ese lado
+    pixel_x = np.clip(np.floor((vertices[:, 0] - xlim[0]) * scale_x), -1, width).astype(np.int64)
+    pixel_y = np.clip(np.floor((vertices[:, 1] - ylim[0]) * scale_y), -1, height).astype(np.int64)
+    column = pixel_x.copy()
+    column[pixel_y == -1] = width + 1  # Debajo de la vista, en cualquier columna
+    column[pixel_y == height] = width + 2  # Encima de la vista, en cualquier columna
+
+    # Tramos de vértices consecutivos en la misma columna (o del mismo lado fuera de la vista)
+    starts = np.flatnonzero(np.diff(column)) + 1
+    starts = np.concatenate([[0], starts])
+    ends = np.append(starts[1:] - 1, count - 1)
+
+    # Vértice más bajo y más alto de cada tramo: la fila y el índice se combinan en una sola
+    # clave, así reduceat encuentra ambos sin recorrer los tramos uno por uno
+    index = np.arange(count, dtype=np.int64)
+    key = (pixel_y + 1) * count + index
+    lowest = np.minimum.reduceat(key, starts) % count
+    highest = np.maximum.reduceat(key, starts) % count
+
+    keep = np.zeros(count, dtype=bool)
+    keep[starts] = keep[ends] = keep[lowest] = keep[highest] = True
+    return vertices[keep]
+
+
+class LODCache:
+    """
+    Guarda las versiones simplificadas de cada figura por vista, para recalcularlas solo
+    cuando cambian los límites de los ejes o el tamaño en pantalla.
+    """
+
+    def __init__(self, threshold=LOD_THRESHOLD, max_views=MAX_VIEWS):
+        """
+        Inicializa la caché.
+
+        Parámetros:
+        - threshold: Número de vértices a partir del cual se simplifica.
+        - max_views: Número de vistas guardadas por figura.
+        """
+        self.threshold = threshold
+        self.max_views = max_views
+        self.views = {}  # Por etiqueta: OrderedDict {vista: vértices simplificados}
+
+    def reduce(self, label, vertices, xlim, ylim, width, height):
+        """
+        Obtener la versión simplificada de una figura para la vista indicada.
+
+        Parámetros:
+        - label: Etiqueta de la figura.
+        - vertices: Arreglo (N, 2) de vértices a resolución completa.
+        - xlim, ylim: Límites visibles de los ejes.
+        - width, height: Tamaño de los ejes en píxeles.
+
+        Retorna:
+        - Arreglo de vértices a dibujar.
+        """
+        if len(vertices) < self.threshold:
+            return vertices
+
+        view = (tuple(np.round(xlim, 12)), tuple(np.round(ylim, 12)), int(width), int(height))
+        cache = self.views.setdefault(label, OrderedDict())
+        if view in cache:
+            cache.move_to_end(view)
+            return cache[view]
+
+        reduced = decimate(vertices, xlim, ylim, width, height)
+        cache[view] = reduced
+        if len(cache) > self.max_views:
+            cache.popitem(last=False)
+        return reduced
+
+    def invalidate(self, label=None):
+        """
+        Descartar las vistas guardadas de una figura (o de todas si label es None).
+        """
+        if label is None:
+            self.views.clear()
+        else:
+            self.views.pop(label, None)
@@ -0,0 +1,136 @@
+# Importar las bibliotecas necesarias
+import os  # Para conocer el número de procesadores
+from concurrent.futures import ThreadPoolExecutor  # Hilos que reparten los bloques de vértices
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import transform_kernel as kernel  # Núcleo de transformaciones con matrices homogéneas
+import precision  # Precisión de los vértices (float64 o float32)
+
+# Motor por bloques: los arreglos grandes se dividen en bloques contiguos que se transforman en
+# varios hilos a la vez. NumPy libera el GIL durante cada producto, así los hilos trabajan en
+# paralelo sin copiar los vértices a otros procesos; cada bloque escribe su parte del resultado.
+
+# Vértices a partir de los cuales se reparte el trabajo (por debajo, una sola llamada al núcleo)
+PARALLEL_THRESHOLD = 1 << 20
+
+# Vértices por bloque (1 MiB en float64: el bloque y su resultado caben en la caché de cada núcleo)
+DEFAULT_CHUNK_ROWS = 1 << 16
+
+# Variable de entorno con el número de hilos del motor compartido (por defecto, uno por procesador)
+THREADS_VARIABLE = "TRANSFORM_THREADS"
+
+
+class ChunkedEngine:
+    """
+    Aplica matrices a arreglos grandes de vértices por bloques, en un grupo de hilos.
+
+    El grupo se crea la primera vez que un arreglo supera el umbral; los arreglos pequeños
+    usan directamente kernel.apply_matrix.
+    """
+
+    def __init__(self, workers=None, chunk_rows=DEFAULT_CHUNK_ROWS, threshold=PARALLEL_THRESHOLD):
+        """
+        Inicializa el motor.
+
+        Parámetros:
+        - workers: Número de hilos (por defecto, uno por procesador); 1 desactiva los hilos.
+        - chunk_rows: Vértices por bloque.
+        - threshold: Número mínimo de vértices para repartir el trabajo.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_rows = max(1, int(chunk_rows))
+        self.threshold = threshold
+        self._executor = None  # Grupo de hilos (se crea al primer uso)
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="transform")
+        return self._executor
+
+    def apply_matrix(self, vertices, matrix, out=None):
+        """
+        Aplica una matriz homogénea a los vértices (mismo resultado que kernel.apply_matrix).
+
+        Parámetros:
+        - vertices: Arreglo (N, 2) de vértices.
+        - matrix: Matriz 3x3.
+        - out: Arreglo (N, 2) donde se escribe el resultado (puede ser vertices), o None.
+
+        Retorna:
+        - Arreglo (N, 2) de vértices transformados.
+        """
+        if self.workers < 2 or len(vertices) < max(self.threshold, 2 * self.chunk_rows):
+            return kernel.apply_matrix(vertices, matrix, out=out)
+
+        dtype = precision.get_dtype() if out is None else out.dtype
+        vertices = np.asarray(vertices, dtype=dtype)
+        if out is None:
+            out = kernel.empty_vertices(len(vertices), dtype)
+        elif np.may_share_memory(vertices, out) and (vertices.ctypes.data != out.ctypes.data or vertices.strides != out.strides):
+            vertices = vertices.copy()  # Solapamiento desplazado: los bloques se pisarían entre sí
+
+        # Cada bloque lee y escribe solo sus propias filas (en el mismo lugar también es seguro)
+        starts = range(0, len(vertices), self.chunk_rows)
+        tasks = [
+            self._pool().submit(kernel.apply_matrix, vertices[start:start + self.chunk_rows], matrix, out[start:start + self.chunk_rows])
+            for start in starts
+        ]
+        for task in tasks:
+            task.result()  # Propaga cualquier error de los hilos
+        return out
+
+    def transform(self, vertices, *operations, out=None):
+        """
+        Aplica una cadena de operaciones (ver kernel.transform) por bloques.
+        """
+        return self.apply_matrix(vertices, kernel.build_matrix(operations), out=out)
+
+    def close(self):
+        """
+        Terminar los hilos del grupo.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+# Motor compartido por el proyecto
+_engine = ChunkedEngine(int(os.environ.get(THREADS_VARIABLE, 0)) or None)
+
+
+def get_engine():
+    """
+    Motor compartido por el proyecto.
+    """
+    return _engine
+
+
+def configure(workers=None, chunk_rows=DEFAULT_CHUNK_ROWS, threshold=PARALLEL_THRESHOLD):
+    """
+    Reemplazar el motor compartido (por ejemplo, workers=1 en procesos que ya trabajan en paralelo).
+
+    Parámetros:
+    - workers: Número de hilos (por defecto, uno por procesador).
+    - chunk_rows: Vértices por bloque.
+    - threshold: Número mínimo de vértices para repartir el trabajo.
+
+    Retorna:
+    - El motor nuevo.
+    """
+    global _engine
+    _engine.close()
+    _engine = ChunkedEngine(workers, chunk_rows, threshold)
+    return _engine
+
+
+def apply_matrix(vertices, matrix, out=None):
+    """
+    Aplica una matriz homogénea con el motor compartido (ver ChunkedEngine.apply_matrix).
+    """
+    return _engine.apply_matrix(vertices, matrix, out=out)
+
+
+def transform(vertices, *operations, out=None):
+    """
+    Aplica una cadena de operaciones con el motor compartido (ver kernel.transform).
+    """
+    return _engine.transform(vertices, *operations, out=out)
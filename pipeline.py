@@ -0,0 +1,184 @@
+# Importar las bibliotecas necesarias
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import transform_kernel as kernel  # Núcleo de transformaciones con matrices homogéneas
+import parallel  # Transformación por bloques en varios hilos para arreglos grandes
+
+# Sintaxis de una cadena de etapas: "rotar 45 @ 1,1; escalar 2,0.5 @ 1,1; reflejar h; trasladar 3,4"
+# Las etapas se separan con ";", los parámetros con "," y el pivote (opcional) va después de "@".
+
+# Nombres aceptados para cada operación
+STAGE_NAMES = {
+    "rotation": "rotation", "rotar": "rotation",
+    "scale": "scale", "escalar": "scale",
+    "reflection": "reflection", "reflejar": "reflection",
+    "translation": "translation", "trasladar": "translation",
+}
+
+# Letras de reflexión
+REFLECTIONS = {"h": kernel.HORIZONTAL_REFLECTION, "v": kernel.VERTICAL_REFLECTION}
+
+
+class Pipeline:
+    """
+    Cadena ordenada de transformaciones, cada una con un pivote opcional.
+
+    Toda la cadena se reduce a una sola matriz 3x3, así los vértices se recorren una vez
+    sin importar el número de etapas; las etapas intermedias solo se calculan si se piden.
+    """
+
+    def __init__(self):
+        """
+        Inicializa una cadena vacía.
+        """
+        self.stages = []  # Lista de etapas: (nombre, parámetros, pivote o None)
+
+    def __len__(self):
+        """
+        Número de etapas.
+        """
+        return len(self.stages)
+
+    def add(self, name, *params, pivot=None):
+        """
+        Agregar una etapa al final de la cadena.
+
+        Parámetros:
+        - name: Nombre de la operación ("rotation", "scale", "reflection" o "translation").
+        - params: Parámetros de la operación (ángulo en radianes, sx y sy, eje o tx y ty).
+        - pivot: Punto (x, y) alrededor del cual se aplica la operación (None = origen).
+
+        Retorna:
+        - La misma cadena (para encadenar llamadas).
+        """
+        kernel.operation_matrix(name, *params)  # Valida el nombre y los parámetros
+        self.stages.append((name, params, None if pivot is None else tuple(map(float, pivot))))
+        return self
+
+    def labels(self):
+        """
+        Etiquetas de las etapas ("1. rotation", "2. scale", ...).
+        """
+        return [f"{index + 1}. {name}" for index, (name, _, _) in enumerate(self.stages)]
+
+    def matrices(self):
+        """
+        Matriz de cada etapa, con el pivote ya incorporado.
+
+        Retorna:
+        - Pila (S, 3, 3) de matrices.
+        """
+        matrices = np.empty((len(self.stages), 3, 3))
+        for index, (name, params, pivot) in enumerate(self.stages):
+            matrix = kernel.operation_matrix(name, *params)
+            matrices[index] = matrix if pivot is None else kernel.about(matrix, pivot)
+        return matrices
+
+    def cumulative(self):
+        """
+        Matriz acumulada hasta cada etapa (la última es la cadena completa).
+
+        Retorna:
+        - Pila (S, 3, 3) donde el elemento i equivale a aplicar las etapas 0..i.
+        """
+        cumulative = self.matrices()
+        for index in range(1, len(cumulative)):
+            cumulative[index] = cumulative[index - 1] @ cumulative[index]
+        return cumulative
+
+    def matrix(self):
+        """
+        Matriz 3x3 de toda la cadena.
+        """
+        return kernel.compose(*self.matrices())
+
+    def result_matrices(self, intermediate=False):
+        """
+        Matrices a mostrar: la cadena completa y, solo si se piden, las etapas intermedias.
+
+        Parámetros:
+        - intermediate: Si es True, se incluye la matriz acumulada de cada etapa intermedia.
+
+        Retorna:
+        - Diccionario {etiqueta: matriz 3x3}; la cadena completa se llama "pipeline".
+        """
+        cumulative = self.cumulative()
+        matrices = dict(zip(self.labels()[:-1], cumulative[:-1])) if intermediate else {}
+        matrices["pipeline"] = cumulative[-1] if len(cumulative) else kernel.identity_matrix()
+        return matrices
+
+    def apply(self, vertices):
+        """
+        Aplicar toda la cadena en una sola pasada sobre los vértices.
+
+        Parámetros:
+        - vertices: Arreglo (N, 2) de vértices.
+
+        Retorna:
+        - Arreglo (N, 2) de vértices transformados.
+        """
+        return parallel.apply_matrix(vertices, self.matrix())
+
+    def intermediate(self, vertices, indices=None):
+        """
+        Calcular las etapas intermedias pedidas, cada una directamente desde los vértices originales.
+
+        Parámetros:
+        - vertices: Arreglo (N, 2) de vértices.
+        - indices: Índices de las etapas a calcular (None = todas).
+
+        Retorna:
+        - Diccionario {etiqueta: vértices después de esa etapa}.
+        """
+        cumulative = self.cumulative()
+        labels = self.labels()
+        indices = range(len(self.stages)) if indices is None else indices
+        return {labels[index]: parallel.apply_matrix(vertices, cumulative[index]) for index in indices}
+
+
+def _parse_pair(text, name, uniform=False):
+    """
+    Convierte "a,b" en una tupla de dos flotantes. Si uniform es True (escala uniforme), un
+    solo valor se usa en ambos ejes; la traslación y el pivote necesitan siempre los dos.
+    """
+    values = [float(value) for value in text.split(",")]
+    if uniform and len(values) == 1:
+        values *= 2
+    if len(values) != 2:
+        raise ValueError(f"Se esperaban 2 valores para {name}: {text!r}")
+    return tuple(values)
+
+
+def parse_pipeline(text):
+    """
+    Convierte el texto de una cadena de etapas en un Pipeline.
+
+    Parámetros:
+    - text: Texto con la sintaxis "rotar 45 @ 1,1; escalar 2,0.5; trasladar 3,4" (ángulos en grados).
+
+    Retorna:
+    - Pipeline con las etapas en el mismo orden.
+
+    Lanza:
+    - ValueError si alguna etapa no es válida.
+    """
+    pipeline = Pipeline()
+    for stage in text.split(";"):
+        if not stage.strip():
+            continue
+        body, _, pivot = stage.partition("@")
+        word, _, params = body.strip().partition(" ")
+        name = STAGE_NAMES.get(word.lower())
+        if name is None:
+            raise ValueError(f"Operación desconocida: {word!r}")
+
+        params = params.strip()
+        if name == "rotation":
+            values = (np.radians(float(params)),)
+        elif name == "reflection":
+            if params.lower() not in REFLECTIONS:
+                raise ValueError(f"Tipo de reflexión desconocido: {params!r}")
+            values = (REFLECTIONS[params.lower()],)
+        else:
+            values = _parse_pair(params, name, uniform=name == "scale")
+        pipeline.add(name, *values, pivot=_parse_pair(pivot, "el pivote") if pivot.strip() else None)
+    return pipeline
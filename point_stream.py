@@ -0,0 +1,242 @@
+# Importar las bibliotecas necesarias
+import json  # Para leer la configuración que acompaña a los puntos
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import precision  # Precisión de los vértices (float64 o float32)
+
+# Tamaño del bloque leído del archivo en cada paso (bytes)
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+# Códigos de los caracteres que delimitan la estructura JSON
+QUOTE, BACKSLASH, COLON, COMMA = ord('"'), ord("\\"), ord(":"), ord(",")
+OPEN_BRACKETS, CLOSE_BRACKETS = (ord("["), ord("{")), (ord("]"), ord("}"))
+
+# Tabla para convertir corchetes y comas en espacios antes de separar los números
+SEPARATORS = bytes.maketrans(b"[],", b"   ")
+
+# Códigos de los caracteres que separan los números dentro de "points" (espacios, comas y corchetes)
+SEPARATOR_CODES = np.frombuffer(b" \t\r\n[],", dtype=np.uint8)
+
+
+class PointStream:
+    """
+    Lector incremental de archivos JSON de trabajo.
+
+    El arreglo "points" se recorre por bloques y se convierte directamente a arreglos con la precisión del proyecto,
+    sin construir la lista de listas de Python; el resto del archivo (rotación, escala, etc.)
+    se conserva como texto y se interpreta con json al final.
+    """
+
+    def __init__(self, filename, block_size=DEFAULT_BLOCK_SIZE):
+        """
+        Inicializa el lector.
+
+        Parámetros:
+        - filename: Ruta del archivo JSON.
+        - block_size: Bytes leídos en cada bloque.
+        """
+        self.filename = filename
+        self.block_size = block_size
+        self.config = None  # Configuración sin los puntos (disponible al terminar la lectura)
+        self.count = 0  # Número de puntos leídos
+
+    def chunks(self, parse=True):
+        """
+        Recorre el archivo y entrega los puntos por bloques.
+
+        Parámetros:
+        - parse: Si es False, solo se cuentan los puntos (útil para conocer la configuración).
+
+        Retorna:
+        - Generador de arreglos (k, 2) de puntos.
+        """
+        self._reset()
+        with open(self.filename, "rb") as file:
+            while True:
+                block = file.read(self.block_size)
+                if not block:
+                    break
+                chunk = self._feed(block, parse)
+                if chunk is not None and len(chunk):
+                    yield chunk
+
+        if self._in_points or self._depth != 0:
+            raise ValueError("El archivo JSON está incompleto.")
+        self.config = json.loads(self._rest.decode("utf-8"))
+
+    def scan(self):
+        """
+        Recorre el archivo sin guardar los puntos.
+
+        Retorna:
+        - config: Configuración del archivo (con "points" vacío).
+        - count: Número de puntos del archivo.
+        """
+        for _ in self.chunks(parse=False):
+            pass
+        return self.config, self.count
+
+    def _reset(self):
+        """
+        Reinicia el estado del analizador.
+        """
+        self.config, self.count = None, 0
+        self._rest = bytearray()  # Texto del archivo excepto el contenido de "points"
+        self._pending = b""  # Fragmento de puntos incompleto del bloque anterior
+        self._depth = 0  # Profundidad de anidamiento fuera de "points"
+        self._in_points = False
+        self._in_string = False
+        self._escape = False
+        self._string = bytearray()
+        self._last_string = None
+        self._key = None  # Clave de nivel superior cuyo valor se está leyendo
+
+    def _feed(self, block, parse):
+        """
+        Procesa un bloque del archivo.
+
+        Parámetros:
+        - block: Bytes leídos.
+        - parse: Si es True, convierte los puntos a números.
+
+        Retorna:
+        - Arreglo (k, 2) con los puntos completos del bloque, o None.
+        """
+        chunks = []
+        while block:
+            if self._in_points:
+                chunk, block = self._feed_points(block, parse)
+                if chunk is not None:
+                    chunks.append(chunk)
+            else:
+                block = self._feed_structure(block)
+
+        if not chunks:
+            return None
+        return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+    def _feed_structure(self, block):
+        """
+        Recorre el texto fuera de "points" hasta encontrar el inicio del arreglo de puntos.
+
+        Parámetros:
+        - block: Bytes por procesar.
+
+        Retorna:
+        - Bytes restantes del bloque (a partir del contenido de "points"), o b"".
+        """
+        for i, byte in enumerate(block):
+            self._rest.append(byte)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif byte == BACKSLASH:
+                    self._escape = True
+                elif byte == QUOTE:
+                    self._in_string = False
+                    self._last_string = bytes(self._string)
+                else:
+                    self._string.append(byte)
+            elif byte == QUOTE:
+                self._in_string = True
+                self._string = bytearray()
+            elif byte in OPEN_BRACKETS:
+                self._depth += 1
+                if byte == OPEN_BRACKETS[0] and self._depth == 2 and self._key == b"points":
+                    self._in_points = True
+                    return block[i + 1:]
+            elif byte in CLOSE_BRACKETS:
+                self._depth -= 1
+            elif byte == COLON and self._depth == 1:
+                self._key = self._last_string
+            elif byte == COMMA and self._depth == 1:
+                self._key = None
+        return b""
+
+    def _feed_points(self, block, parse):
+        """
+        Convierte los pares completos del contenido de "points" en un arreglo.
+
+        Parámetros:
+        - block: Bytes por procesar (dentro del arreglo de puntos).
+        - parse: Si es True, convierte los puntos a números.
+
+        Retorna:
+        - chunk: Arreglo (k, 2) de puntos completos, o None.
+        - rest: Bytes posteriores al final del arreglo de puntos, o b"".
+        """
+        data = self._pending + block
+        codes = np.frombuffer(data, dtype=np.uint8)
+        depth = np.cumsum((codes == OPEN_BRACKETS[0]).astype(np.int8) - (codes == CLOSE_BRACKETS[0]), dtype=np.int64)
+        if depth.size and depth.max() > 1:
+            raise ValueError("Cada punto debe ser un par [x, y].")
+
+        closed = np.flatnonzero(depth < 0)
+        if closed.size:
+            # Se encontró el corchete que cierra "points": el resto vuelve al recorrido normal
+            end = closed[0]
+            content, rest = data[:end], data[end:]
+            self._pending, self._in_points = b"", False
+        else:
+            pair_ends = np.flatnonzero((depth == 0) & (codes == CLOSE_BRACKETS[0]))
+            end = pair_ends[-1] + 1 if pair_ends.size else 0
+            content, rest = data[:end], b""
+            self._pending = data[end:]
+
+        pairs = content.count(b"]")
+        self.count += pairs
+        if not parse or not pairs:
+            return None, rest
+
+        values = np.array(content.translate(SEPARATORS).split(), dtype=precision.get_dtype())
+        if len(values) != 2 * pairs or not _pairs_well_formed(codes[:len(content)], depth[:len(content)]):
+            raise ValueError("Cada punto debe ser un par [x, y].")
+        return values.reshape(-1, 2), rest
+
+
+def _pairs_well_formed(codes, depth):
+    """
+    Indica si cada par del contenido tiene exactamente una coma y un número a cada lado de ella
+    (contar los números no basta: [[1, 2, 3], [4]] también tiene cuatro).
+
+    Parámetros:
+    - codes: Códigos de los bytes del contenido, formado por pares completos.
+    - depth: Profundidad de corchetes de cada byte (1 dentro de un par).
+    """
+    opens = np.flatnonzero(codes == OPEN_BRACKETS[0])
+    closes = np.flatnonzero(codes == CLOSE_BRACKETS[0])
+    commas = np.flatnonzero((codes == COMMA) & (depth == 1))
+    if len(commas) != len(opens) or np.any(commas <= opens) or np.any(commas >= closes):
+        return False
+    separator = np.isin(codes, SEPARATOR_CODES)
+    starts = ~separator
+    starts[1:] &= separator[:-1]  # Inicio de un número: el byte anterior es un separador
+    tokens = np.cumsum(starts)
+    return bool(np.all(tokens[commas] - tokens[opens] == 1) and np.all(tokens[closes] - tokens[commas] == 1))
+
+
+def load_points(filename, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Lee los puntos de un archivo JSON en un búfer (con la precisión del proyecto) que crece por duplicación.
+
+    Parámetros:
+    - filename: Ruta del archivo JSON.
+    - block_size: Bytes leídos en cada bloque.
+
+    Retorna:
+    - points: Arreglo (N, 2) de puntos.
+    - config: Configuración del archivo (con "points" vacío).
+    """
+    stream = PointStream(filename, block_size)
+    dtype = precision.get_dtype()
+    buffer, count = np.empty((1024, 2), dtype=dtype), 0
+    for chunk in stream.chunks():
+        if count + len(chunk) > len(buffer):
+            grown = np.empty((max(2 * len(buffer), count + len(chunk)), 2), dtype=dtype)
+            grown[:count] = buffer[:count]
+            buffer = grown
+        buffer[count:count + len(chunk)] = chunk
+        count += len(chunk)
+    # Se recorta el búfer en el lugar (sin copiar): devolver buffer[:count] mantendría vivo el espacio sobrante.
+    # No hay vistas del búfer, así que no hace falta la verificación de referencias.
+    buffer.resize((count, 2), refcheck=False)
+    return buffer, stream.config
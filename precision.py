@@ -0,0 +1,70 @@
+# Importar las bibliotecas necesarias
+import os  # Para leer la precisión inicial del entorno
+from contextlib import contextmanager  # Para cambiar la precisión solo dentro de un bloque
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+
+# Precisión de los vértices en todo el proyecto: los lectores de archivos, las figuras, el núcleo
+# de transformaciones, los resultados y los archivos exportados crean sus arreglos con este tipo.
+# Con float32 los vértices ocupan la mitad de memoria (y de ancho de banda); las matrices se
+# siguen componiendo en float64 y solo se convierten al aplicarlas.
+
+# Precisiones admitidas
+PRECISIONS = {"float64": np.dtype(np.float64), "float32": np.dtype(np.float32)}
+
+# Variable de entorno con la precisión inicial ("float64" o "float32")
+PRECISION_VARIABLE = "TRANSFORM_PRECISION"
+
+
+def _parse(precision):
+    """
+    Convierte un nombre o tipo de NumPy en una de las precisiones admitidas.
+    """
+    dtype = np.dtype(PRECISIONS.get(precision, precision))
+    if dtype not in PRECISIONS.values():
+        raise ValueError(f"Precisión no admitida: {precision} (use float64 o float32)")
+    return dtype
+
+
+_dtype = _parse(os.environ.get(PRECISION_VARIABLE, "float64"))  # Precisión actual
+
+
+def get_dtype():
+    """
+    Tipo de NumPy de los vértices (np.float64 o np.float32).
+    """
+    return _dtype
+
+
+def set_precision(precision):
+    """
+    Cambiar la precisión de todo el proyecto.
+
+    Parámetros:
+    - precision: "float64", "float32" o el tipo de NumPy correspondiente.
+
+    Retorna:
+    - Tipo de NumPy de la precisión anterior.
+    """
+    global _dtype
+    previous, _dtype = _dtype, _parse(precision)
+    return previous
+
+
+@contextmanager
+def using(precision):
+    """
+    Usar otra precisión solo dentro de un bloque with.
+    """
+    previous = set_precision(precision)
+    try:
+        yield get_dtype()
+    finally:
+        set_precision(previous)
+
+
+def as_vertices(vertices):
+    """
+    Convierte vértices (listas, enteros u otro tipo de flotante) a un arreglo (N, 2) con la
+    precisión actual; si ya tienen ese tipo no se copian.
+    """
+    return np.asarray(vertices, dtype=_dtype).reshape(-1, 2)
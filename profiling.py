@@ -0,0 +1,236 @@
+# Importar las bibliotecas necesarias
+import atexit  # Para escribir la traza al terminar el programa
+import json  # Formato de la traza (Chrome trace: chrome://tracing o ui.perfetto.dev)
+import os  # Para leer la variable de entorno y el identificador del proceso
+import threading  # Para registrar intervalos desde varios hilos
+import time  # Reloj de alta resolución
+from collections import deque  # Eventos de la traza, con un máximo
+from contextlib import nullcontext  # Intervalo vacío cuando la medición está desactivada
+
+# Medición de tiempos por intervalos con nombre ("load_from_file", "transform:rotation", "plot", ...).
+# Desactivada, span() solo consulta una variable y devuelve siempre el mismo contexto vacío, así
+# los intervalos pueden quedarse en el código sin costo apreciable. Activada, cada intervalo suma
+# a las estadísticas por nombre (ver stats()) y, si se pidió una traza, se guarda como evento.
+
+# Variable de entorno con la ruta de la traza JSON; si está definida, la medición se activa al
+# importar el módulo y la traza se escribe al terminar el programa. El proceso principal escribe
+# en esa ruta; los procesos que crea (por ejemplo, los que guardan imágenes o procesan trabajos)
+# escriben su propia traza con su identificador en el nombre ("traza.<pid>.json")
+TRACE_VARIABLE = "TRANSFORM_TRACE"
+
+# Número máximo de eventos guardados para la traza (se descartan los más antiguos)
+MAX_EVENTS = 1 << 20
+
+_NULL_SPAN = nullcontext()  # Contexto compartido por todos los intervalos cuando la medición está desactivada
+_enabled = False  # Si es True, los intervalos se miden
+_trace_file = None  # Ruta de la traza de este proceso, o None si solo se llevan estadísticas
+_trace_base = None  # Ruta indicada al activar la traza (sin el identificador del proceso)
+_origin = time.perf_counter_ns()  # Instante cero de la traza
+_lock = threading.Lock()  # Protege las estadísticas y los eventos
+_stats = {}  # Nombre -> [llamadas, total en ns, máximo en ns]
+_events = deque(maxlen=MAX_EVENTS)  # Eventos "X" (intervalo completo) de la traza
+_threads = {}  # Identificador del hilo -> nombre (metadatos de la traza)
+_registered = False  # Si es True, la traza ya se escribe al terminar el programa
+_owner = None  # Identificador del proceso que escribe la traza principal (los procesos creados con fork lo heredan)
+
+
+class _Span:
+    """
+    Intervalo medido: registra su duración al salir del bloque with.
+    """
+
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        record(self.name, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+
+def span(name, **args):
+    """
+    Intervalo con nombre para usar en un bloque with.
+
+    Parámetros:
+    - name: Nombre del intervalo (agrupa las estadísticas).
+    - args: Datos adicionales que se guardan en la traza (por ejemplo, el número de vértices).
+
+    Retorna:
+    - Contexto que mide el bloque (o uno vacío si la medición está desactivada).
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def record(name, start, end, args=None):
+    """
+    Registrar un intervalo medido por separado (por ejemplo, uno que termina en un callback).
+
+    Parámetros:
+    - name: Nombre del intervalo.
+    - start, end: Instantes de inicio y fin según time.perf_counter_ns().
+    - args: Diccionario opcional con datos adicionales para la traza.
+    """
+    if not _enabled:
+        return
+    duration = end - start
+    with _lock:
+        entry = _stats.get(name)
+        if entry is None:
+            _stats[name] = [1, duration, duration]
+        else:
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] = max(entry[2], duration)
+        if _trace_file is not None:
+            thread = threading.current_thread()
+            _threads.setdefault(thread.ident, thread.name)
+            _events.append({
+                "name": name, "ph": "X", "ts": (start - _origin) / 1000, "dur": duration / 1000,
+                "pid": os.getpid(), "tid": thread.ident, "args": args or {},
+            })
+
+
+def now():
+    """
+    Instante actual para record() (time.perf_counter_ns()).
+    """
+    return time.perf_counter_ns()
+
+
+def is_enabled():
+    """
+    Indica si los intervalos se están midiendo.
+    """
+    return _enabled
+
+
+def enable(trace_file=None):
+    """
+    Activar la medición.
+
+    Parámetros:
+    - trace_file: Ruta donde se escribe la traza JSON al terminar el programa, o None para
+      llevar solo las estadísticas (sin guardar eventos).
+    """
+    global _enabled, _trace_file, _trace_base, _registered
+    _enabled = True
+    if trace_file is not None:
+        _trace_base = trace_file
+        _trace_file = _trace_path(trace_file)
+        if not _registered:
+            atexit.register(_write_at_exit)
+            _registered = True
+
+
+def disable():
+    """
+    Desactivar la medición (si hay una traza activa, se sigue escribiendo al terminar).
+    """
+    global _enabled
+    _enabled = False
+
+
+def reset_process():
+    """
+    Preparar la medición en un proceso creado con fork: descarta las estadísticas y los
+    eventos heredados del proceso principal y, si hay una traza activa, usa la ruta propia
+    de este proceso (ver flush, porque estos procesos suelen terminar sin ejecutar atexit).
+    """
+    global _lock
+    _lock = threading.Lock()  # El candado heredado pudo quedar tomado por otro hilo del proceso principal
+    reset()
+    _threads.clear()
+    if _trace_base is not None:
+        enable(_trace_base)
+
+
+def _trace_path(path):
+    """
+    Ruta de la traza de este proceso: la indicada para el proceso principal, y con el
+    identificador del proceso agregado para los procesos que este crea (con fork heredan
+    _owner; con spawn el módulo se importa de nuevo, y multiprocessing ya les dio otro nombre).
+    """
+    global _owner
+    if _owner is None:
+        import multiprocessing  # Importación diferida: solo al activar una traza
+        if multiprocessing.current_process().name == "MainProcess":
+            _owner = os.getpid()
+    if _owner == os.getpid():
+        return path
+    root, extension = os.path.splitext(path)
+    return f"{root}.{os.getpid()}{extension}"
+
+
+def stats():
+    """
+    Estadísticas por nombre de intervalo, ordenadas por tiempo total (de mayor a menor).
+
+    Retorna:
+    - Diccionario {nombre: {"calls", "total_ms", "mean_ms", "max_ms"}}.
+    """
+    with _lock:
+        items = [(name, list(entry)) for name, entry in _stats.items()]
+    items.sort(key=lambda item: item[1][1], reverse=True)
+    return {
+        name: {"calls": calls, "total_ms": total / 1e6, "mean_ms": total / calls / 1e6, "max_ms": longest / 1e6}
+        for name, (calls, total, longest) in items
+    }
+
+
+def reset():
+    """
+    Descartar las estadísticas y los eventos registrados.
+    """
+    with _lock:
+        _stats.clear()
+        _events.clear()
+
+
+def write_trace(path=None):
+    """
+    Escribir los eventos registrados en formato Chrome trace.
+
+    Parámetros:
+    - path: Ruta del archivo (por defecto, la indicada al activar la medición).
+
+    Retorna:
+    - Ruta del archivo escrito.
+    """
+    path = path or _trace_file
+    if path is None:
+        raise ValueError(f"No hay ruta para la traza (defina {TRACE_VARIABLE} o use enable(trace_file=...)).")
+    with _lock:
+        events = list(_events)
+        threads = dict(_threads)
+    pid = os.getpid()
+    metadata = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}} for tid, name in threads.items()]
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, file, default=str)
+    return path
+
+
+def flush():
+    """
+    Escribir la traza de este proceso si la medición tiene una traza activa y hay eventos
+    (para procesos que terminan sin ejecutar atexit, como los de un grupo creado con fork).
+    """
+    if _trace_file is not None and _events:
+        write_trace()
+
+
+def _write_at_exit():
+    flush()
+
+
+if os.environ.get(TRACE_VARIABLE):
+    enable(os.environ[TRACE_VARIABLE])
@@ -0,0 +1,445 @@
+# Importar las bibliotecas necesarias
+import hashlib  # Para identificar el contenido dibujado
+import os  # Para comprobar si el último archivo guardado sigue existiendo
+import shutil  # Para copiar el último archivo guardado cuando el contenido no cambió
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import transform_kernel as kernel  # Figuras cerradas sin copiar los vértices
+import profiling  # Medición de tiempos por intervalos
+from lod import LODCache  # Simplificación de contornos según la vista
+
+
+def _as_float(vertices):
+    """
+    Devuelve los vértices como arreglo de flotantes; solo se copian si no lo son.
+    """
+    vertices = np.asarray(vertices)
+    return vertices if vertices.dtype.kind == "f" else vertices.astype(float)
+
+
+class Renderer:
+    """
+    Dibujante persistente: conserva una sola figura y actualiza sus artistas en lugar de
+    crear una figura nueva en cada gráfica o cada guardado.
+
+    Cada dibujo se identifica por el contenido de sus resultados: si no cambió, no se vuelve
+    a dibujar, y guardar lo ya mostrado reutiliza la imagen del lienzo.
+    """
+
+    def __init__(self, figsize=(8, 8), fill=True, marker=None, title=None, grid=False, interactive=True):
+        """
+        Inicializa el dibujante (la figura se crea la primera vez que se dibuja).
+
+        Parámetros:
+        - figsize: Tamaño de la figura en pulgadas.
+        - fill: Si es True, cada figura se rellena y su contorno se dibuja con línea negra discontinua;
+          si es False, solo se dibuja el contorno con el color de la figura.
+        - marker: Marcador de los vértices en el contorno (por ejemplo, "o").
+        - title: Título de la gráfica.
+        - grid: Si es True, se muestra la cuadrícula.
+        - interactive: Si es True, la figura se administra con pyplot para poder mostrarla;
+          si es False, se usa una figura independiente (motor Agg, sin servidor gráfico).
+        """
+        self.figsize = figsize
+        self.fill = fill
+        self.marker = marker
+        self.title = title
+        self.grid = grid
+        self.interactive = interactive
+        self.fig = None  # Figura persistente
+        self.ax = None  # Ejes persistentes
+        self.artists = {}  # Artistas por etiqueta: (relleno o None, contorno)
+        self.scatter = None  # Colección de puntos sueltos (vértices personalizados)
+        self.render_key = None  # Identificador del contenido dibujado actualmente
+        self._canvas_key = None  # Contenido presente en la imagen del lienzo (tras su último dibujo)
+        self._saved = None  # (identificador, ruta) del último guardado
+        self._content = ([], None, None)  # Último contenido dibujado: (figuras, límites, puntos)
+        self.canvas = None  # Lienzo de Tkinter cuando la figura está incrustada en la ventana
+        self.full_data = {}  # Contornos cerrados a resolución completa, por etiqueta
+        self.lod = LODCache()  # Versiones simplificadas por vista
+        self._updating = False  # Evita recalcular la simplificación mientras se actualiza el dibujo
+
+    def _ensure_figure(self):
+        """
+        Crea la figura si no existe o si la ventana de pyplot fue cerrada.
+        """
+        if self.fig is not None:
+            if not self.interactive or self.canvas is not None:
+                return
+            import matplotlib.pyplot as plt
+            if plt.fignum_exists(self.fig.number):
+                return
+
+        if self.interactive:
+            import matplotlib.pyplot as plt  # Importación diferida: solo para mostrar ventanas
+            self.fig = plt.figure(figsize=self.figsize)
+        else:
+            from matplotlib.figure import Figure
+            self.fig = Figure(figsize=self.figsize)
+        self._setup_axes()
+
+    def _setup_axes(self):
+        """
+        Crea los ejes de una figura nueva y reinicia el estado de dibujo.
+        """
+        self.ax = self.fig.subplots()
+        self.artists, self.scatter = {}, None
+        self.render_key = self._canvas_key = None
+        self.full_data = {}
+        self.lod.invalidate()
+        self.fig.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+        self.fig.canvas.mpl_connect("resize_event", self._on_view_change)
+        self.ax.callbacks.connect("xlim_changed", self._on_view_change)
+        self.ax.callbacks.connect("ylim_changed", self._on_view_change)
+
+    def _on_view_change(self, event):
+        """
+        Recalcular la simplificación de los contornos cuando cambia la vista (zoom, desplazamiento o tamaño).
+        """
+        if not self._updating:
+            self._apply_lod()
+
+    def _apply_lod(self):
+        """
+        Colocar en cada artista la versión de su contorno adecuada a la vista actual.
+        """
+        if not self.full_data:
+            return
+        self._canvas_key = None  # Los contornos cambian: la imagen del lienzo queda desactualizada hasta el próximo dibujo
+        self.ax.apply_aspect()
+        bbox = self.ax.get_window_extent()
+        xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
+        for label, closed in self.full_data.items():
+            reduced = self.lod.reduce(label, closed, xlim, ylim, bbox.width, bbox.height)
+            polygon, line = self.artists[label]
+            if polygon is not None:
+                polygon.set_xy(reduced)
+            line.set_data(reduced[:, 0], reduced[:, 1])
+
+    def embed(self, master, figsize=None):
+        """
+        Incrustar la figura en una ventana de Tkinter en lugar de abrir ventanas de pyplot.
+
+        Parámetros:
+        - master: Contenedor de Tkinter donde se coloca el lienzo.
+        - figsize: Tamaño de la figura en pantalla (por defecto, el del dibujante); las imágenes
+          exportadas conservan el tamaño del dibujante.
+
+        Retorna:
+        - Widget de Tkinter del lienzo (para ubicarlo con grid o pack).
+        """
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg  # Importación diferida: solo con interfaz
+        from matplotlib.figure import Figure
+
+        self.fig = Figure(figsize=figsize or self.figsize)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=master)
+        self._setup_axes()
+        return self.canvas.get_tk_widget()
+
+    def _on_canvas_draw(self, event):
+        """
+        Registrar qué contenido quedó en la imagen del lienzo después de dibujarlo.
+        """
+        self._canvas_key = self.render_key
+
+    @staticmethod
+    def _content_key(shapes, limits, points, versions=None):
+        """
+        Calcula un identificador del contenido a dibujar (vértices, etiquetas, colores y límites).
+
+        Con versiones (ver ResultSet.version) cada figura se identifica por su arreglo y su
+        versión, sin leer los vértices; sin ellas se resume el contenido de cada arreglo.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for index, (label, vertices, color) in enumerate(shapes):
+            digest.update(repr((label, color, vertices.shape, vertices.dtype.str)).encode("utf-8"))
+            if versions is None:
+                digest.update(np.ascontiguousarray(vertices).data)
+            else:
+                # El arreglo sigue vivo en self._content, así su id no se reutiliza mientras la clave esté vigente
+                digest.update(repr((id(vertices), versions[index])).encode("utf-8"))
+        if points is not None:
+            label, vertices, color = points
+            vertices = np.ascontiguousarray(vertices, dtype=float)
+            digest.update(repr((label, color, vertices.shape)).encode("utf-8"))
+            digest.update(vertices.data)
+        digest.update(repr(None if limits is None else tuple(float(v) for v in limits)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _default_color(self, index):
+        """
+        Obtiene el color del ciclo de matplotlib para la figura número index.
+        """
+        from matplotlib import rcParams
+        colors = rcParams["axes.prop_cycle"].by_key().get("color", ["C0"])
+        return colors[index % len(colors)]
+
+    def draw(self, shapes, limits=None, points=None, versions=None, boxes=None):
+        """
+        Actualiza la figura con las figuras indicadas, modificando los artistas existentes.
+        Si el contenido es el mismo que ya está dibujado, no se hace nada.
+
+        Parámetros:
+        - shapes: Iterable de tuplas (etiqueta, vértices, color o None).
+        - limits: Tupla (min_x, max_x, min_y, max_y) de los límites de los ejes, o None para no cambiarlos.
+        - points: Tupla opcional (etiqueta, vértices, color) que se dibuja como puntos sueltos.
+        - versions: Lista opcional con la versión de cada figura (ver ResultSet.version); si se
+          indica, comprobar si el contenido cambió no lee los vértices.
+        - boxes: Lista opcional con la caja (min_x, max_x, min_y, max_y) de cada figura (ver
+          ResultSet.box); solo se usa sin límites explícitos, para ajustar los ejes a los datos
+          sin recorrer los vértices.
+
+        Retorna:
+        - Figura de matplotlib actualizada.
+        """
+        with profiling.span("plot"):
+            return self._draw(shapes, limits, points, versions, boxes)
+
+    def draw_results(self, results, limits=None, label=str, points=None):
+        """
+        Dibujar los resultados de un ResultSet (ver draw), usando sus versiones y sus cajas.
+
+        Parámetros:
+        - results: ResultSet con las figuras a dibujar.
+        - limits: Tupla (min_x, max_x, min_y, max_y), o None para no cambiar los límites.
+        - label: Función que convierte el nombre de cada resultado en su etiqueta.
+        - points: Tupla opcional (etiqueta, vértices, color) que se dibuja como puntos sueltos.
+
+        Retorna:
+        - Figura de matplotlib actualizada.
+        """
+        versions = [results.version(name) for name in results]
+        boxes = None if limits is not None else [results.box(name) for name in results]
+        return self.draw(results.shapes(label), limits, points, versions, boxes)
+
+    def _draw(self, shapes, limits, points, versions, boxes):
+        """
+        Actualiza la figura (ver draw, que además mide el tiempo del dibujo).
+        """
+        self._ensure_figure()
+        # Los arreglos de flotantes se usan tal cual (sin copiarlos), así closed puede cerrarlos con una vista
+        shapes = [(label, _as_float(vertices), color) for label, vertices, color in shapes]
+        key = self._content_key(shapes, limits, points, versions)
+        if key == self.render_key:
+            return self.fig
+
+        ax = self.ax
+        self._updating = True
+        self.lod.invalidate()
+        if limits is None:
+            # update_datalim solo amplía los límites: se parte de cero para que puedan reducirse
+            ax.dataLim.set_points(np.array([[np.inf, np.inf], [-np.inf, -np.inf]]))
+            ax.ignore_existing_data_limits = True
+        labels = []
+        for index, (label, vertices, color) in enumerate(shapes):
+            closed = kernel.closed(vertices)  # Cerrar la figura (vista si el arreglo tiene espacio reservado)
+            labels.append(label)
+            self.full_data[label] = closed
+            if label not in self.artists:
+                # Los artistas se crean con un solo vértice; _apply_lod coloca el contorno que corresponde a la vista
+                seed = closed[:1]
+                color = color or self._default_color(len(self.artists))
+                if self.fill:
+                    polygon = ax.fill(seed[:, 0], seed[:, 1], alpha=0.5, label=label, color=color)[0]
+                    line = ax.plot(seed[:, 0], seed[:, 1], linestyle="--", color="black", marker=self.marker)[0]
+                else:
+                    polygon = None
+                    line = ax.plot(seed[:, 0], seed[:, 1], label=label, color=color, marker=self.marker)[0]
+                self.artists[label] = (polygon, line)
+            else:
+                polygon, line = self.artists[label]
+                if polygon is not None and color:
+                    polygon.set_color(color)
+                elif color:
+                    line.set_color(color)
+            if limits is None and len(vertices):
+                # Los límites explícitos no dependen de los datos; sin ellos se usan las cajas conocidas
+                box = boxes[index] if boxes is not None else None
+                if box is None:
+                    (min_x, min_y), (max_x, max_y) = vertices.min(axis=0), vertices.max(axis=0)
+                else:
+                    min_x, max_x, min_y, max_y = box
+                ax.update_datalim([(min_x, min_y), (max_x, max_y)])
+
+        # Quitar las figuras que ya no forman parte del resultado
+        for label in [label for label in self.artists if label not in labels]:
+            self.full_data.pop(label, None)
+            for artist in self.artists.pop(label):
+                if artist is not None:
+                    artist.remove()
+
+        if points is not None and len(points[1]):
+            label, vertices, color = points
+            vertices = np.asarray(vertices, dtype=float)
+            if self.scatter is None:
+                self.scatter = ax.scatter(vertices[:, 0], vertices[:, 1], color=color, label=label)
+            else:
+                self.scatter.set_offsets(vertices)
+            if limits is None:
+                ax.update_datalim(vertices)
+        elif self.scatter is not None:
+            self.scatter.remove()
+            self.scatter = None
+
+        if limits is not None:
+            min_x, max_x, min_y, max_y = limits
+            ax.set_xlim(min_x, max_x)
+            ax.set_ylim(min_y, max_y)
+        else:
+            ax.autoscale_view()
+        ax.set_aspect("equal")
+        if self.grid:
+            ax.grid(True, linestyle="--", linewidth=0.5)
+        if self.title:
+            ax.set_title(self.title)
+        ax.legend()
+        self._updating = False
+        self._apply_lod()
+        self.render_key = key
+        self._content = (shapes, limits, points)
+        return self.fig
+
+    def show(self):
+        """
+        Mostrar la figura: si está incrustada se pide un redibujo diferido del lienzo,
+        si no, se abre la ventana de pyplot.
+        """
+        if self.canvas is not None:
+            self.canvas.draw_idle()
+            return
+        import matplotlib.pyplot as plt
+        plt.show()
+
+    def save(self, file_name, reuse=True):
+        """
+        Guardar la figura actual como archivo de imagen (sin crear otra figura).
+
+        Si el contenido no cambió desde el último guardado y ese archivo sigue existiendo, se
+        copia a file_name sin volver a dibujar; si el lienzo ya muestra el contenido actual y su
+        imagen es la que se exportaría (ver _canvas_matches_export), se guarda sin volver a dibujar.
+
+        Parámetros:
+        - file_name: Ruta del archivo.
+        - reuse: Si es False, siempre se dibuja y se escribe file_name (aunque el contenido no haya cambiado).
+
+        Retorna:
+        - Ruta del archivo guardado (file_name).
+        """
+        if self.fig is None:
+            raise ValueError("No hay ninguna gráfica dibujada para guardar.")
+        if reuse and self._copy_saved(file_name):
+            return file_name
+
+        canvas = self.fig.canvas
+        with profiling.span("savefig", file=str(file_name)):
+            if self._canvas_key == self.render_key and self._canvas_matches_export():
+                from matplotlib import image
+                image.imsave(file_name, np.asarray(canvas.buffer_rgba()), dpi=self.fig.dpi)
+            else:
+                self.fig.savefig(file_name)
+        self._saved = (self.render_key, file_name)
+        return file_name
+
+    def _canvas_matches_export(self):
+        """
+        Indica si la imagen del lienzo es la que produciría savefig: solo para figuras Agg no
+        incrustadas (el lienzo de Tkinter tiene el tamaño del widget), con el tamaño del
+        dibujante a la resolución de exportación y sin recorte del borde.
+        """
+        from matplotlib import rcParams
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        canvas = self.fig.canvas
+        if self.canvas is not None or not isinstance(canvas, FigureCanvasAgg) or rcParams["savefig.bbox"] is not None:
+            return False
+        dpi = self.fig.dpi if rcParams["savefig.dpi"] == "figure" else rcParams["savefig.dpi"]
+        width, height = self.figsize
+        buffer = canvas.buffer_rgba()
+        return buffer.shape[:2] == (round(height * dpi), round(width * dpi))
+
+    def _copy_saved(self, file_name):
+        """
+        Si el contenido no cambió desde el último guardado y ese archivo sigue existiendo,
+        copiarlo a file_name.
+
+        Retorna:
+        - True si file_name ya contiene la gráfica actual.
+        """
+        if self._saved is None or self._saved[0] != self.render_key or not os.path.exists(self._saved[1]):
+            return False
+        if os.path.abspath(self._saved[1]) != os.path.abspath(file_name):
+            shutil.copyfile(self._saved[1], file_name)
+        self._saved = (self.render_key, file_name)
+        return True
+
+    def spec(self, file_name):
+        """
+        Describe el contenido actual como una especificación que se puede dibujar en otro proceso.
+
+        Los vértices se copian: el grupo de procesos los serializa más tarde, en otro hilo, y
+        mientras tanto la interfaz puede reescribir los mismos arreglos (ResultSet.add_transformed
+        con reuse=True), lo que guardaría una imagen a medio actualizar.
+
+        Parámetros:
+        - file_name: Ruta del archivo donde se guardará la imagen.
+
+        Retorna:
+        - Diccionario con la especificación de la figura (ver export_pool).
+        """
+        shapes, limits, points = self._content
+        shapes = [(label, np.array(vertices, copy=True), color) for label, vertices, color in shapes]
+        if points is not None:
+            label, vertices, color = points
+            points = (label, np.array(vertices, copy=True), color)
+        style = {"figsize": self.figsize, "fill": self.fill, "marker": self.marker, "title": self.title, "grid": self.grid}
+        return {"file_name": file_name, "shapes": shapes, "limits": limits, "points": points, "style": style}
+
+    def save_async(self, pool, root, file_name, callback):
+        """
+        Guardar la figura actual en un proceso del grupo de exportación sin bloquear la interfaz.
+
+        Si el contenido no cambió desde el último guardado y ese archivo sigue existiendo, se
+        copia a file_name y callback se llama de inmediato.
+
+        Parámetros:
+        - pool: ExportPool que dibuja y guarda la imagen.
+        - root: Ventana de Tkinter cuyo ciclo consulta el resultado.
+        - file_name: Ruta del archivo.
+        - callback: Función callback(ruta, error) llamada en el hilo de la interfaz.
+        """
+        try:
+            copied = self._copy_saved(file_name)
+        except OSError as error:
+            callback(None, error)
+            return
+        if copied:
+            callback(file_name, None)
+            return
+
+        import export_pool
+        key = self.render_key
+        start = profiling.now()
+
+        def done(future):
+            # Desde el envío hasta el aviso en la interfaz (el dibujo en el otro proceso tiene su propia traza)
+            profiling.record("savefig (proceso)", start, profiling.now(), {"file": str(file_name)})
+            error = future.exception()
+            if error is None:
+                self._saved = (key, future.result())
+            callback(None if error else future.result(), error)
+
+        export_pool.watch(root, pool.submit(self.spec(file_name)), done)
+
+    def close(self):
+        """
+        Cerrar la figura y liberar sus recursos.
+        """
+        if self.canvas is not None:
+            self.canvas.get_tk_widget().destroy()
+            self.canvas = None
+        elif self.fig is not None and self.interactive:
+            import matplotlib.pyplot as plt
+            plt.close(self.fig)
+        self.fig, self.ax, self.artists, self.scatter = None, None, {}, None
+        self.full_data = {}
+        self.lod.invalidate()
+        self.render_key = self._canvas_key = self._saved = None
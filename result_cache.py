@@ -0,0 +1,189 @@
+# Importar las bibliotecas necesarias
+import hashlib  # Para identificar el contenido de los vértices
+from collections import OrderedDict  # Para ordenar las entradas de la menos a la más usada
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import precision  # Precisión de los vértices (float64 o float32)
+from results import from_matrices  # Colección tipada de resultados
+
+# Memoria máxima por defecto de los resultados guardados (bytes)
+DEFAULT_MAX_BYTES = 256 * 2 ** 20
+
+# Decimales con los que se comparan las matrices (absorbe el ruido de redondeo entre
+# parámetros equivalentes, por ejemplo 360° y 0°)
+MATRIX_DECIMALS = 12
+
+
+def vertices_digest(vertices):
+    """
+    Resumen del contenido de un arreglo de vértices (forma, tipo y valores), sin modificarlo.
+    """
+    array = np.ascontiguousarray(vertices)
+    digest = hashlib.blake2b(repr((array.shape, array.dtype.str)).encode("utf-8"), digest_size=16)
+    digest.update(array.data)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Caché LRU de resultados de transformaciones, acotada en bytes.
+
+    La clave combina un resumen del contenido de los vértices con las matrices de cada
+    transformación (los parámetros ya normalizados), así volver a aplicar los mismos valores,
+    o una combinación anterior, devuelve el ResultSet guardado sin recalcularlo.
+
+    La caché nunca modifica los arreglos de quien la consulta: los vértices que se pueden
+    escribir se resumen en cada consulta y se guardan como una copia propia (compartida por
+    todas las entradas con el mismo resumen). Los arreglos guardados se comparten con quien
+    los pide, así que se marcan como de solo lectura: modificarlos lanza un error en lugar de
+    corromper la caché.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Inicializa una caché vacía.
+
+        Parámetros:
+        - max_bytes: Memoria máxima de los resultados guardados; al superarla se descartan
+          los menos usados recientemente.
+        """
+        self.max_bytes = max_bytes
+        self.bytes = 0  # Memoria ocupada por los resultados guardados
+        self.hits = 0  # Consultas resueltas con un resultado guardado
+        self.misses = 0  # Consultas que tuvieron que calcularse
+        self._entries = OrderedDict()  # Clave -> (ResultSet, bytes), de la menos a la más usada
+        self._digest = None  # (arreglo inmutable, resumen) del último arreglo de solo lectura resumido
+        self._source = None  # (resumen, copia de solo lectura) de los últimos vértices originales guardados
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _immutable(array):
+        """
+        Indica si un arreglo no se puede modificar por ningún camino: ni él ni sus bases se
+        pueden escribir (un mapa de memoria u otro búfer como base cuenta como modificable).
+        """
+        while isinstance(array, np.ndarray):
+            if array.flags.writeable:
+                return False
+            array = array.base
+        return array is None
+
+    @staticmethod
+    def _freeze(array):
+        """
+        Marcar un arreglo como de solo lectura (las escrituras lanzan ValueError).
+        """
+        if isinstance(array, np.ndarray):
+            array.flags.writeable = False
+
+    def digest(self, vertices):
+        """
+        Resumen del contenido de un arreglo de vértices (forma, tipo y valores).
+
+        El arreglo no se modifica. Solo se recuerda el resumen de los arreglos inmutables (ver
+        _immutable); los demás podrían cambiar sin cambiar de identidad y se resumen cada vez.
+        """
+        if self._digest is not None and self._digest[0] is vertices:
+            return self._digest[1]
+        digest = vertices_digest(vertices)
+        if self._immutable(vertices):
+            self._digest = (vertices, digest)
+        return digest
+
+    def _frozen_source(self, vertices, digest):
+        """
+        Vértices originales que guarda la caché: el mismo arreglo si es inmutable, o una copia
+        de solo lectura (reutilizada mientras el resumen no cambie).
+        """
+        if self._immutable(vertices):
+            return vertices
+        if self._source is None or self._source[0] != digest:
+            copy = np.array(vertices, copy=True)
+            self._freeze(copy)
+            self._source = (digest, copy)
+        return self._source[1]
+
+    def key(self, vertices, matrices, colors=None):
+        """
+        Clave de un resultado.
+
+        Parámetros:
+        - vertices: Arreglo (N, 2) de vértices originales.
+        - matrices: Diccionario {nombre: matriz 3x3}.
+        - colors: Diccionario opcional {nombre: color}.
+
+        Retorna:
+        - Tupla usable como clave de diccionario (incluye la precisión con la que se calcula).
+        """
+        names = tuple(matrices)
+        stack = np.round(np.array([matrices[name] for name in names], dtype=float), MATRIX_DECIMALS) + 0.0  # + 0.0 unifica -0.0 y 0.0
+        colors = tuple(sorted((colors or {}).items()))
+        return self.digest(vertices), names, stack.tobytes(), colors, precision.get_dtype().str
+
+    def get(self, key):
+        """
+        Obtener un resultado guardado (y marcarlo como el más reciente), o None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, results):
+        """
+        Guardar un resultado, descartando los menos usados si se supera el límite de memoria.
+        Los resultados más grandes que el límite no se guardan.
+
+        La caché toma posesión de los arreglos del ResultSet y los marca como de solo lectura
+        (results() solo le entrega arreglos propios).
+        """
+        for vertices in results.values():
+            self._freeze(vertices)
+        size = sum(vertices.nbytes for vertices in results.values())
+        if key in self._entries:
+            self.bytes -= self._entries.pop(key)[1]
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (results, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= evicted
+
+    def results(self, vertices, matrices, colors=None):
+        """
+        Obtener el ResultSet de aplicar las matrices a los vértices, calculándolo solo si no está guardado.
+
+        Parámetros:
+        - vertices: Arreglo (N, 2) de vértices originales.
+        - matrices: Diccionario {nombre: matriz 3x3}.
+        - colors: Diccionario opcional {nombre: color}.
+
+        Retorna:
+        - ResultSet (compartido con la caché: sus arreglos son de solo lectura).
+        """
+        key = self.key(vertices, matrices, colors)
+        results = self.get(key)
+        if results is None:
+            results = from_matrices(self._frozen_source(vertices, key[0]), matrices, colors)
+            self.put(key, results)
+        return results
+
+    def stats(self):
+        """
+        Contadores de la caché: aciertos, fallos, entradas y memoria ocupada.
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self.bytes}
+
+    def clear(self):
+        """
+        Descartar todos los resultados guardados (los contadores se conservan).
+        """
+        self._entries.clear()
+        self.bytes = 0
+        self._digest = None
+        self._source = None
@@ -0,0 +1,232 @@
+# Importar las bibliotecas necesarias
+from itertools import count  # Contador de versiones de los resultados
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import parallel  # Transformación por bloques en varios hilos para arreglos grandes
+import bounds  # Cajas y envolventes de las figuras
+import precision  # Precisión de los vértices (float64 o float32)
+import profiling  # Medición de tiempos por intervalos
+
+# Vértices a partir de los cuales la impresión en la terminal se resume
+PRINT_THRESHOLD = 10
+
+# Vértices mostrados al inicio y al final de un resultado resumido
+PRINT_EDGE_ITEMS = 3
+
+# Versiones únicas entre todas las colecciones (cada vez que se agrega o reescribe un resultado)
+_versions = count(1)
+
+
+class ResultSet:
+    """
+    Colección ordenada de resultados con nombre, guardados como arreglos contiguos (N, 2)
+    junto a su color.
+
+    Dibujar, calcular límites o imprimir leen los mismos arreglos sin convertirlos a listas
+    de Python ni copiarlos. Cada resultado guarda además su caja; la de los resultados
+    transformados se obtiene de la envolvente del resultado de origen, sin recorrer sus vértices,
+    así los límites de la gráfica cuestan O(número de figuras).
+    """
+
+    def __init__(self, dtype=None):
+        """
+        Inicializa una colección vacía.
+
+        Parámetros:
+        - dtype: Tipo de los arreglos (np.float64 o np.float32; por defecto, la precisión del proyecto).
+        """
+        self.dtype = np.dtype(dtype or precision.get_dtype())
+        self._values = {}  # Nombre -> arreglo (N, 2)
+        self._colors = {}  # Nombre -> color o None
+        self._outlines = {}  # Nombre -> puntos de referencia (envolvente), calculados al pedirlos
+        self._boxes = {}  # Nombre -> caja (min_x, max_x, min_y, max_y), calculada al pedirla
+        self._owned = set()  # Resultados cuyo arreglo creó la colección (se pueden sobrescribir)
+        self._version = {}  # Nombre -> versión del contenido de su arreglo
+
+    def add(self, name, vertices, color=None, reference=None):
+        """
+        Agregar (o reemplazar) un resultado.
+
+        Parámetros:
+        - name: Nombre del resultado.
+        - vertices: Arreglo (N, 2) de vértices (solo se copia si no es contiguo o es de otro tipo).
+        - color: Color del resultado, o None para usar el ciclo de colores.
+        - reference: Puntos de referencia ya conocidos (ver bounds.outline), o None.
+
+        Retorna:
+        - Arreglo guardado.
+        """
+        vertices = np.ascontiguousarray(vertices, dtype=self.dtype)
+        if vertices.ndim != 2:
+            vertices = vertices.reshape(-1, 2)  # Un arreglo (N, 2) se guarda tal cual, sin crear otra vista
+        self._values[name] = vertices
+        self._colors[name] = color
+        self._version[name] = next(_versions)
+        self._boxes.pop(name, None)
+        self._owned.discard(name)
+        if reference is None:
+            self._outlines.pop(name, None)
+        else:
+            self._outlines[name] = reference
+        return vertices
+
+    def add_transformed(self, name, source, matrix, color=None, reuse=False):
+        """
+        Agregar el resultado de aplicar una matriz a otro resultado de la colección.
+
+        Parámetros:
+        - name: Nombre del nuevo resultado.
+        - source: Nombre del resultado de origen.
+        - matrix: Matriz homogénea 3x3.
+        - color: Color del resultado.
+        - reuse: Si es True y el resultado ya existe con el mismo tamaño (y lo creó esta
+          colección), se escribe sobre su arreglo en lugar de reservar otro; quien conserve
+          el arreglo anterior verá los valores nuevos.
+
+        Retorna:
+        - Arreglo guardado.
+        """
+        vertices = self._values[source]
+        out = self._values.get(name) if reuse and name in self._owned and name != source else None
+        if out is not None and out.shape != vertices.shape:
+            out = None
+        reference = bounds.transform_outline(self.outline(source), matrix)
+        with profiling.span("transform:" + name, vertices=len(vertices)):
+            transformed = parallel.apply_matrix(vertices, matrix, out=out)
+        result = self.add(name, transformed, color, reference)
+        self._owned.add(name)
+        return result
+
+    def version(self, name):
+        """
+        Versión de un resultado: cambia cada vez que se agrega o reescribe (también al
+        reutilizar su arreglo), así se puede saber si cambió sin leer sus vértices.
+        """
+        return self._version[name]
+
+    def outline(self, name):
+        """
+        Puntos de referencia de un resultado (su envolvente convexa o las esquinas de su caja).
+        """
+        if name not in self._outlines:
+            self._outlines[name] = bounds.outline(self._values[name])
+        return self._outlines[name]
+
+    def box(self, name):
+        """
+        Caja (min_x, max_x, min_y, max_y) de un resultado, o None si no tiene vértices.
+        """
+        if name not in self._boxes:
+            self._boxes[name] = bounds.box(self.outline(name)) if len(self._values[name]) else None
+        return self._boxes[name]
+
+    def bounds(self):
+        """
+        Caja que contiene a todos los resultados, o None si no hay vértices.
+        """
+        return bounds.union(self.box(name) for name in self._values)
+
+    def limits(self, margin=1):
+        """
+        Límites de los ejes que contienen todos los resultados.
+
+        Parámetros:
+        - margin: Margen adicional para la visualización.
+
+        Retorna:
+        - Tupla (min_x, max_x, min_y, max_y), o None si no hay vértices.
+        """
+        box = self.bounds()
+        if box is None:
+            return None
+        min_x, max_x, min_y, max_y = box
+        return min_x - margin, max_x + margin, min_y - margin, max_y + margin
+
+    def square_limits(self, margin=1):
+        """
+        Intervalo común para ambos ejes que contiene todos los resultados.
+
+        Parámetros:
+        - margin: Margen adicional para la visualización.
+
+        Retorna:
+        - Tupla (mínimo, máximo).
+        """
+        min_x, max_x, min_y, max_y = self.bounds()
+        return min(min_x, min_y) - margin, max(max_x, max_y) + margin
+
+    def __getitem__(self, name):
+        return self._values[name]
+
+    def __contains__(self, name):
+        return name in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def keys(self):
+        """
+        Nombres de los resultados, en orden.
+        """
+        return self._values.keys()
+
+    def values(self):
+        """
+        Arreglos de los resultados, en orden.
+        """
+        return self._values.values()
+
+    def items(self):
+        """
+        Pares (nombre, arreglo), en orden.
+        """
+        return self._values.items()
+
+    def color(self, name):
+        """
+        Color de un resultado (None si usa el ciclo de colores).
+        """
+        return self._colors[name]
+
+    def shapes(self, label=str):
+        """
+        Tuplas (etiqueta, vértices, color) listas para Renderer.draw.
+
+        Parámetros:
+        - label: Función que convierte el nombre en la etiqueta de la leyenda.
+        """
+        return [(label(name), vertices, self._colors[name]) for name, vertices in self._values.items()]
+
+    def format(self, name):
+        """
+        Texto de un resultado; los arreglos grandes se resumen con sus primeros y últimos vértices.
+        """
+        vertices = self._values[name]
+        text = np.array2string(vertices, threshold=2 * PRINT_THRESHOLD, edgeitems=PRINT_EDGE_ITEMS, separator=", ")
+        return f"{text} ({len(vertices)} vértices)" if len(vertices) > PRINT_THRESHOLD else text
+
+    def __str__(self):
+        return "\n".join(f"{name.capitalize()}: {self.format(name)}" for name in self._values)
+
+
+def from_matrices(vertices, matrices, colors=None, dtype=None):
+    """
+    Crea una colección con los vértices originales y el resultado de cada matriz.
+
+    Parámetros:
+    - vertices: Arreglo (N, 2) de vértices originales.
+    - matrices: Diccionario {nombre: matriz 3x3}.
+    - colors: Diccionario opcional {nombre: color}.
+    - dtype: Tipo de los arreglos (por defecto, la precisión del proyecto).
+
+    Retorna:
+    - ResultSet con "original" seguido de un resultado por matriz.
+    """
+    colors = colors or {}
+    results = ResultSet(dtype)
+    results.add("original", vertices, colors.get("original"))
+    for name, matrix in matrices.items():
+        results.add_transformed(name, "original", matrix, colors.get(name))
+    return results
@@ -0,0 +1,175 @@
+# Importar las bibliotecas necesarias
+from functools import lru_cache  # Para memorizar las figuras unitarias
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import precision  # Precisión de los vértices (float64 o float32)
+
+# Resolución (número de vértices) por defecto de las figuras curvas
+DEFAULT_RESOLUTION = 100
+
+# Registro de generadores: nombre -> función(resolution, **parámetros) que devuelve la figura unitaria
+SHAPES = {}
+
+# Figuras cuyo generador no usa la resolución (su plantilla memorizada es una sola para todas)
+FIXED_SHAPES = set()
+
+
+def register_shape(name, resolution=True):
+    """
+    Registrar un generador de figura unitaria bajo un nombre.
+
+    Parámetros:
+    - name: Nombre de la figura (por ejemplo, "circle").
+    - resolution: Si es False, el generador ignora la resolución (ver FIXED_SHAPES).
+
+    Retorna:
+    - Decorador que agrega la función al registro.
+    """
+    def decorator(function):
+        SHAPES[name] = function
+        if not resolution:
+            FIXED_SHAPES.add(name)
+        return function
+    return decorator
+
+
+def _angles(resolution, start=0.0, end=2 * np.pi, endpoint=False):
+    """
+    Ángulos equiespaciados para las figuras curvas.
+    """
+    return np.linspace(start, end, resolution, endpoint=endpoint)
+
+
+@register_shape("square", resolution=False)
+def square(resolution):
+    """
+    Cuadrado unitario con la esquina inferior izquierda en el origen.
+    """
+    return np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+
+
+@register_shape("triangle", resolution=False)
+def triangle(resolution):
+    """
+    Triángulo isósceles unitario con la base sobre el eje x.
+    """
+    return np.array([[0.0, 0.0], [1.0, 0.0], [0.5, 1.0]])
+
+
+@register_shape("circle")
+def circle(resolution):
+    """
+    Circunferencia de radio 1 centrada en el origen.
+    """
+    angles = _angles(resolution)
+    return np.column_stack([np.cos(angles), np.sin(angles)])
+
+
+@register_shape("ellipse")
+def ellipse(resolution):
+    """
+    Elipse unitaria (los semiejes se dan con el tamaño al crearla).
+    """
+    return circle(resolution)
+
+
+@register_shape("polygon", resolution=False)
+def regular_polygon(resolution, sides=6):
+    """
+    Polígono regular de radio 1 con un vértice sobre el eje y positivo.
+    """
+    angles = _angles(sides) + np.pi / 2
+    return np.column_stack([np.cos(angles), np.sin(angles)])
+
+
+@register_shape("star", resolution=False)
+def star(resolution, points=5, inner=0.5):
+    """
+    Estrella de radio exterior 1 y radio interior inner.
+    """
+    angles = _angles(2 * points) + np.pi / 2
+    radii = np.where(np.arange(2 * points) % 2 == 0, 1.0, inner)
+    return np.column_stack([radii * np.cos(angles), radii * np.sin(angles)])
+
+
+@register_shape("arc")
+def arc(resolution, start=0.0, end=np.pi):
+    """
+    Arco de circunferencia de radio 1 entre los ángulos start y end (en radianes).
+    """
+    angles = _angles(resolution, start, end, endpoint=True)
+    return np.column_stack([np.cos(angles), np.sin(angles)])
+
+
+@register_shape("rounded_rectangle")
+def rounded_rectangle(resolution, width=2.0, height=1.0, radius=0.25):
+    """
+    Rectángulo centrado en el origen con esquinas redondeadas de radio radius.
+    """
+    radius = min(radius, width / 2, height / 2)
+    per_corner = max(resolution // 4, 2)
+    # Cuarto de circunferencia de cada esquina, en orden antihorario desde la esquina superior derecha
+    angles = _angles(per_corner, 0.0, np.pi / 2, endpoint=True)[None, :] + (np.pi / 2) * np.arange(4)[:, None]
+    centers = np.array([[1, 1], [-1, 1], [-1, -1], [1, -1]]) * [width / 2 - radius, height / 2 - radius]
+    corners = centers[:, None, :] + radius * np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    # Si el radio es la mitad del ancho (o del alto) el lado recto mide cero: cada esquina empieza
+    # donde terminó la anterior y ese punto se descarta para no repetir vértices consecutivos
+    keep = np.ones((4, per_corner), dtype=bool)
+    if radius == width / 2:
+        keep[[1, 3], 0] = False  # Lados superior e inferior
+    if radius == height / 2:
+        keep[[0, 2], 0] = False  # Lados derecho e izquierdo
+    return corners[keep]
+
+
+def unit_shape(kind, resolution=DEFAULT_RESOLUTION, params=(), dtype=np.float64):
+    """
+    Obtener la figura unitaria memorizada para (tipo, resolución, parámetros, tipo de dato).
+
+    La resolución de las figuras que no la usan (FIXED_SHAPES) y el tipo de dato se normalizan
+    antes de buscar la plantilla, así las llamadas equivalentes comparten la misma entrada.
+
+    Parámetros:
+    - kind: Nombre de la figura registrada.
+    - resolution: Número de vértices de las figuras curvas.
+    - params: Tupla ordenada de pares (nombre, valor) con los parámetros del generador.
+    - dtype: Tipo de los vértices; las plantillas con coordenadas enteras también se convierten.
+
+    Retorna:
+    - Arreglo (N, 2) de solo lectura (se comparte entre llamadas).
+    """
+    if kind not in SHAPES:
+        raise ValueError(f"Figura desconocida: {kind}")
+    if kind in FIXED_SHAPES:
+        resolution = None
+    return _unit_shape(kind, resolution, params, np.dtype(dtype))
+
+
+@lru_cache(maxsize=128)
+def _unit_shape(kind, resolution, params, dtype):
+    """
+    Plantilla memorizada de unit_shape (con los argumentos ya normalizados).
+    """
+    # El generador trabaja en float64; la conversión se hace una sola vez, al memorizar la plantilla
+    template = np.ascontiguousarray(SHAPES[kind](resolution, **dict(params)), dtype=dtype)
+    template.setflags(write=False)
+    return template
+
+
+def create_shape(kind, position=(0.0, 0.0), size=1.0, resolution=DEFAULT_RESOLUTION, **params):
+    """
+    Crear una figura escalando y trasladando su plantilla unitaria memorizada.
+
+    Parámetros:
+    - kind: Nombre de la figura registrada ("square", "triangle", "circle", "ellipse",
+      "polygon", "star", "arc" o "rounded_rectangle").
+    - position: Posición (x, y) del origen de la plantilla (centro o esquina, según la figura).
+    - size: Escala uniforme o tupla (Sx, Sy), por ejemplo el radio o los semiejes.
+    - resolution: Número de vértices de las figuras curvas.
+    - params: Parámetros propios de la figura (sides, points, inner, start, end, width, height, radius).
+
+    Retorna:
+    - Arreglo (N, 2) de vértices nuevo, con la precisión del proyecto.
+    """
+    dtype = precision.get_dtype()
+    template = unit_shape(kind, resolution, tuple(sorted(params.items())), dtype)
+    return template * np.asarray(size, dtype=dtype) + np.asarray(position, dtype=dtype)
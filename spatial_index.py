@@ -0,0 +1,171 @@
+# Importar las bibliotecas necesarias
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+
+# Puntos promedio por celda de la cuadrícula
+POINTS_PER_CELL = 4
+
+# Puntos movidos fuera de su celda a partir de los cuales se reconstruye el índice
+# (como fracción del total, con un mínimo fijo)
+REBUILD_FRACTION = 1 / 16
+REBUILD_MINIMUM = 64
+
+
+class GridIndex:
+    """
+    Índice espacial de una cuadrícula uniforme para encontrar el vértice más cercano a un punto.
+
+    Los puntos se ordenan por celda en un solo arreglo, así cada consulta revisa solo las celdas
+    vecinas con búsquedas binarias en lugar de recorrer todos los vértices. Mover un punto no
+    reordena el arreglo: el punto pasa a una lista pequeña de puntos movidos que se revisa aparte,
+    y el índice se reconstruye solo cuando esa lista crece demasiado. Al reemplazar todos los
+    puntos (por ejemplo, al aplicar una transformación) el índice se reconstruye en la siguiente consulta.
+    """
+
+    def __init__(self, points=None, points_per_cell=POINTS_PER_CELL):
+        """
+        Inicializa el índice.
+
+        Parámetros:
+        - points: Arreglo (N, 2) de puntos, o None para un índice vacío.
+        - points_per_cell: Puntos promedio por celda (define el tamaño de las celdas).
+        """
+        self.points_per_cell = points_per_cell
+        self.points = np.empty((0, 2))  # Copia propia de los puntos (se modifica al mover)
+        self._source = None  # Arreglo recibido; si se vuelve a recibir, no se reconstruye
+        self._dirty = False  # Si es True, el índice se reconstruye en la siguiente consulta
+        self._origin = np.zeros(2)  # Esquina inferior izquierda de la cuadrícula
+        self._cell = 1.0  # Tamaño de las celdas
+        self._shape = (0, 0)  # Número de celdas en x y en y
+        self._order = np.empty(0, dtype=np.intp)  # Índices de los puntos ordenados por celda
+        self._keys = np.empty(0, dtype=np.int64)  # Celda de cada punto en ese orden
+        self._moved = {}  # Índice -> celda (cx, cy) de los puntos que salieron de su celda original
+        if points is not None:
+            self.set_points(points)
+
+    def __len__(self):
+        return len(self._source) if self._dirty else len(self.points)
+
+    def set_points(self, points):
+        """
+        Reemplazar todos los puntos; el índice se reconstruye en la siguiente consulta.
+
+        Si se recibe el mismo arreglo que ya está indexado, no se hace nada.
+        """
+        if points is self._source:
+            return
+        self._source = points
+        self._dirty = True
+
+    def snapshot(self):
+        """
+        Copia de los puntos actuales; si esta copia se vuelve a pasar a set_points, el índice
+        no se reconstruye.
+        """
+        self._ensure_built()
+        self._source = self.points.copy()
+        return self._source
+
+    def _ensure_built(self):
+        if self._dirty:
+            self._build()
+
+    def _build(self):
+        """
+        Ordenar los puntos por celda (O(N log N)).
+        """
+        self.points = np.array(self._source, dtype=float).reshape(-1, 2)  # Copia: mover no altera al arreglo recibido
+        self._dirty = False
+        self._moved = {}
+        if not len(self.points):
+            self._shape = (0, 0)
+            self._order = np.empty(0, dtype=np.intp)
+            self._keys = np.empty(0, dtype=np.int64)
+            return
+
+        low, high = self.points.min(axis=0), self.points.max(axis=0)
+        extent = np.maximum(high - low, 1e-12)
+        # Celdas cuadradas con points_per_cell puntos en promedio
+        # (sin bajar de extensión / sqrt(N), así los puntos alineados no generan millones de celdas vacías)
+        area_cell = np.sqrt(extent[0] * extent[1] * self.points_per_cell / len(self.points))
+        self._cell = float(max(area_cell, extent.max() / np.sqrt(len(self.points))))
+        self._origin = low
+        self._shape = tuple(int(value) + 1 for value in extent // self._cell)
+        cells = self._cells(self.points)
+        keys = cells[:, 0] * self._shape[1] + cells[:, 1]
+        self._order = np.argsort(keys, kind="stable")
+        self._keys = keys[self._order]
+
+    def _cells(self, points):
+        """
+        Celda (cx, cy) de cada punto, limitada a la cuadrícula.
+        """
+        cells = np.floor((points - self._origin) / self._cell).astype(np.int64)
+        return np.clip(cells, 0, np.array(self._shape) - 1)
+
+    def move(self, index, point):
+        """
+        Mover un punto sin reconstruir el índice.
+
+        Parámetros:
+        - index: Índice del punto.
+        - point: Nueva posición (x, y).
+        """
+        self._ensure_built()
+        self.points[index] = point
+        self._source = None  # Los puntos ya no coinciden con el arreglo recibido
+        self._moved[index] = tuple(self._cells(self.points[index:index + 1])[0])
+        if len(self._moved) > max(REBUILD_MINIMUM, len(self.points) * REBUILD_FRACTION):
+            self._source = self.points
+            self._build()
+
+    def remove(self, index):
+        """
+        Quitar un punto (los índices posteriores se desplazan; el índice se reconstruye en la siguiente consulta).
+
+        Retorna:
+        - Arreglo (N - 1, 2) con los puntos restantes.
+        """
+        self._ensure_built()
+        self._source = np.delete(self.points, index, axis=0)
+        self._dirty = True
+        return self._source
+
+    def nearest(self, point, radius):
+        """
+        Encontrar el punto más cercano dentro de un radio.
+
+        Parámetros:
+        - point: Posición (x, y) de la consulta.
+        - radius: Distancia máxima.
+
+        Retorna:
+        - Tupla (índice, distancia), o None si no hay puntos dentro del radio.
+        """
+        self._ensure_built()
+        if not len(self.points):
+            return None
+
+        point = np.asarray(point, dtype=float)
+        low, high = self._cells(np.array([point - radius, point + radius]))
+        columns = range(low[0], high[0] + 1)
+        candidates = [
+            self._order[np.searchsorted(self._keys, cx * self._shape[1] + low[1]):
+                        np.searchsorted(self._keys, cx * self._shape[1] + high[1], side="right")]
+            for cx in columns
+        ]
+        candidates = np.concatenate(candidates) if candidates else np.empty(0, dtype=np.intp)
+        if self._moved:
+            # Los puntos movidos se buscan por su celda actual, no por la que tenían al construir el índice
+            moved = np.fromiter(self._moved, dtype=np.intp, count=len(self._moved))
+            candidates = candidates[~np.isin(candidates, moved)]
+            inside = [index for index, (cx, cy) in self._moved.items()
+                      if low[0] <= cx <= high[0] and low[1] <= cy <= high[1]]
+            candidates = np.concatenate([candidates, np.array(inside, dtype=np.intp)])
+        if not len(candidates):
+            return None
+
+        distances = np.hypot(*(self.points[candidates] - point).T)
+        best = int(np.argmin(distances))
+        if distances[best] > radius:
+            return None
+        return int(candidates[best]), float(distances[best])
@@ -0,0 +1,85 @@
+# Importar las bibliotecas necesarias
+import tkinter as tk  # Biblioteca para crear interfaces gráficas
+from tkinter import ttk  # Widgets avanzados
+import profiling  # Medición de tiempos por intervalos
+
+# Milisegundos entre actualizaciones del panel
+REFRESH_MS = 500
+
+# Columnas de la tabla: (clave en profiling.stats(), título)
+COLUMNS = [("calls", "Llamadas"), ("total_ms", "Total (ms)"), ("mean_ms", "Promedio (ms)"), ("max_ms", "Máximo (ms)")]
+
+
+class StatsPanel:
+    """
+    Ventana con los tiempos medidos por intervalo (carga, transformaciones, gráfica, guardado).
+
+    Abrir el panel activa la medición si estaba desactivada; al cerrarlo se vuelve a desactivar
+    (salvo que la haya activado la variable de entorno de la traza).
+    """
+
+    def __init__(self, root, extra=None, interval=REFRESH_MS):
+        """
+        Crea la ventana y empieza a actualizarla.
+
+        Parámetros:
+        - root: Ventana principal de Tkinter.
+        - extra: Función opcional que devuelve un texto adicional (por ejemplo, los contadores de la caché).
+        - interval: Milisegundos entre actualizaciones.
+        """
+        self.root = root
+        self.extra = extra
+        self.interval = interval
+        self.job = None  # Actualización programada
+        self.owns_profiling = not profiling.is_enabled()  # Si es True, el panel activó la medición
+        profiling.enable()
+
+        self.window = tk.Toplevel(root)
+        self.window.title("Estadísticas")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.tree = ttk.Treeview(self.window, columns=[key for key, _ in COLUMNS], height=12)
+        self.tree.heading("#0", text="Intervalo")
+        for key, title in COLUMNS:
+            self.tree.heading(key, text=title)
+            self.tree.column(key, width=100, anchor="e")
+        self.tree.grid(row=0, column=0, columnspan=2, padx=5, pady=5)
+        self.extra_label = ttk.Label(self.window, text="")
+        self.extra_label.grid(row=1, column=0, sticky="w", padx=5)
+        ttk.Button(self.window, text="Reiniciar", command=self.reset).grid(row=1, column=1, sticky="e", padx=5, pady=5)
+        self.refresh()
+
+    def refresh(self):
+        """
+        Mostrar las estadísticas actuales y programar la siguiente actualización.
+        """
+        self.tree.delete(*self.tree.get_children())
+        for name, values in profiling.stats().items():
+            row = [values["calls"]] + [f"{values[key]:.2f}" for key, _ in COLUMNS[1:]]
+            self.tree.insert("", "end", text=name, values=row)
+        if self.extra is not None:
+            self.extra_label.config(text=self.extra())
+        self.job = self.root.after(self.interval, self.refresh)
+
+    def reset(self):
+        """
+        Descartar las estadísticas acumuladas.
+        """
+        profiling.reset()
+        self.tree.delete(*self.tree.get_children())
+
+    def is_open(self):
+        """
+        Indica si la ventana sigue abierta.
+        """
+        return self.job is not None
+
+    def close(self):
+        """
+        Cerrar la ventana y dejar de medir si el panel activó la medición.
+        """
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+        if self.owns_profiling:
+            profiling.disable()
+        self.window.destroy()
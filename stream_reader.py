@@ -1,10 +1,19 @@
 # Importar las bibliotecas necesarias
-import json  # Para manejar archivos JSON
-import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
 import tkinter as tk  # Biblioteca para crear interfaces gráficas
 from tkinter import filedialog, ttk  # Widgets avanzados y diálogos para seleccionar archivos
-import matplotlib.pyplot as plt  # Biblioteca para crear gráficos y visualizaciones
 from datetime import datetime  # Biblioteca para manejar fechas y horas
+import transform_kernel as kernel  # Núcleo de transformaciones con matrices homogéneas
+import job_io  # Lectura y escritura de archivos de trabajo
+import core  # Núcleo sin interfaz gráfica
+from pipeline import Pipeline  # Cadenas ordenadas de transformaciones con pivote
+from results import ResultSet  # Colección tipada de resultados
+from renderer import Renderer  # Dibujante persistente de figuras
+from export_pool import ExportPool  # Exportación de imágenes en procesos separados
+from stats_panel import StatsPanel  # Panel con los tiempos medidos
+import profiling  # Medición de tiempos por intervalos
+
+# Milisegundos de espera tras la última tecla antes de redibujar la gráfica
+UPDATE_DELAY_MS = 250
 
 class TransformationApp:
     """
@@ -20,8 +29,15 @@ class TransformationApp:
         """
         self.root = root
         self.root.title("Transformaciones desde Archivo")  # Título de la ventana
-        self.result_dict = {}  # Diccionario para almacenar los resultados de las transformaciones
+        self.result_dict = ResultSet()  # Resultados de las transformaciones
         self.max_value = 1  # Límite inicial de los ejes en las gráficas
+        self.renderer = Renderer()  # Figura reutilizada al graficar y guardar
+        self.export_pool = ExportPool(context="spawn")  # Procesos que guardan las imágenes (se crean al primer guardado)
+        self.update_job = None  # Redibujo pendiente (para agrupar varias teclas en uno solo)
+        self.stats_panel = None  # Panel de estadísticas abierto
+
+        # Gráfica incrustada a la derecha de la ventana
+        self.renderer.embed(root, figsize=(6, 6)).pack(side=tk.RIGHT, padx=10, pady=10)
 
         # Crear botones principales para cargar y transformar figuras
         ttk.Button(root, text="Cargar Archivo", command=self.load_file).pack(pady=5)
@@ -36,12 +52,18 @@ class TransformationApp:
         ttk.Button(root, text="Aplicar Traslación", command=self.apply_translation).pack(pady=5)
         ttk.Label(root, text="(Traslada los vértices según los valores especificados)").pack(anchor="w")
 
+        ttk.Button(root, text="Aplicar en Cadena", command=self.apply_pipeline).pack(pady=5)
+        ttk.Label(root, text="(Rota, escala y traslada en ese orden, alrededor del pivote, en una sola pasada)").pack(anchor="w")
+
         ttk.Button(root, text="Graficar Resultados", command=self.plot_results).pack(pady=5)
         ttk.Label(root, text="(Genera una gráfica con los resultados de las transformaciones)").pack(anchor="w")
 
         ttk.Button(root, text="Guardar Gráfica", command=self.save_graphic).pack(pady=5)
         ttk.Label(root, text="(Guarda la gráfica como archivo PNG)").pack(anchor="w")
 
+        ttk.Button(root, text="Estadísticas", command=self.show_stats).pack(pady=5)
+        ttk.Label(root, text="(Muestra cuánto tardan la lectura, las transformaciones, la gráfica y el guardado)").pack(anchor="w")
+
         # Contenedor para entradas de transformación
         self.transformation_frame = ttk.Frame(root, padding=10)
         self.transformation_frame.pack(pady=10)
@@ -49,60 +71,32 @@ class TransformationApp:
 
     def load_file(self):
         """
-        Carga un archivo JSON con configuraciones de vértices y transformaciones.
+        Carga un archivo JSON (o binario .vtx, o de texto .txt/.csv) con vértices y transformaciones.
         """
-        file_path = filedialog.askopenfilename(filetypes=[("Archivos JSON", "*.json")])
+        file_path = filedialog.askopenfilename(filetypes=[("Archivos JSON", "*.json"), ("Vértices binarios", "*.vtx"), ("Texto o CSV", "*.txt *.csv")])
         if file_path:
             try:
                 self.result_dict, self.max_value = self.load_from_file(file_path)
-                print(f"Archivo cargado: {file_path}")
-                print("Contenido cargado:")
-                for key, data in self.result_dict.items():
-                    print(f"{key}: {data['value']}")
+                with profiling.span("print"):
+                    print(f"Archivo cargado: {file_path}")
+                    print("Contenido cargado:")
+                    print(self.result_dict)
+                self.schedule_update()
             except Exception as e:
                 print(f"Error al cargar el archivo: {e}")
 
     def load_from_file(self, filename):
         """
-        Procesa un archivo JSON para extraer puntos y aplicar transformaciones iniciales.
+        Procesa un archivo JSON (o binario .vtx) para extraer puntos y aplicar transformaciones iniciales.
 
         Parámetros:
-        - filename: Ruta del archivo JSON.
+        - filename: Ruta del archivo JSON o .vtx.
 
         Retorna:
-        - result_dict: Diccionario con los resultados de las transformaciones iniciales.
+        - result_dict: ResultSet con los resultados de las transformaciones iniciales.
         - max_value: Valor máximo para ajustar los ejes de las gráficas.
         """
-        with open(filename, "r") as file:
-            config = json.load(file)
-
-        vertices = np.array(config.get("points", []))
-        if not len(vertices):
-            raise ValueError("No se encontraron puntos en el archivo.")
-
-        result_dict = {"original": {"value": vertices, "color": "#1A0014"}}
-        min_value, max_value = np.min(vertices), np.max(vertices)
-
-        # Aplicar transformaciones especificadas en el archivo
-        if "rotation" in config:
-            angle = np.radians(config["rotation"].get("angle", 90))
-            result = self.rotation(vertices, angle)
-            result_dict["rotation"] = {"value": result, "color": "#FF5733"}
-            min_value, max_value = min(min_value, np.min(result)), max(max_value, np.max(result))
-
-        if "scale" in config:
-            sx, sy = config["scale"].get("value", [1, 1])
-            result = self.scale(vertices, sx, sy)
-            result_dict["scale"] = {"value": result, "color": "#33FF57"}
-            min_value, max_value = min(min_value, np.min(result)), max(max_value, np.max(result))
-
-        if "translation" in config:
-            tx, ty = config["translation"].get("value", [0, 0])
-            result = self.translation(vertices, tx, ty)
-            result_dict["translation"] = {"value": result, "color": "#FFD700"}
-            min_value, max_value = min(min_value, np.min(result)), max(max_value, np.max(result))
-
-        return result_dict, max(abs(max_value), abs(min_value))
+        return job_io.load_from_file(filename)
 
     def add_transformation_inputs(self):
         """
@@ -111,65 +105,143 @@ class TransformationApp:
         ttk.Label(self.transformation_frame, text="Rotación (°):").grid(row=0, column=0, sticky="w")
         self.rotation_entry = ttk.Entry(self.transformation_frame)
         self.rotation_entry.grid(row=0, column=1)
+        self.rotation_entry.bind("<KeyRelease>", self.schedule_update)
 
         ttk.Label(self.transformation_frame, text="Escala (Sx, Sy):").grid(row=1, column=0, sticky="w")
         self.scale_entry = ttk.Entry(self.transformation_frame)
         self.scale_entry.grid(row=1, column=1)
+        self.scale_entry.bind("<KeyRelease>", self.schedule_update)
 
         ttk.Label(self.transformation_frame, text="Traslación (Tx, Ty):").grid(row=2, column=0, sticky="w")
         self.translation_entry = ttk.Entry(self.transformation_frame)
         self.translation_entry.grid(row=2, column=1)
+        self.translation_entry.bind("<KeyRelease>", self.schedule_update)
 
-    def apply_rotation(self):
+        ttk.Label(self.transformation_frame, text="Pivote (x, y):").grid(row=3, column=0, sticky="w")
+        self.pivot_entry = ttk.Entry(self.transformation_frame)
+        self.pivot_entry.grid(row=3, column=1)
+        self.pivot_entry.bind("<KeyRelease>", self.schedule_update)
+
+    def schedule_update(self, event=None):
+        """
+        Programar la actualización de la gráfica; cada tecla reinicia la espera, así una ráfaga
+        de cambios produce un solo redibujo.
+        """
+        if self.update_job is not None:
+            self.root.after_cancel(self.update_job)
+        self.update_job = self.root.after(UPDATE_DELAY_MS, self.live_update)
+
+    def live_update(self):
+        """
+        Aplicar las transformaciones con los valores actuales y redibujar la gráfica incrustada.
+        """
+        self.update_job = None
+        if "original" not in self.result_dict:
+            return
+
+        self.apply_rotation(verbose=False)
+        self.apply_scale(verbose=False)
+        self.apply_translation(verbose=False)
+        if "pipeline" in self.result_dict:
+            self.apply_pipeline(verbose=False)
+        self.draw_results()
+        self.renderer.show()
+
+    def apply_rotation(self, verbose=True):
         """
         Aplicar rotación a los vértices cargados.
+
+        Parámetros:
+        - verbose: Si es True, se muestra el resultado en la terminal.
         """
         if "original" not in self.result_dict:
             print("No hay datos cargados para transformar.")
             return
 
-        angle = self.get_float(self.rotation_entry.get(), radians=True)
+        angle = core.parse_float(self.rotation_entry.get(), radians=True)
         if angle:
-            vertices = np.array(self.result_dict["original"]["value"])
-            self.result_dict["rotation"] = {"value": self.rotation(vertices, angle), "color": "#FF5733"}
-            print("Rotación aplicada:", self.result_dict["rotation"]["value"])
+            self.result_dict.add_transformed("rotation", "original", kernel.rotation_matrix(angle), job_io.COLORS["rotation"], reuse=True)
+            if verbose:
+                print("Rotación aplicada:", self.result_dict.format("rotation"))
 
-    def apply_scale(self):
+    def apply_scale(self, verbose=True):
         """
         Aplicar escala a los vértices cargados.
+
+        Parámetros:
+        - verbose: Si es True, se muestra el resultado en la terminal.
         """
         if "original" not in self.result_dict:
             print("No hay datos cargados para transformar.")
             return
 
-        scale = self.get_float_list(self.scale_entry.get())
+        scale = core.parse_float_list(self.scale_entry.get())
         if scale and len(scale) == 2:
-            vertices = np.array(self.result_dict["original"]["value"])
-            self.result_dict["scale"] = {"value": self.scale(vertices, *scale), "color": "#33FF57"}
-            print("Escala aplicada:", self.result_dict["scale"]["value"])
+            self.result_dict.add_transformed("scale", "original", kernel.scale_matrix(*scale), job_io.COLORS["scale"], reuse=True)
+            if verbose:
+                print("Escala aplicada:", self.result_dict.format("scale"))
 
-    def apply_translation(self):
+    def apply_translation(self, verbose=True):
         """
         Aplicar traslación a los vértices cargados.
+
+        Parámetros:
+        - verbose: Si es True, se muestra el resultado en la terminal.
         """
         if "original" not in self.result_dict:
             print("No hay datos cargados para transformar.")
             return
 
-        translation = self.get_float_list(self.translation_entry.get())
+        translation = core.parse_float_list(self.translation_entry.get())
         if translation and len(translation) == 2:
-            vertices = np.array(self.result_dict["original"]["value"])
-            self.result_dict["translation"] = {"value": self.translation(vertices, *translation), "color": "#FFD700"}
-            print("Traslación aplicada:", self.result_dict["translation"]["value"])
+            self.result_dict.add_transformed("translation", "original", kernel.translation_matrix(*translation), job_io.COLORS["translation"], reuse=True)
+            if verbose:
+                print("Traslación aplicada:", self.result_dict.format("translation"))
+
+    def apply_pipeline(self, verbose=True):
+        """
+        Aplicar rotación, escala y traslación en ese orden como una sola transformación compuesta.
+
+        La rotación y la escala se hacen alrededor del pivote (el origen si está vacío); la cadena
+        se reduce a una matriz, así los vértices se recorren una sola vez.
+
+        Parámetros:
+        - verbose: Si es True, se muestra el resultado en la terminal.
+        """
+        if "original" not in self.result_dict:
+            print("No hay datos cargados para transformar.")
+            return
+
+        pivot = core.parse_float_list(self.pivot_entry.get())
+        pivot = pivot if len(pivot) == 2 else None
+        chain = Pipeline()
+        angle = core.parse_float(self.rotation_entry.get(), radians=True)
+        if angle:
+            chain.add("rotation", angle, pivot=pivot)
+        scale = core.parse_float_list(self.scale_entry.get())
+        if len(scale) == 2:
+            chain.add("scale", *scale, pivot=pivot)
+        translation = core.parse_float_list(self.translation_entry.get())
+        if len(translation) == 2:
+            chain.add("translation", *translation)
+
+        self.result_dict.add_transformed("pipeline", "original", chain.matrix(), job_io.COLORS["pipeline"], reuse=True)
+        if verbose:
+            print("Cadena aplicada:", self.result_dict.format("pipeline"))
 
     def calculate_limits(self):
         """
         Calcula los límites para centrar las figuras en el gráfico.
         """
-        all_points = np.concatenate([data["value"] for data in self.result_dict.values()])
-        min_limit, max_limit = np.min(all_points, axis=0), np.max(all_points, axis=0)
-        margin = 1  # Margen para ajustar los límites
-        return min_limit[0] - margin, max_limit[0] + margin, min_limit[1] - margin, max_limit[1] + margin
+        return self.result_dict.limits()
+
+    def draw_results(self):
+        """
+        Actualizar la figura persistente con los resultados actuales.
+        """
+        with profiling.span("calculate_limits"):
+            limits = self.calculate_limits()
+        self.renderer.draw_results(self.result_dict, limits, label=str.capitalize)
 
     def plot_results(self):
         """
@@ -179,19 +251,8 @@ class TransformationApp:
             print("No hay resultados para graficar.")
             return
 
-        fig, ax = plt.subplots(figsize=(8, 8))
-        for key, data in self.result_dict.items():
-            points = np.array(data["value"])
-            points = np.vstack([points, points[0]])  # Cerrar la figura
-            ax.fill(points[:, 0], points[:, 1], alpha=0.5, label=key.capitalize(), color=data["color"])
-            ax.plot(points[:, 0], points[:, 1], linestyle="--", color="black")
-
-        min_x, max_x, min_y, max_y = self.calculate_limits()
-        ax.set_xlim(min_x, max_x)
-        ax.set_ylim(min_y, max_y)
-        ax.set_aspect("equal")
-        ax.legend()
-        plt.show()
+        self.draw_results()
+        self.renderer.show()
 
     def save_graphic(self):
         """
@@ -202,98 +263,31 @@ class TransformationApp:
             return
 
         file_name = f"graph_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        fig, ax = plt.subplots(figsize=(8, 8))
-        for key, data in self.result_dict.items():
-            points = np.array(data["value"])
-            points = np.vstack([points, points[0]])  # Cerrar la figura
-            ax.fill(points[:, 0], points[:, 1], alpha=0.5, label=key.capitalize(), color=data["color"])
-            ax.plot(points[:, 0], points[:, 1], linestyle="--", color="black")
-
-        min_x, max_x, min_y, max_y = self.calculate_limits()
-        ax.set_xlim(min_x, max_x)
-        ax.set_ylim(min_y, max_y)
-        ax.set_aspect("equal")
-        ax.legend()
-        fig.savefig(file_name)
-        print(f"Gráfica guardada como: {file_name}")
-
-    @staticmethod
-    def rotation(vertices, angle):
-        """
-        Aplica una rotación a los vértices.
-
-        Parámetros:
-        - vertices: Arreglo de vértices.
-        - angle: Ángulo de rotación en radianes.
+        self.draw_results()
+        # La imagen se dibuja en otro proceso; si nada cambió, se conserva el archivo anterior
+        self.renderer.save_async(self.export_pool, self.root, file_name, self.on_graphic_saved)
 
-        Retorna:
-        - Arreglo de vértices rotados.
-        """
-        return np.dot(vertices, [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
-
-    @staticmethod
-    def scale(vertices, sx, sy):
+    def show_stats(self):
         """
-        Aplica una escala a los vértices.
-
-        Parámetros:
-        - vertices: Arreglo de vértices.
-        - sx: Escala en el eje x.
-        - sy: Escala en el eje y.
-
-        Retorna:
-        - Arreglo de vértices escalados.
+        Abrir el panel de estadísticas (o traerlo al frente si ya está abierto).
         """
-        return np.dot(vertices, [[sx, 0], [0, sy]])
-
-    @staticmethod
-    def translation(vertices, tx, ty):
-        """
-        Aplica una traslación a los vértices.
-
-        Parámetros:
-        - vertices: Arreglo de vértices.
-        - tx: Traslación en el eje x.
-        - ty: Traslación en el eje y.
-
-        Retorna:
-        - Arreglo de vértices trasladados.
-        """
-        return vertices + [tx, ty]
-
-    @staticmethod
-    def get_float(value, radians=False):
-        """
-        Convierte un valor de cadena a flotante.
-
-        Parámetros:
-        - value: Cadena a convertir.
-        - radians: Si es True, convierte el valor a radianes.
-
-        Retorna:
-        - Flotante o None si la conversión falla.
-        """
-        try:
-            val = float(value)
-            return np.radians(val) if radians else val
-        except ValueError:
-            return None
+        if self.stats_panel is not None and self.stats_panel.is_open():
+            self.stats_panel.window.lift()
+            return
+        self.stats_panel = StatsPanel(self.root)
 
-    @staticmethod
-    def get_float_list(value):
+    def on_graphic_saved(self, file_name, error):
         """
-        Convierte una cadena separada por comas a una lista de flotantes.
+        Informar el resultado de un guardado en segundo plano.
 
         Parámetros:
-        - value: Cadena de texto a convertir.
-
-        Retorna:
-        - Lista de números flotantes o una lista vacía si falla.
+        - file_name: Ruta del archivo guardado (None si hubo error).
+        - error: Excepción producida al guardar, o None.
         """
-        try:
-            return [float(x) for x in value.split(",")]
-        except ValueError:
-            return []
+        if error is not None:
+            print(f"Error al guardar la gráfica: {error}")
+        else:
+            print(f"Gráfica guardada como: {file_name}")
 
 # Punto de entrada de la aplicación
 if __name__ == "__main__":
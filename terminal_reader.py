@@ -2,7 +2,15 @@
 import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
 import tkinter as tk  # Biblioteca para crear interfaces gráficas
 from tkinter import ttk  # Widgets mejorados para interfaces gráficas
-import matplotlib.pyplot as plt  # Biblioteca para graficar figuras
+import shapes  # Generadores de figuras paramétricas
+import core  # Núcleo sin interfaz gráfica
+from job_io import COLORS  # Colores de cada resultado
+from results import ResultSet  # Colección tipada de resultados
+from renderer import Renderer  # Dibujante persistente de figuras
+from vertex_editor import VertexEditor  # Selección y arrastre de vértices sobre la gráfica
+
+# Milisegundos de espera tras la última tecla antes de redibujar la gráfica
+UPDATE_DELAY_MS = 250
 
 class TransformationApp:
     """
@@ -19,8 +27,14 @@ class TransformationApp:
         self.root = root
         self.root.title("Transformaciones de Figuras")  # Título de la ventana
         self.figure = None  # Figura seleccionada (cuadrado o triángulo)
-        self.result_dict = {}  # Diccionario para almacenar las transformaciones aplicadas
+        self.result_dict = ResultSet()  # Resultados de las transformaciones aplicadas
         self.vertices = []  # Lista de vértices personalizados
+        self.renderer = Renderer(figsize=(6, 6))  # Figura reutilizada en cada gráfica
+        self.update_job = None  # Redibujo pendiente (para agrupar varias teclas en uno solo)
+
+        # Gráfica incrustada a la derecha de la ventana
+        self.renderer.embed(root).pack(side=tk.RIGHT, padx=10, pady=10)
+        self.editor = VertexEditor(self.renderer, self.on_vertices_edited)  # Mover o borrar vértices con el ratón
 
         # Botones principales para crear figuras
         ttk.Button(root, text="Crear Cuadrado", command=self.create_square).pack(pady=5)
@@ -31,6 +45,7 @@ class TransformationApp:
 
         ttk.Button(root, text="Agregar Vértice", command=self.add_vertex).pack(pady=5)
         ttk.Label(root, text="Añade vértices personalizados a la figura").pack(anchor="w")
+        ttk.Label(root, text="En la gráfica: arrastre un vértice original para moverlo, clic derecho para borrarlo").pack(anchor="w")
 
         # Contenedor para las entradas de transformaciones
         frame = ttk.LabelFrame(root, text="Transformaciones")
@@ -63,22 +78,46 @@ class TransformationApp:
         ttk.Label(frame, text=label).pack(anchor="w")
         entry = ttk.Entry(frame)
         entry.pack(fill=tk.X, padx=5)
+        entry.bind("<KeyRelease>", self.schedule_update)
         return entry
 
+    def schedule_update(self, event=None):
+        """
+        Programar la actualización de la gráfica; cada tecla reinicia la espera, así una ráfaga
+        de cambios produce un solo redibujo.
+        """
+        if self.update_job is not None:
+            self.root.after_cancel(self.update_job)
+        self.update_job = self.root.after(UPDATE_DELAY_MS, self.live_update)
+
+    def live_update(self):
+        """
+        Aplicar las transformaciones con los valores actuales y redibujar la gráfica incrustada.
+        """
+        self.update_job = None
+        if self.figure is None and not self.vertices:
+            return
+
+        self.apply_transformations(verbose=False)
+        if self.result_dict:
+            self.plot_results()
+
     def create_square(self):
         """
         Crear un cuadrado predeterminado y almacenarlo en la aplicación.
         """
-        self.figure = np.array([[0, 0], [5, 0], [5, 5], [0, 5]])  # Coordenadas del cuadrado
-        self.result_dict = {"original": {"value": self.figure, "color": "#1A0014"}}
+        self.figure = shapes.create_shape("square", size=5)  # Coordenadas del cuadrado
+        self.result_dict = ResultSet()
+        self.result_dict.add("original", self.figure, COLORS["original"])
         print("Cuadrado creado:", self.figure)
 
     def create_triangle(self):
         """
         Crear un triángulo predeterminado y almacenarlo en la aplicación.
         """
-        self.figure = np.array([[0, 0], [5, 0], [2.5, 5]])  # Coordenadas del triángulo
-        self.result_dict = {"original": {"value": self.figure, "color": "#1A0014"}}
+        self.figure = shapes.create_shape("triangle", size=5)  # Coordenadas del triángulo
+        self.result_dict = ResultSet()
+        self.result_dict.add("original", self.figure, COLORS["original"])
         print("Triángulo creado:", self.figure)
 
     def add_vertex(self):
@@ -107,45 +146,52 @@ class TransformationApp:
 
         ttk.Button(new_vertex, text="Agregar", command=save_vertex).grid(row=2, column=0, columnspan=2, pady=10)
 
-    def apply_transformations(self):
+    def on_vertices_edited(self, layer, vertices):
+        """
+        Reemplazar la figura original por la modificada con el ratón y recalcular sus transformaciones.
+
+        Parámetros:
+        - layer: Capa editada (solo "original").
+        - vertices: Arreglo (N, 2) con los vértices modificados.
+        """
+        self.figure = vertices
+        self.result_dict = ResultSet()
+        self.result_dict.add("original", self.figure, COLORS["original"])
+        self.apply_transformations(verbose=False)
+        self.plot_results()
+
+    def apply_transformations(self, verbose=True):
         """
         Aplicar las transformaciones seleccionadas a la figura actual.
+
+        Parámetros:
+        - verbose: Si es True, se muestran los resultados en la terminal.
         """
         if self.figure is None and not self.vertices:
-            print("No hay figura ni vértices personalizados creados.")
+            if verbose:
+                print("No hay figura ni vértices personalizados creados.")
             return
 
         vertices = self.figure if self.figure is not None else np.array(self.vertices)
 
-        # Rotación
-        angle = self.get_float(self.rotation_entry.get(), radians=True)
-        if angle:
-            matrix = [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
-            self.result_dict["rotation"] = {"value": np.dot(vertices, matrix), "color": "#FF5733"}
-
-        # Escala
-        scale_values = self.get_float_list(self.scale_entry.get())
-        if scale_values and len(scale_values) == 2:
-            matrix = [[scale_values[0], 0], [0, scale_values[1]]]
-            self.result_dict["scale"] = {"value": np.dot(vertices, matrix), "color": "#33FF57"}
-
-        # Reflexión
-        ref_type = self.reflection_entry.get().strip().lower()
-        if ref_type == "h":
-            matrix = [[1, 0], [0, -1]]
-            self.result_dict["reflection"] = {"value": np.dot(vertices, matrix), "color": "#3357FF"}
-        elif ref_type == "v":
-            matrix = [[-1, 0], [0, 1]]
-            self.result_dict["reflection"] = {"value": np.dot(vertices, matrix), "color": "#3357FF"}
-
-        # Traslación
-        translation_values = self.get_float_list(self.translation_entry.get())
-        if translation_values and len(translation_values) == 2:
-            self.result_dict["translation"] = {"value": vertices + translation_values, "color": "#FFD700"}
-
-        print("Transformaciones aplicadas:")
-        for key, data in self.result_dict.items():
-            print(f"{key}: {data['value']}")
+        angle = core.parse_float(self.rotation_entry.get(), radians=True)
+        scale_values = core.parse_float_list(self.scale_entry.get())
+        translation_values = core.parse_float_list(self.translation_entry.get())
+        results = core.apply_transformations(
+            vertices,
+            angle=angle or None,
+            scale=scale_values if len(scale_values) == 2 else None,
+            reflection=core.parse_reflection(self.reflection_entry.get()),
+            translation=translation_values if len(translation_values) == 2 else None,
+        )
+        for key, value in results.items():
+            if key != "original":
+                # La envolvente ya transformada acompaña al resultado, así sus límites no recorren los vértices
+                self.result_dict.add(key, value, COLORS[key], reference=results.outline(key))
+
+        if verbose:
+            print("Transformaciones aplicadas:")
+            print(self.result_dict)
 
     def plot_results(self):
         """
@@ -155,62 +201,19 @@ class TransformationApp:
             print("No hay datos para graficar.")
             return
 
-        fig, ax = plt.subplots(figsize=(6, 6))
-        for key, data in self.result_dict.items():
-            points = np.array(data["value"])
-            points = np.vstack([points, points[0]])  # Cerrar la figura
-            ax.fill(points[:, 0], points[:, 1], label=key.capitalize(), alpha=0.5, color=data["color"])
-            ax.plot(points[:, 0], points[:, 1], linestyle="--", color="black")
-
-        self.adjust_plot_limits(ax)
-        ax.set_aspect("equal")
-        ax.legend()
-        plt.show()
+        self.renderer.draw_results(self.result_dict, label=str.capitalize)
+        if "original" in self.result_dict:
+            self.editor.set_layer("original", self.result_dict["original"])
+        self.adjust_plot_limits(self.renderer.ax)
+        self.renderer.show()
 
     def adjust_plot_limits(self, ax):
         """
         Ajustar los límites del gráfico para que las figuras estén siempre visibles y centradas.
         """
-        all_points = np.vstack([data["value"] for data in self.result_dict.values()])
-        min_x, min_y = np.min(all_points, axis=0)
-        max_x, max_y = np.max(all_points, axis=0)
-        margin = 1  # Margen para los límites
-        ax.set_xlim(min_x - margin, max_x + margin)
-        ax.set_ylim(min_y - margin, max_y + margin)
-
-    @staticmethod
-    def get_float(value, radians=False):
-        """
-        Convertir una cadena en un número flotante.
-
-        Parámetros:
-        - value: Cadena de texto a convertir.
-        - radians: Convertir el valor a radianes si es True.
-
-        Retorna:
-        - Número flotante o None si el valor no es válido.
-        """
-        try:
-            val = float(value)
-            return np.radians(val) if radians else val
-        except ValueError:
-            return None
-
-    @staticmethod
-    def get_float_list(value):
-        """
-        Convertir una cadena separada por comas en una lista de flotantes.
-
-        Parámetros:
-        - value: Cadena de texto a convertir.
-
-        Retorna:
-        - Lista de números flotantes o una lista vacía si el valor no es válido.
-        """
-        try:
-            return list(map(float, value.split(",")))
-        except ValueError:
-            return []
+        min_x, max_x, min_y, max_y = self.result_dict.limits()
+        ax.set_xlim(min_x, max_x)
+        ax.set_ylim(min_y, max_y)
 
 # Punto de entrada
 if __name__ == "__main__":
@@ -0,0 +1,270 @@
+# Importar las bibliotecas necesarias
+import weakref  # Para reconocer los arreglos reservados con espacio para cerrar la figura
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import precision  # Precisión de los vértices (float64 o float32)
+
+# Constantes para reflexiones
+HORIZONTAL_REFLECTION = 0  # Reflexión horizontal (respecto al eje x)
+VERTICAL_REFLECTION = 1  # Reflexión vertical (respecto al eje y)
+
+# Convención: los vértices son vectores fila [x, y, 1] y se transforman como p' = p @ M.
+# Con esta convención una cadena de operaciones A, luego B, luego C se compone como A @ B @ C,
+# y la parte lineal 2x2 coincide con las matrices que ya usaban las aplicaciones con np.dot.
+
+# Filas procesadas por bloque: cada bloque se multiplica y se traslada mientras sigue en la caché,
+# y al transformar en el mismo lugar el búfer temporal no pasa de este tamaño
+BLOCK_ROWS = 1 << 14
+
+# Búferes reservados por empty_vertices (id -> búfer), para cerrar sus figuras sin copiarlas
+_closable = weakref.WeakValueDictionary()
+
+
+def identity_matrix():
+    """
+    Crea la matriz homogénea identidad.
+
+    Retorna:
+    - Matriz 3x3 identidad.
+    """
+    return np.eye(3)
+
+
+def _affine(a, b, c, d, tx, ty):
+    """
+    Construye matrices homogéneas a partir de sus coeficientes (escalares o arreglos).
+
+    Parámetros:
+    - a, b, c, d: Coeficientes de la parte lineal [[a, b], [c, d]].
+    - tx, ty: Coeficientes de traslación.
+
+    Retorna:
+    - Matriz 3x3, o pila (..., 3, 3) si los coeficientes son arreglos.
+    """
+    a, b, c, d, tx, ty = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, c, d, tx, ty)))
+    matrix = np.zeros(a.shape + (3, 3))
+    matrix[..., 0, 0], matrix[..., 0, 1] = a, b
+    matrix[..., 1, 0], matrix[..., 1, 1] = c, d
+    matrix[..., 2, 0], matrix[..., 2, 1] = tx, ty
+    matrix[..., 2, 2] = 1.0
+    return matrix
+
+
+def rotation_matrix(angle):
+    """
+    Crea la matriz homogénea de rotación.
+
+    Parámetros:
+    - angle: Ángulo de rotación en radianes (o arreglo de ángulos, uno por figura).
+
+    Retorna:
+    - Matriz 3x3 de rotación, o pila (S, 3, 3) si angle es un arreglo.
+    """
+    cos, sin = np.cos(angle), np.sin(angle)
+    return _affine(cos, -sin, sin, cos, 0.0, 0.0)
+
+
+def scale_matrix(sx, sy):
+    """
+    Crea la matriz homogénea de escala.
+
+    Parámetros:
+    - sx: Escala en el eje x (escalar o arreglo).
+    - sy: Escala en el eje y (escalar o arreglo).
+
+    Retorna:
+    - Matriz 3x3 de escala, o pila (S, 3, 3) si se pasan arreglos.
+    """
+    return _affine(sx, 0.0, 0.0, sy, 0.0, 0.0)
+
+
+def reflection_matrix(axis):
+    """
+    Crea la matriz homogénea de reflexión.
+
+    Parámetros:
+    - axis: HORIZONTAL_REFLECTION o VERTICAL_REFLECTION (o arreglo de ellos, uno por figura).
+
+    Retorna:
+    - Matriz 3x3 de reflexión, o pila (S, 3, 3) si axis es un arreglo.
+    """
+    axis = np.asarray(axis)
+    if not np.isin(axis, [HORIZONTAL_REFLECTION, VERTICAL_REFLECTION]).all():
+        raise ValueError(f"Tipo de reflexión desconocido: {axis}")
+    return scale_matrix(np.where(axis == VERTICAL_REFLECTION, -1.0, 1.0), np.where(axis == HORIZONTAL_REFLECTION, -1.0, 1.0))
+
+
+def translation_matrix(tx, ty):
+    """
+    Crea la matriz homogénea de traslación.
+
+    Parámetros:
+    - tx: Traslación en el eje x (escalar o arreglo).
+    - ty: Traslación en el eje y (escalar o arreglo).
+
+    Retorna:
+    - Matriz 3x3 de traslación, o pila (S, 3, 3) si se pasan arreglos.
+    """
+    return _affine(1.0, 0.0, 0.0, 1.0, tx, ty)
+
+
+# Constructores de matrices por nombre de operación (mismos nombres que usan las aplicaciones)
+OPERATIONS = {
+    "rotation": rotation_matrix,
+    "scale": scale_matrix,
+    "reflection": reflection_matrix,
+    "translation": translation_matrix,
+}
+
+
+def operation_matrix(name, *params):
+    """
+    Crea la matriz homogénea de una operación a partir de su nombre.
+
+    Parámetros:
+    - name: Nombre de la operación ("rotation", "scale", "reflection" o "translation").
+    - params: Parámetros de la operación (ángulo en radianes, sx y sy, eje o tx y ty).
+
+    Retorna:
+    - Matriz 3x3 de la operación.
+    """
+    if name not in OPERATIONS:
+        raise ValueError(f"Operación desconocida: {name}")
+    return OPERATIONS[name](*params)
+
+
+def compose(*matrices):
+    """
+    Compone una cadena de matrices homogéneas en una sola.
+
+    Parámetros:
+    - matrices: Matrices 3x3 (o pilas (S, 3, 3), una por figura) en el orden en que se aplican.
+
+    Retorna:
+    - Matriz 3x3 (o pila (S, 3, 3)) equivalente a aplicar todas las operaciones en orden.
+    """
+    result = identity_matrix()
+    for matrix in matrices:
+        result = result @ matrix
+    return result
+
+
+def about(matrix, pivot):
+    """
+    Convierte una matriz para que actúe alrededor de un punto pivote en lugar del origen.
+
+    Parámetros:
+    - matrix: Matriz 3x3 (o pila (S, 3, 3)), por ejemplo una rotación o una escala.
+    - pivot: Punto (x, y) que queda fijo.
+
+    Retorna:
+    - Matriz equivalente a trasladar el pivote al origen, aplicar matrix y regresar.
+    """
+    px, py = pivot
+    return compose(translation_matrix(-px, -py), matrix, translation_matrix(px, py))
+
+
+def build_matrix(operations):
+    """
+    Compone una lista de operaciones (nombre, parámetros) en una sola matriz.
+
+    Parámetros:
+    - operations: Iterable de tuplas (nombre, parámetros...), por ejemplo ("scale", 2, 2).
+
+    Retorna:
+    - Matriz 3x3 equivalente a toda la cadena.
+    """
+    return compose(*(operation_matrix(name, *params) for name, *params in operations))
+
+
+def empty_vertices(count, dtype=None):
+    """
+    Reserva un arreglo de vértices con una fila extra al final, para que closed pueda cerrar
+    la figura sin copiarla.
+
+    Parámetros:
+    - count: Número de vértices.
+    - dtype: Tipo de los vértices (por defecto, la precisión del proyecto).
+
+    Retorna:
+    - Arreglo (count, 2) sin inicializar.
+    """
+    buffer = np.empty((count + 1, 2), dtype=dtype or precision.get_dtype())
+    _closable[id(buffer)] = buffer
+    return buffer[:count]
+
+
+def closed(vertices):
+    """
+    Figura cerrada: los vértices seguidos del primero.
+
+    Si los vértices se reservaron con empty_vertices (como los resultados de apply_matrix),
+    se devuelve una vista de su búfer; si no, se copian.
+
+    Parámetros:
+    - vertices: Arreglo (N, 2) de vértices.
+
+    Retorna:
+    - Arreglo (N + 1, 2).
+    """
+    base = vertices.base
+    if (
+        len(vertices) and base is not None and _closable.get(id(base)) is base
+        and base.shape == (len(vertices) + 1, 2) and vertices.ctypes.data == base.ctypes.data
+    ):
+        base[-1] = vertices[0]
+        return base
+    return np.vstack([vertices, vertices[:1]])
+
+
+def apply_matrix(vertices, matrix, out=None):
+    """
+    Aplica una matriz homogénea a un arreglo de vértices en una sola pasada.
+
+    Parámetros:
+    - vertices: Arreglo (N, 2) de vértices.
+    - matrix: Matriz 3x3 (por ejemplo, el resultado de compose).
+    - out: Arreglo (N, 2) donde se escribe el resultado (puede ser vertices, para transformar
+      en el mismo lugar), o None para reservar uno nuevo con empty_vertices.
+
+    Retorna:
+    - Arreglo (N, 2) de vértices transformados (out si se indicó), con la precisión del
+      proyecto o la de out.
+    """
+    dtype = precision.get_dtype() if out is None else out.dtype
+    vertices = np.asarray(vertices, dtype=dtype)
+    # La matriz se compone en float64 y se convierte al aplicarla; si no, NumPy promovería el resultado a float64
+    matrix = np.asarray(matrix).astype(dtype, copy=False)
+    linear, offset = matrix[:2, :2], matrix[2, :2]
+    if out is None:
+        out = empty_vertices(len(vertices), dtype)
+    scratch = None
+    if np.may_share_memory(vertices, out):
+        if vertices.ctypes.data == out.ctypes.data and vertices.strides == out.strides:
+            # Sobre los mismos vértices, cada bloque se calcula en un búfer temporal pequeño antes de escribirlo
+            scratch = np.empty((min(BLOCK_ROWS, len(vertices)), 2), dtype=dtype)
+        else:
+            vertices = vertices.copy()  # Solapamiento desplazado: un bloque sobrescribiría la entrada del siguiente
+    for start in range(0, len(vertices), BLOCK_ROWS):
+        block = vertices[start:start + BLOCK_ROWS]
+        target = out[start:start + len(block)]
+        part = target if scratch is None else scratch[:len(block)]
+        np.matmul(block, linear, out=part)
+        part += offset  # La traslación se suma sobre el mismo bloque, sin copias adicionales
+        if scratch is not None:
+            target[...] = part
+    return out
+
+
+def transform(vertices, *operations, out=None):
+    """
+    Aplica una cadena de operaciones a los vértices tocándolos una sola vez.
+
+    Parámetros:
+    - vertices: Arreglo (N, 2) de vértices.
+    - operations: Tuplas (nombre, parámetros...) en el orden en que se aplican.
+    - out: Arreglo (N, 2) donde se escribe el resultado (ver apply_matrix), o None.
+
+    Retorna:
+    - Arreglo (N, 2) de vértices transformados.
+    """
+    return apply_matrix(vertices, build_matrix(operations), out=out)
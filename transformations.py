@@ -1,8 +1,10 @@
 # Importar las bibliotecas necesarias
-import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
 import tkinter as tk  # Biblioteca para crear interfaces gráficas
 from tkinter import ttk  # Widgets mejorados para interfaces gráficas
-import matplotlib.pyplot as plt  # Biblioteca para graficar figuras
+from renderer import Renderer  # Dibujante persistente de figuras
+from vertex_editor import VertexEditor  # Selección y arrastre de vértices sobre la gráfica
+import shapes  # Generadores de figuras paramétricas
+import core  # Núcleo sin interfaz gráfica
 
 class TransformationApp:
     """
@@ -20,6 +22,11 @@ class TransformationApp:
         self.root.title("Figuras y Transformaciones")  # Título de la ventana
         self.figure = []  # Almacena la figura actual
         self.vertices = []  # Almacena vértices personalizados
+        self.renderer = Renderer(title="Figura y Vértices", grid=True)  # Figura reutilizada en cada gráfica
+
+        # Gráfica incrustada a la derecha de la ventana
+        self.renderer.embed(root, figsize=(6, 6)).pack(side=tk.RIGHT, padx=10, pady=10)
+        self.editor = VertexEditor(self.renderer, self.on_vertices_edited)  # Mover o borrar vértices con el ratón
 
         # Crear botones principales para las figuras
         ttk.Button(root, text="Crear Triángulo", command=self.create_triangle).pack(pady=5)
@@ -36,19 +43,20 @@ class TransformationApp:
 
         ttk.Button(root, text="Graficar Figura y Vértices", command=self.plot_results).pack(pady=10)
         ttk.Label(root, text="Muestra la figura creada y los vértices personalizados").pack(anchor="w")
+        ttk.Label(root, text="En la gráfica: arrastre un vértice para moverlo, clic derecho para borrarlo").pack(anchor="w")
 
     def create_triangle(self):
         """
         Crear un triángulo equilátero predeterminado y almacenarlo.
         """
-        self.figure = np.array([[0, 0], [6, 0], [3, 5]])  # Coordenadas del triángulo
+        self.figure = shapes.create_shape("triangle", size=(6, 5))  # Coordenadas del triángulo
         print("Triángulo creado:", self.figure)
 
     def create_square(self):
         """
         Crear un cuadrado predeterminado y almacenarlo.
         """
-        self.figure = np.array([[0, 0], [5, 0], [5, 5], [0, 5]])  # Coordenadas del cuadrado
+        self.figure = shapes.create_shape("square", size=5)  # Coordenadas del cuadrado
         print("Cuadrado creado:", self.figure)
 
     def create_circle(self):
@@ -56,8 +64,7 @@ class TransformationApp:
         Crear un círculo predeterminado y almacenarlo.
         """
         x, y, radius = 0, 0, 5  # Centro y radio del círculo
-        angles = np.linspace(0, 2 * np.pi, 100)  # Ángulos en radianes para el círculo
-        self.figure = np.array([[x + radius * np.cos(a), y + radius * np.sin(a)] for a in angles])  # Coordenadas del círculo
+        self.figure = shapes.create_shape("circle", (x, y), radius, resolution=100)  # Coordenadas del círculo
         print("Círculo creado:", self.figure)
 
     def add_vertex(self):
@@ -90,34 +97,41 @@ class TransformationApp:
         """
         Graficar las figuras creadas junto con los vértices personalizados.
         """
-        if not self.figure and not self.vertices:  # Verificar si hay figuras o vértices creados
+        if not len(self.figure) and not self.vertices:  # Verificar si hay figuras o vértices creados
             print("No hay figura ni vértices creados.")
             return
 
-        fig, ax = plt.subplots(figsize=(8, 8))
-
         # Graficar la figura principal si existe
-        if self.figure:
-            points = np.vstack([self.figure, self.figure[0]])  # Cerrar la figura conectando el último punto con el primero
-            ax.plot(points[:, 0], points[:, 1], linestyle="--", color="black", label="Figura")  # Líneas de contorno
-            ax.fill(points[:, 0], points[:, 1], alpha=0.5, color="blue")  # Relleno de la figura
+        figures = []
+        if len(self.figure):
+            figures.append(("Figura", self.figure, "blue"))
             print("Figura graficada:", self.figure)
 
         # Graficar los vértices personalizados
         if self.vertices:
-            vertices_array = np.array(self.vertices)
-            ax.scatter(vertices_array[:, 0], vertices_array[:, 1], color="red", label="Vértices Personalizados")
             print("Vértices personalizados graficados:", self.vertices)
 
+        self.renderer.draw(figures, points=("Vértices Personalizados", self.vertices, "red"))
+        self.editor.set_layer("figure", self.figure)
+        self.editor.set_layer("vertices", self.vertices, closed=False)
+
         # Ajustar límites del gráfico
-        self.adjust_plot_limits(ax)
+        self.adjust_plot_limits(self.renderer.ax)
+        self.renderer.show()
+
+    def on_vertices_edited(self, layer, vertices):
+        """
+        Guardar los vértices movidos o borrados con el ratón y volver a graficar.
 
-        # Configurar estilo del gráfico
-        ax.set_aspect("equal")
-        ax.grid(True, linestyle="--", linewidth=0.5)
-        ax.set_title("Figura y Vértices")
-        ax.legend()
-        plt.show()
+        Parámetros:
+        - layer: Capa editada ("figure" o "vertices").
+        - vertices: Arreglo (N, 2) con los vértices de esa capa.
+        """
+        if layer == "figure":
+            self.figure = vertices
+        else:
+            self.vertices = vertices.tolist()
+        self.plot_results()
 
     def adjust_plot_limits(self, ax):
         """
@@ -126,16 +140,11 @@ class TransformationApp:
         Parámetros:
         - ax: Objeto de ejes del gráfico.
         """
-        all_points = np.vstack([self.figure] if self.figure else [])
-        if self.vertices:
-            all_points = np.vstack([all_points, np.array(self.vertices)]) if all_points.size > 0 else np.array(self.vertices)
-
-        if all_points.size > 0:
-            min_x, min_y = np.min(all_points, axis=0)
-            max_x, max_y = np.max(all_points, axis=0)
-            margin = 1  # Márgenes alrededor de los límites
-            ax.set_xlim(min_x - margin, max_x + margin)
-            ax.set_ylim(min_y - margin, max_y + margin)
+        limits = core.calculate_limits([self.figure, self.vertices])
+        if limits is not None:
+            min_x, max_x, min_y, max_y = limits
+            ax.set_xlim(min_x, max_x)
+            ax.set_ylim(min_y, max_y)
 
 # Punto de entrada de la aplicación
 if __name__ == "__main__":
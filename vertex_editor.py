@@ -0,0 +1,134 @@
+# Importar las bibliotecas necesarias
+from spatial_index import GridIndex  # Índice espacial para encontrar el vértice bajo el ratón
+
+# Distancia máxima (en píxeles) entre el ratón y un vértice para seleccionarlo
+PICK_TOLERANCE = 8
+
+# Botones del ratón
+LEFT_BUTTON, RIGHT_BUTTON = 1, 3
+
+
+class VertexEditor:
+    """
+    Edición de vértices sobre la gráfica incrustada: clic izquierdo y arrastrar mueve un vértice,
+    clic derecho lo borra.
+
+    Cada capa editable (una figura o un conjunto de puntos) tiene su propio índice espacial, así
+    encontrar el vértice bajo el ratón no recorre todos los vértices. Mientras se arrastra solo se
+    dibujan el vértice y sus aristas vecinas; la figura completa se actualiza al soltar el botón.
+    """
+
+    def __init__(self, renderer, on_change, tolerance=PICK_TOLERANCE):
+        """
+        Inicializa el editor y lo conecta a los eventos del lienzo.
+
+        Parámetros:
+        - renderer: Renderer con la figura ya incrustada (ver Renderer.embed).
+        - on_change: Función on_change(capa, vértices) llamada al terminar de mover o al borrar un vértice.
+        - tolerance: Distancia máxima en píxeles para seleccionar un vértice.
+        """
+        self.renderer = renderer
+        self.on_change = on_change
+        self.tolerance = tolerance
+        self.layers = {}  # Nombre -> (índice espacial, True si es una figura cerrada)
+        self.dragging = None  # (capa, índice del vértice) que se está arrastrando
+        self.preview = None  # Línea con el vértice arrastrado y sus aristas vecinas
+
+        canvas = renderer.fig.canvas
+        canvas.mpl_connect("button_press_event", self._on_press)
+        canvas.mpl_connect("motion_notify_event", self._on_motion)
+        canvas.mpl_connect("button_release_event", self._on_release)
+
+    def set_layer(self, name, vertices, closed=True):
+        """
+        Registrar (o actualizar) una capa editable con los vértices mostrados.
+
+        El índice se reconstruye de forma diferida en la siguiente selección, y no se
+        reconstruye si se recibe el mismo arreglo que ya estaba indexado.
+
+        Parámetros:
+        - name: Nombre de la capa.
+        - vertices: Arreglo (N, 2) de vértices.
+        - closed: Si es True, los vértices forman una figura cerrada (se muestran sus aristas al arrastrar).
+        """
+        if name not in self.layers:
+            self.layers[name] = (GridIndex(), closed)
+        self.layers[name][0].set_points(vertices)
+
+    def remove_layer(self, name):
+        """
+        Quitar una capa editable.
+        """
+        self.layers.pop(name, None)
+
+    def pick(self, x, y, radius):
+        """
+        Encontrar el vértice más cercano a (x, y) entre todas las capas.
+
+        Parámetros:
+        - x, y: Posición en coordenadas de los datos.
+        - radius: Distancia máxima en coordenadas de los datos.
+
+        Retorna:
+        - Tupla (capa, índice del vértice), o None si no hay vértices cerca.
+        """
+        best = None
+        for name, (index, _) in self.layers.items():
+            found = index.nearest((x, y), radius)
+            if found is not None and (best is None or found[1] < best[2]):
+                best = (name, found[0], found[1])
+        return None if best is None else best[:2]
+
+    def _radius(self):
+        """
+        Convertir la tolerancia en píxeles a coordenadas de los datos.
+        """
+        inverse = self.renderer.ax.transData.inverted()
+        (x0, y0), (x1, y1) = inverse.transform([(0, 0), (self.tolerance, self.tolerance)])
+        return max(abs(x1 - x0), abs(y1 - y0))
+
+    def _neighbors(self, name, vertex):
+        """
+        Puntos a dibujar mientras se arrastra: el vértice y, en figuras cerradas, sus vecinos.
+        """
+        index, closed = self.layers[name]
+        points = index.points
+        if not closed or len(points) < 2:
+            return points[vertex:vertex + 1]
+        return points[[vertex - 1, vertex, (vertex + 1) % len(points)]]
+
+    def _on_press(self, event):
+        if event.inaxes is not self.renderer.ax or event.xdata is None:
+            return
+        hit = self.pick(event.xdata, event.ydata, self._radius())
+        if hit is None:
+            return
+
+        name, vertex = hit
+        if event.button == RIGHT_BUTTON:
+            self.on_change(name, self.layers[name][0].remove(vertex))
+        elif event.button == LEFT_BUTTON:
+            self.dragging = hit
+            points = self._neighbors(name, vertex)
+            self.preview = self.renderer.ax.plot(points[:, 0], points[:, 1], color="red", marker="o", linestyle=":")[0]
+            self.renderer.fig.canvas.draw_idle()
+
+    def _on_motion(self, event):
+        if self.dragging is None or event.inaxes is not self.renderer.ax or event.xdata is None:
+            return
+        name, vertex = self.dragging
+        self.layers[name][0].move(vertex, (event.xdata, event.ydata))  # Actualización incremental del índice
+        points = self._neighbors(name, vertex)
+        self.preview.set_data(points[:, 0], points[:, 1])
+        self.renderer.fig.canvas.draw_idle()
+
+    def _on_release(self, event):
+        if self.dragging is None:
+            return
+        name, _ = self.dragging
+        self.dragging = None
+        self.preview.remove()
+        self.preview = None
+        self.renderer.fig.canvas.draw_idle()
+        # La copia entregada queda registrada en el índice: al redibujarla no se reconstruye
+        self.on_change(name, self.layers[name][0].snapshot())
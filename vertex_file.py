@@ -0,0 +1,134 @@
+# Importar las bibliotecas necesarias
+import json  # Para guardar los metadatos de transformación
+import struct  # Para leer y escribir el encabezado binario
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import precision  # Precisión de los vértices (float64 o float32)
+
+# Formato binario de vértices (.vtx):
+# - Encabezado fijo: firma, tipo de dato, número de puntos y longitud de los metadatos.
+# - Metadatos en JSON (UTF-8), por ejemplo {"rotation": {"angle": 45}}.
+# - Relleno hasta un múltiplo de ALIGNMENT y después las coordenadas x, y contiguas en little-endian.
+EXTENSION = ".vtx"
+MAGIC = b"VTX2D\x00\x00\x01"
+HEADER = struct.Struct("<8sB7xQQ")
+ALIGNMENT = 64
+
+# Tipos de dato admitidos y su código en el encabezado
+DTYPES = {0: np.dtype("<f8"), 1: np.dtype("<f4")}
+DTYPE_CODES = {dtype: code for code, dtype in DTYPES.items()}
+
+
+def is_vertex_file(filename):
+    """
+    Comprueba si un archivo está en el formato binario de vértices.
+
+    Parámetros:
+    - filename: Ruta del archivo.
+
+    Retorna:
+    - True si el archivo comienza con la firma del formato.
+    """
+    try:
+        with open(filename, "rb") as file:
+            return file.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _data_offset(metadata_length):
+    """
+    Calcula la posición alineada donde comienzan las coordenadas.
+    """
+    size = HEADER.size + metadata_length
+    return (size + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def create_vertices(filename, count, metadata=None, dtype=None):
+    """
+    Crea un archivo de vértices y lo devuelve mapeado en memoria para escribirlo por partes.
+
+    Parámetros:
+    - filename: Ruta del archivo.
+    - count: Número de puntos.
+    - metadata: Diccionario de metadatos (por ejemplo, la configuración de transformaciones).
+    - dtype: np.float64 o np.float32 (por defecto, la precisión del proyecto).
+
+    Retorna:
+    - Arreglo np.memmap (count, 2) con permisos de escritura.
+    """
+    dtype = np.dtype(dtype or precision.get_dtype()).newbyteorder("<")
+    if dtype not in DTYPE_CODES:
+        raise ValueError(f"Tipo de dato no admitido: {dtype}")
+
+    meta = json.dumps(metadata or {}).encode("utf-8")
+    offset = _data_offset(len(meta))
+    with open(filename, "wb") as file:
+        file.write(HEADER.pack(MAGIC, DTYPE_CODES[dtype], count, len(meta)))
+        file.write(meta)
+        file.write(b"\x00" * (offset - HEADER.size - len(meta)))
+        file.truncate(offset + count * 2 * dtype.itemsize)
+
+    if not count:
+        return np.empty((0, 2), dtype=dtype)
+    return np.memmap(filename, dtype=dtype, mode="r+", offset=offset, shape=(count, 2))
+
+
+def save_vertices(filename, vertices, metadata=None, dtype=None):
+    """
+    Guarda un arreglo de vértices en el formato binario.
+
+    Parámetros:
+    - filename: Ruta del archivo.
+    - vertices: Arreglo (N, 2) de vértices.
+    - metadata: Diccionario de metadatos (por ejemplo, la configuración de transformaciones).
+    - dtype: np.float64 o np.float32 (por defecto, la precisión del proyecto).
+    """
+    vertices = np.asarray(vertices).reshape(-1, 2)
+    output = create_vertices(filename, len(vertices), metadata, dtype)
+    output[:] = vertices
+    if isinstance(output, np.memmap):
+        output.flush()
+
+
+def read_header(filename):
+    """
+    Lee el encabezado y los metadatos de un archivo de vértices.
+
+    Parámetros:
+    - filename: Ruta del archivo.
+
+    Retorna:
+    - count: Número de puntos.
+    - dtype: Tipo de dato de las coordenadas.
+    - metadata: Diccionario de metadatos.
+    - offset: Posición donde comienzan las coordenadas.
+    """
+    with open(filename, "rb") as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError("El archivo de vértices está incompleto.")
+        magic, code, count, metadata_length = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError("El archivo no tiene el formato binario de vértices.")
+        if code not in DTYPES:
+            raise ValueError(f"Tipo de dato desconocido en el archivo: {code}")
+        metadata = json.loads(file.read(metadata_length).decode("utf-8"))
+    return count, DTYPES[code], metadata, _data_offset(metadata_length)
+
+
+def open_vertices(filename, mode="r"):
+    """
+    Abre un archivo de vértices mapeándolo en memoria (no se leen las coordenadas).
+
+    Parámetros:
+    - filename: Ruta del archivo.
+    - mode: Modo de np.memmap ("r", "r+" o "c").
+
+    Retorna:
+    - vertices: Arreglo np.memmap (N, 2).
+    - metadata: Diccionario de metadatos.
+    """
+    count, dtype, metadata, offset = read_header(filename)
+    if not count:
+        return np.empty((0, 2), dtype=dtype), metadata
+    return np.memmap(filename, dtype=dtype, mode=mode, offset=offset, shape=(count, 2)), metadata
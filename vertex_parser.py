@@ -0,0 +1,159 @@
+# Importar las bibliotecas necesarias
+import re  # Para ubicar el valor inválido cuando la lectura rápida falla
+import numpy as np  # Biblioteca para cálculos matemáticos y manejo de arreglos
+import precision  # Precisión de los vértices (float64 o float32)
+
+# Sintaxis: "x,y;x,y;..."; en archivos de texto o CSV también se acepta un par por línea.
+# Las coordenadas se separan con "," y los vértices con ";" o con saltos de línea.
+
+# Extensiones de los archivos de texto con vértices
+TEXT_EXTENSIONS = (".txt", ".csv")
+
+# Tamaño del bloque leído de los archivos de texto en cada paso (caracteres)
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+# Tabla para convertir todos los separadores en espacios antes de separar los números
+SEPARATORS = str.maketrans(",;\n\r", "    ")
+
+# Códigos de los separadores de coordenadas y de vértices
+COMMA, SEMICOLON, NEWLINE = ord(","), ord(";"), ord("\n")
+
+# Vértices (grupos "x,y" no vacíos) para ubicar errores
+GROUP = re.compile(r"[^;\n]+")
+
+
+class VertexParseError(ValueError):
+    """
+    Error de lectura de vértices que indica el valor y la posición exacta del problema.
+    """
+
+    def __init__(self, message, position, token):
+        """
+        Inicializa el error.
+
+        Parámetros:
+        - message: Descripción del problema.
+        - position: Posición (en caracteres, desde 0) del valor inválido.
+        - token: Texto del valor inválido.
+        """
+        super().__init__(f"{message} en la posición {position}: {token!r}")
+        self.position = position
+        self.token = token
+
+
+def _well_formed(text):
+    """
+    Verifica que los separadores alternen "," y ";" (un solo "," por vértice).
+    """
+    codes = np.frombuffer(text.encode(), dtype=np.uint8)
+    pairs = (codes == SEMICOLON) | (codes == NEWLINE)
+    kinds = pairs[pairs | (codes == COMMA)]  # True = separador de vértices, False = ","
+    # Separadores de vértices repetidos (líneas vacías, ";" al final) cuentan como uno solo
+    repeated = kinds & np.concatenate([[True], kinds[:-1]])
+    kinds = kinds[~repeated]
+    if len(kinds) and kinds[-1]:
+        kinds = kinds[:-1]
+    return not kinds[0::2].any() and kinds[1::2].all()
+
+
+def _raise_error(text, offset):
+    """
+    Recorre el texto vértice por vértice para ubicar y reportar el primer valor inválido.
+    """
+    for group in GROUP.finditer(text):
+        if not group.group().strip():
+            continue
+        tokens = group.group().split(",")
+        if len(tokens) != 2:
+            raise VertexParseError(
+                f"Se esperaban 2 coordenadas y se encontraron {len(tokens)}",
+                offset + group.start() + len(group.group()) - len(group.group().lstrip()),
+                group.group().strip(),
+            )
+        position = group.start()
+        for token in tokens:
+            try:
+                float(token)
+            except ValueError:
+                stripped = token.lstrip()
+                raise VertexParseError("Valor inválido", offset + position + len(token) - len(stripped), stripped.rstrip())
+            position += len(token) + 1
+    raise VertexParseError("Vértices mal formados", offset, text[:20])
+
+
+def parse_vertices(text, offset=0):
+    """
+    Convierte una cadena "x,y;x,y;..." en un arreglo de vértices en una sola pasada.
+
+    Parámetros:
+    - text: Cadena con los vértices.
+    - offset: Posición del texto dentro de la entrada completa (para reportar errores).
+
+    Retorna:
+    - Arreglo (N, 2) con la precisión del proyecto.
+
+    Lanza:
+    - VertexParseError (subclase de ValueError) con la posición del primer valor inválido.
+    """
+    if not text.strip():
+        return np.empty((0, 2), dtype=precision.get_dtype())
+    try:
+        values = np.fromstring(text.translate(SEPARATORS), dtype=precision.get_dtype(), sep=" ")
+    except ValueError:
+        _raise_error(text, offset)
+    if len(values) != 2 * text.count(",") or not _well_formed(text):
+        _raise_error(text, offset)
+    return values.reshape(-1, 2)
+
+
+def read_vertices(filename, block_size=DEFAULT_BLOCK_SIZE, skip_lines=0):
+    """
+    Lee vértices de un archivo de texto o CSV por bloques.
+
+    Parámetros:
+    - filename: Ruta del archivo.
+    - block_size: Caracteres leídos en cada bloque.
+    - skip_lines: Líneas iniciales a ignorar (por ejemplo, el encabezado de un CSV).
+
+    Retorna:
+    - Arreglo (N, 2) con la precisión del proyecto.
+
+    Lanza:
+    - VertexParseError con la posición (en caracteres desde el inicio del archivo) del error.
+    """
+    chunks = []
+    with open(filename) as file:
+        offset = sum(len(file.readline()) for _ in range(skip_lines))
+        rest = ""
+        while True:
+            block = file.read(block_size)
+            text = rest + block
+            # Solo se interpreta hasta el último separador de vértices; el resto pasa al siguiente bloque
+            cut = max(text.rfind(";"), text.rfind("\n")) + 1 if block else len(text)
+            if cut:
+                chunks.append(parse_vertices(text[:cut], offset))
+                offset += cut
+            rest = text[cut:]
+            if not block:
+                break
+    return np.concatenate(chunks) if chunks else np.empty((0, 2), dtype=precision.get_dtype())
+
+
+def is_text_file(filename):
+    """
+    Indica si un archivo se lee con este módulo (extensión .txt o .csv).
+    """
+    return filename.lower().endswith(TEXT_EXTENSIONS)
+
+
+def has_header(filename):
+    """
+    Indica si la primera línea del archivo es un encabezado (no se puede leer como vértices).
+    """
+    with open(filename) as file:
+        line = file.readline()
+    try:
+        parse_vertices(line)
+        return False
+    except VertexParseError:
+        return True